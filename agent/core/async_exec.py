@@ -0,0 +1,52 @@
+# agent/core/async_exec.py
+
+import asyncio
+import threading
+
+from agent.core.process import run_text_async
+
+
+async def exec_async(cmd, cwd=None, error_tag="exec-error", missing=None, timeout=None):
+    """
+    Non-blocking equivalent of the tools' _exec helper.
+
+    Same contract as the sync version:
+      - stdout+stderr decoded and stripped on success
+      - "[<error_tag>] <output>" on non-zero exit or timeout
+      - missing-binary message if the CLI is not installed
+
+    Runs through the shared ProcessRunner (concurrency limits, timeouts,
+    output cap). The child process is killed if the awaiting task is
+    cancelled (e.g. a fan-out timeout), so no orphaned kubectl/helm survives.
+    """
+    return await run_text_async(cmd, cwd=cwd, error_tag=error_tag, missing=missing, timeout=timeout)
+
+
+def run_sync(coro):
+    """
+    Drive a coroutine to completion from synchronous code.
+
+    Works both from plain threads (asyncio.run) and from inside an
+    already-running event loop (runs on a helper thread with its own loop),
+    so the sync API stays a thin wrapper over the async one everywhere.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    box = {}
+
+    def runner():
+        try:
+            box["result"] = asyncio.run(coro)
+        except BaseException as e:
+            box["error"] = e
+
+    t = threading.Thread(target=runner, name="run-sync")
+    t.start()
+    t.join()
+
+    if "error" in box:
+        raise box["error"]
+    return box["result"]
@@ -0,0 +1,325 @@
+# agent/core/cache.py
+
+import os
+import re
+import time
+import asyncio
+import inspect
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from agent.core.tracing import annotate
+
+
+# set on a single-flight future whose leader was cancelled: waiters run fn themselves
+_RETRY = object()
+
+# "[tool-error] ...", "[ollama-error:500] ...", "[helm-missing]", also with
+# details: "[local-disabled, backend=ollama] ...". The suffix is required,
+# so a rendered report that starts with a "[pods]" section is not an error.
+_ERROR_TAG = re.compile(
+    r"^\[(?:unknown-[\w.-]+|[\w.-]*-(?:error|missing|timeout|disabled|not-installed|failed|blocked))"
+    r"(?::[\w.-]*)?(?:,[^\]\n]*)?\]"
+)
+
+
+# Executor / Router failures: "❌ Workflow not implemented", "💥 Execution error", ...
+_FAILURE_MARKS = ("❌", "💥", "❓", "⏭️")
+
+
+def is_error_result(result) -> bool:
+    """
+    Tools report failures as "[tool-error] ..." strings, the Executor as
+    "❌ ..." / "💥 ..." messages. Those are never cached, and the Executor
+    treats them as failed steps (same check, see is_failed_result).
+    """
+    return isinstance(result, str) and (result.startswith(_FAILURE_MARKS) or bool(_ERROR_TAG.match(result)))
+
+
+def _size_of(value) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", "ignore"))
+    return len(repr(value))
+
+
+class ResponseCache:
+    """
+    In-process cache for read-only tool calls.
+
+    Keyed on tool + method + arguments ("alertmanager.list_alerts:()").
+
+    Supports:
+      - per-entry TTL (set per method by @cached)
+      - LRU eviction bounded by total bytes
+      - single-flight: concurrent identical calls share one upstream call
+      - prefix invalidation for mutating calls (@invalidates)
+      - hit / miss / shared / eviction stats
+
+    Cached values are shared between callers; treat them as read-only.
+
+    Config (env):
+        AGENT_CACHE_ENABLED     0 to bypass                 (default 1)
+        AGENT_CACHE_MAX_BYTES   memory bound                (default 32 MiB)
+        AGENT_CACHE_TTL         default TTL, sec            (default 30)
+    """
+
+    def __init__(self, max_bytes: int = None, default_ttl: float = None):
+        self.max_bytes = max_bytes or int(os.getenv("AGENT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+        self.default_ttl = default_ttl or float(os.getenv("AGENT_CACHE_TTL", "30"))
+
+        self._entries = OrderedDict()   # key → (expires, size, value)
+        self._inflight = {}             # key → Future
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.counters = {
+            "hits": 0,
+            "misses": 0,
+            "shared": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidated": 0,
+        }
+
+    # ---- LOOKUP ----
+
+    def _lookup(self, key):
+        """
+        Returns (hit, value, future, leader). Caller must hold the lock.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return True, entry[2], None, False
+            self._drop(key)
+            self.counters["expired"] += 1
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.counters["shared"] += 1
+            return False, None, future, False
+
+        self.counters["misses"] += 1
+        future = Future()
+        self._inflight[key] = future
+        return False, None, future, True
+
+    def get_or_call(self, key: str, fn, ttl: float = None):
+        with self._lock:
+            hit, value, future, leader = self._lookup(key)
+        annotate(cache="hit" if hit else "miss" if leader else "shared")
+        if hit:
+            return value
+        if not leader:
+            value = future.result()
+            return self.get_or_call(key, fn, ttl) if value is _RETRY else value
+
+        try:
+            value = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, value=value, ttl=ttl)
+        return value
+
+    async def get_or_call_async(self, key: str, fn, ttl: float = None):
+        """
+        fn: zero-arg callable returning an awaitable.
+        Shares in-flight calls with the sync path.
+
+        If the leader is cancelled, its waiters are not: the first of
+        them re-runs fn and the rest share that call.
+        """
+        with self._lock:
+            hit, value, future, leader = self._lookup(key)
+        annotate(cache="hit" if hit else "miss" if leader else "shared")
+        if hit:
+            return value
+        if not leader:
+            value = await asyncio.wrap_future(future)
+            return await self.get_or_call_async(key, fn, ttl) if value is _RETRY else value
+
+        try:
+            value = await fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, value=value, ttl=ttl)
+        return value
+
+    def _finish(self, key, future, value=None, error=None, ttl=None):
+        with self._lock:
+            self._inflight.pop(key, None)
+            if error is None and not is_error_result(value):
+                self._store(key, value, ttl)
+
+        if isinstance(error, Exception):
+            future.set_exception(error)
+        elif error is not None:
+            # CancelledError / KeyboardInterrupt belong to the leader only
+            future.set_result(_RETRY)
+        else:
+            future.set_result(value)
+
+    # ---- STORE / EVICT ----
+
+    def _store(self, key, value, ttl):
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return
+
+        self._drop(key)
+        expires = time.monotonic() + (ttl or self.default_ttl)
+        self._entries[key] = (expires, size, value)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.counters["evictions"] += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    # ---- INVALIDATION ----
+
+    def invalidate(self, prefix: str = "") -> int:
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                self._drop(k)
+            self.counters["invalidated"] += len(keys)
+        return len(keys)
+
+    def clear(self):
+        self.invalidate("")
+
+    # ---- STATS ----
+
+    def stats(self):
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"] + self.counters["shared"]
+            return {
+                **self.counters,
+                "hit_rate": round(self.counters["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "inflight": len(self._inflight),
+            }
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Process-wide response cache shared by all tools.
+    """
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = ResponseCache()
+    return _CACHE
+
+
+def _enabled():
+    return os.getenv("AGENT_CACHE_ENABLED", "1") not in ("0", "false", "no")
+
+
+def cache_key(scope: str, method: str, args, kwargs) -> str:
+    return f"{scope}.{method}:{args!r}:{sorted(kwargs.items())!r}"
+
+
+def _scope(scope: str, tool) -> str:
+    # tools bound to a kube context cache per context;
+    # "kubectl.rollout@prod.history:..." still falls under invalidate("kubectl")
+    context = getattr(tool, "context", None)
+    return f"{scope}@{context}" if isinstance(context, str) else scope
+
+
+# ---- DECORATORS ----
+
+def cached(scope: str, ttl: float = None, name: str = None):
+    """
+    Opt a read-only tool method into the response cache.
+
+        @cached("alertmanager", ttl=15)
+        def list_alerts(self): ...
+
+        @cached("alertmanager", ttl=15, name="list_alerts")
+        async def list_alerts_async(self): ...   # shares the sync key
+
+    Error strings ("[tool-error] ...") are returned but not cached.
+    Tools with a string `context` (kube context) get one entry per context.
+    """
+    def decorator(fn):
+        method = name or fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                if not _enabled():
+                    return await fn(self, *args, **kwargs)
+                key = cache_key(_scope(scope, self), method, args, kwargs)
+                return await get_response_cache().get_or_call_async(
+                    key, lambda: fn(self, *args, **kwargs), ttl
+                )
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled():
+                return fn(self, *args, **kwargs)
+            key = cache_key(_scope(scope, self), method, args, kwargs)
+            return get_response_cache().get_or_call(
+                key, lambda: fn(self, *args, **kwargs), ttl
+            )
+        return wrapper
+    return decorator
+
+
+def invalidates(*scopes):
+    """
+    Mark a mutating tool method: after it runs, every cached entry
+    under the given scopes is dropped.
+
+        @invalidates("kubectl")
+        def scale(self, deployment, replicas, namespace=None): ...
+
+    Works on async methods too; the entries are dropped once the
+    coroutine finishes (or is cancelled), not when it is created.
+    """
+    def invalidate():
+        cache = get_response_cache()
+        for scope in scopes:
+            cache.invalidate(scope)
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await fn(self, *args, **kwargs)
+                finally:
+                    invalidate()
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            finally:
+                invalidate()
+        return wrapper
+    return decorator
@@ -0,0 +1,182 @@
+# agent/core/container.py
+
+import time
+import importlib
+import threading
+from contextlib import contextmanager
+
+from agent.core.tracing import TracedTool, get_tracer
+
+
+# name → "module:Class" (imported and built on first use)
+DEFAULT_TOOLS = {
+    "aws": "agent.tools.aws_tool:AWSTool",
+    "cicd": "agent.tools.cicd_tool:CICDTool",
+    "clusters": "agent.tools.multi_cluster:MultiCluster",
+    "cost": "agent.tools.cost_tool:CostTool",
+    "docker": "agent.tools.docker_tool:DockerTool",
+    "git": "agent.tools.git_tool:GitTool",
+    "github": "agent.tools.github_tool:GitHubTool",
+    "gitlab": "agent.tools.gitlab_tool:GitLabTool",
+    "helm": "agent.tools.helm_tool:HelmTool",
+    "helper": "agent.tools.helper_tool:HelperTool",
+    "k8s": "agent.tools.kubernetes_tool:KubernetesTool",
+    "logging": "agent.tools.logging_tool:LoggingTool",
+    "monitor": "agent.tools.monitoring_tool:MonitoringTool",
+    "security": "agent.tools.security_tool:SecurityTool",
+    "tf": "agent.tools.terraform_tool:TerraformTool",
+}
+
+
+class ToolContainer:
+    """
+    Process-wide registry of tool instances.
+
+    Each tool is built lazily on first use and reused for the life of the
+    process, so per-query workflows stop paying for boto3 clients, SDK
+    setup, etc. on every request. Built tools are wrapped in a TracedTool
+    (one span per method call) unless AGENT_TRACING=0.
+
+    Supports:
+      - register(name, "module:Class" | factory callable)
+      - get(name)            build once, thread-safe
+      - override(name=obj)   temporary stand-ins (benchmarks, dry runs)
+      - stats()              construction cost + reuse count per tool
+    """
+
+    def __init__(self, registry: dict = None):
+        self._factories = dict(registry or DEFAULT_TOOLS)
+        self._instances = {}
+        self._build_ms = {}
+        self._uses = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    # ---- REGISTRY ----
+
+    def register(self, name: str, factory):
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def _factory(self, name):
+        factory = self._factories.get(name)
+        if factory is None:
+            raise KeyError(f"unknown tool: {name}")
+        if isinstance(factory, str):
+            module, _, attr = factory.partition(":")
+            factory = getattr(importlib.import_module(module), attr)
+        return factory
+
+    # ---- LOOKUP ----
+
+    def get(self, name: str):
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._build(name)
+        self._uses[name] = self._uses.get(name, 0) + 1
+        return instance
+
+    def _build(self, name):
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+
+        # per-tool lock: a slow AWSTool build does not block other tools
+        with lock:
+            instance = self._instances.get(name)
+            if instance is not None:
+                return instance
+
+            start = time.perf_counter()
+            instance = self._factory(name)()
+            self._build_ms[name] = round((time.perf_counter() - start) * 1000, 2)
+            if get_tracer().enabled:
+                instance = TracedTool(name, instance)
+            self._instances[name] = instance
+            return instance
+
+    # ---- OVERRIDES ----
+
+    @contextmanager
+    def override(self, **tools):
+        """
+        with get_container().override(k8s=FakeKubernetesTool()):
+            ...
+        """
+        with self._lock:
+            saved = {name: self._instances.get(name) for name in tools}
+            self._instances.update(tools)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                for name, previous in saved.items():
+                    if previous is None:
+                        self._instances.pop(name, None)
+                    else:
+                        self._instances[name] = previous
+
+    def reset(self, name: str = None):
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    # ---- STATS ----
+
+    def stats(self):
+        return {
+            name: {
+                "built": name in self._instances,
+                "build_ms": self._build_ms.get(name),
+                "uses": self._uses.get(name, 0),
+            }
+            for name in sorted(self._factories)
+        }
+
+
+class ToolRef:
+    """
+    Class-level attribute that resolves a tool from the shared container.
+
+        class DeployWorkflow:
+            k8s = ToolRef("k8s")
+            aws = ToolRef("aws")   # AWSTool only built if a cloud deploy runs
+
+    Assigning on an instance (wf.k8s = fake) overrides it for that
+    instance only.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attr):
+        self.attr = f"_tool_{attr}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        injected = obj.__dict__.get(self.attr)
+        if injected is not None:
+            return injected
+        return get_container().get(self.name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+
+
+_CONTAINER = None
+_CONTAINER_LOCK = threading.Lock()
+
+
+def get_container() -> ToolContainer:
+    """
+    Shared container for the life of the process.
+    """
+    global _CONTAINER
+    if _CONTAINER is None:
+        with _CONTAINER_LOCK:
+            if _CONTAINER is None:
+                _CONTAINER = ToolContainer()
+    return _CONTAINER
@@ -1,37 +1,70 @@
 # agent/core/executor.py
 
-from agent.workflows.deploy import DeployWorkflow
-from agent.workflows.rollback import RollbackWorkflow
-from agent.workflows.debug import DebugWorkflow
-from agent.workflows.scale import ScaleWorkflow
-from agent.workflows.logs import LogsWorkflow
-from agent.workflows.cost_analysis import CostWorkflow
-from agent.workflows.pipeline_debug import PipelineDebugWorkflow
-from agent.workflows.cluster_health import ClusterHealthWorkflow
+import os
+import asyncio
+import importlib
+
+from agent.core.async_exec import run_sync
+from agent.core.cache import is_error_result
+from agent.core.fanout import FanOut
+from agent.core.logger import get_logger
+from agent.core.tracing import span
+from agent.llm.streaming import TokenStream
+
+
+# workflow name → "module:Class", imported on first use so startup does
+# not pull in every workflow's tools and SDKs
+WORKFLOWS = {
+    "deploy": "agent.workflows.deploy:DeployWorkflow",
+    "rollback": "agent.workflows.rollback:RollbackWorkflow",
+    "debug": "agent.workflows.debug:DebugWorkflow",
+    "scale": "agent.workflows.scale:ScaleWorkflow",
+    "cost_analysis": "agent.workflows.cost_analysis:CostAnalysisWorkflow",
+    "pipeline_debug": "agent.workflows.pipeline_debug:PipelineDebugWorkflow",
+    "cluster_health": "agent.workflows.cluster_health:ClusterHealthWorkflow",
+}
 
 
 class Executor:
     """
     Executor is the action engine.
     It receives a plan from the Planner and executes the associated workflow.
+
+    run_async() is the primary path; run() is a thin sync wrapper over it.
+
+    Options:
+      explain  hand the model to workflows so they summarize results
+               (AGENT_LLM_EXPLAIN=1)
+      stream   workflows return a TokenStream from their LLM summary so
+               callers can render it progressively
+
+    MULTI plans (see Planner) run in waves: every step whose dependencies
+    are done runs concurrently, so independent steps take as long as the
+    slowest one. A step whose dependency failed is skipped. Results are
+    merged in step order.
+
+    Config (env):
+        AGENT_STEP_TIMEOUT   per-step limit for MULTI plans, sec (default 300)
     """
 
-    def __init__(self, model):
+    def __init__(self, model, explain: bool = None, stream: bool = False):
         self.model = model
+        if explain is None:
+            explain = os.getenv("AGENT_LLM_EXPLAIN", "0") in ("1", "true", "yes")
+        self.explain = explain
+        self.stream = stream
+        self.step_timeout = float(os.getenv("AGENT_STEP_TIMEOUT", "300"))
 
-        # workflow lookup table
-        self.workflows = {
-            "deploy": DeployWorkflow,
-            "rollback": RollbackWorkflow,
-            "debug": DebugWorkflow,
-            "scale": ScaleWorkflow,
-            "logs": LogsWorkflow,
-            "cost_analysis": CostWorkflow,
-            "pipeline_debug": PipelineDebugWorkflow,
-            "cluster_health": ClusterHealthWorkflow,
-        }
+        # workflow lookup table (lazy, see WORKFLOWS)
+        self.workflows = dict(WORKFLOWS)
 
     def run(self, plan: dict):
+        return run_sync(self.run_async(plan))
+
+    async def run_async(self, plan: dict):
+        if plan.get("steps"):
+            return await self._run_steps(plan["steps"])
+
         workflow_name = plan.get("workflow")
         intent = plan.get("intent")
 
@@ -39,15 +72,104 @@ class Executor:
         if workflow_name is None or workflow_name == "unknown":
             return f"❓ Unknown intent: {intent}"
 
-        workflow_cls = self.workflows.get(workflow_name)
+        try:
+            # inside the try: a workflow module that exists but fails to
+            # import is logged and reported as an execution error
+            workflow_cls = self._resolve(workflow_name)
+            if workflow_cls is None:
+                return f"❌ Workflow not implemented: {workflow_name}"
 
-        if workflow_cls is None:
-            return f"❌ Workflow not implemented: {workflow_name}"
+            workflow = workflow_cls(llm=self.model) if self.explain else workflow_cls()
+            workflow.stream = self.stream
 
-        try:
-            workflow = workflow_cls()
-            result = workflow.run(plan)
+            with span(workflow_name, "workflow") as s:
+                # workflows without a native async path run on a worker thread
+                if hasattr(workflow, "run_async"):
+                    result = await workflow.run_async(plan)
+                else:
+                    result = await asyncio.to_thread(workflow.run, plan)
+                if s is not None and isinstance(result, str) and is_failed_result(result):
+                    s.set(error=result[:60])
             return result
         except Exception as e:
+            get_logger().error("workflow.error", workflow=workflow_name, error=str(e), type=type(e).__name__)
             return f"💥 Execution error: {str(e)}"
 
+    # ---- MULTI PLANS ----
+
+    async def _run_steps(self, steps):
+        fanout = FanOut(timeout=self.step_timeout, deadline=self.step_timeout)
+        results = {}
+        pending = list(steps)
+
+        while pending:
+            ready = [s for s in pending if all(d in results for d in s.get("depends_on", []))]
+            if not ready:
+                # unresolvable dependencies: run what is left
+                ready = pending
+
+            calls = {}
+            for step in ready:
+                failed = [d for d in step.get("depends_on", []) if is_failed_result(results.get(d))]
+                if failed:
+                    results[step["id"]] = f"⏭️ Skipped: step {failed[0]} did not succeed."
+                else:
+                    calls[step["id"]] = self.run_async(step)
+
+            if calls:
+                results.update(await fanout.run_async(calls))
+            pending = [s for s in pending if s["id"] not in results]
+
+        return merge_results(steps, results)
+
+    def _resolve(self, workflow_name):
+        """
+        Imports the workflow class on first use and caches it.
+        None only when the workflow's own module does not exist; a module
+        that fails to import (bad dependency, typo) raises, so the error
+        is logged and only fails its own query.
+        """
+        target = self.workflows.get(workflow_name)
+        if not isinstance(target, str):
+            return target
+
+        module, _, attr = target.partition(":")
+        try:
+            workflow_cls = getattr(importlib.import_module(module), attr)
+        except ModuleNotFoundError as e:
+            if e.name != module:
+                raise
+            return None
+
+        self.workflows[workflow_name] = workflow_cls
+        return workflow_cls
+
+
+def is_failed_result(result):
+    """
+    "❌ ...", "💥 ...", "[kubectl-error] ...", "[fanout-timeout] ..." — the
+    same check the caches use, so a result is never a success in one
+    place and an error in the other.
+    """
+    return is_error_result(result)
+
+
+def merge_results(steps, results):
+    """
+    One report for a MULTI plan: a header per step, in step order.
+    If any step streams its LLM summary, the merged result streams too.
+    """
+    sections = [(f"▶ [{s['id']}] {s['raw']}", results.get(s["id"])) for s in steps]
+
+    if not any(isinstance(r, TokenStream) for _, r in sections):
+        return "\n\n".join(f"{header}\n{result}" for header, result in sections)
+
+    def chunks():
+        for i, (header, result) in enumerate(sections):
+            yield ("\n\n" if i else "") + header + "\n"
+            if isinstance(result, TokenStream):
+                yield from result
+            else:
+                yield str(result)
+
+    return TokenStream(chunks())
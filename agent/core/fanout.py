@@ -0,0 +1,158 @@
+# agent/core/fanout.py
+
+import os
+import time
+import asyncio
+import inspect
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _shared_pool():
+    """
+    One process-wide worker pool for all fan-outs.
+    Workers are reused across queries instead of being spawned per workflow.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                workers = int(os.getenv("AGENT_FANOUT_WORKERS", "16"))
+                _POOL = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="fanout"
+                )
+    return _POOL
+
+
+class FanOutResult(dict):
+    """
+    Ordered mapping of signal label → result.
+
+    Labels that did not finish in time or raised are still present,
+    holding a "[fanout-timeout]" / "[fanout-error]" string, so callers
+    can always render a (partial) report.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timed_out = []
+        self.failed = []
+        self.elapsed = 0.0
+
+    @property
+    def partial(self):
+        return bool(self.timed_out or self.failed)
+
+
+class FanOut:
+    """
+    Runs independent tool calls concurrently.
+
+    Each call gets its own timeout, and the whole fan-out is bounded by a
+    deadline. Late or failed signals come back as partial results instead
+    of blocking the report.
+
+    Example:
+        fanout = FanOut(timeout=5, deadline=8)
+        results = fanout.run({
+            "pods": lambda: k8s.get_pods("prod"),
+            "alerts": (monitor.list_alerts, 2),   # per-call timeout override
+        })
+
+    Config (env):
+        AGENT_FANOUT_WORKERS   shared pool size        (default 16)
+        AGENT_FANOUT_TIMEOUT   per-call timeout, sec   (default 10)
+        AGENT_FANOUT_DEADLINE  whole fan-out, sec      (default 15)
+    """
+
+    def __init__(self, timeout: float = None, deadline: float = None):
+        self.timeout = timeout or float(os.getenv("AGENT_FANOUT_TIMEOUT", "10"))
+        self.deadline = deadline or float(os.getenv("AGENT_FANOUT_DEADLINE", "15"))
+
+    def _split(self, call):
+        return call if isinstance(call, tuple) else (call, self.timeout)
+
+    def run(self, calls: dict) -> FanOutResult:
+        """
+        calls: label → callable, or label → (callable, timeout)
+        """
+        pool = _shared_pool()
+        start = time.monotonic()
+
+        futures = {}
+        limits = {}
+        for label, call in calls.items():
+            fn, limit = self._split(call)
+            # carry the caller's context (current trace span) into the worker
+            futures[label] = pool.submit(contextvars.copy_context().run, fn)
+            limits[label] = limit
+
+        results = FanOutResult()
+
+        for label, future in futures.items():
+            elapsed = time.monotonic() - start
+            wait_for = max(0.0, min(limits[label], self.deadline) - elapsed)
+
+            try:
+                results[label] = future.result(timeout=wait_for)
+            except FutureTimeout:
+                # thread keeps running in the background; we just stop waiting
+                future.cancel()
+                results.timed_out.append(label)
+                results[label] = f"[fanout-timeout] {label} did not answer within {min(limits[label], self.deadline)}s"
+            except Exception as e:
+                results.failed.append(label)
+                results[label] = f"[fanout-error] {label}: {str(e)}"
+
+        results.elapsed = round(time.monotonic() - start, 3)
+        return results
+
+    async def run_async(self, calls: dict) -> FanOutResult:
+        """
+        Async fan-out.
+
+        calls: label → awaitable (e.g. tool.get_pods_async(ns)),
+               label → plain callable (run on a worker thread),
+               or label → (either of the above, timeout)
+
+        Timed-out tasks are cancelled, which also kills their subprocess.
+        """
+        start = time.monotonic()
+
+        tasks = {}
+        limits = {}
+        for label, call in calls.items():
+            target, limit = self._split(call)
+            if inspect.isawaitable(target):
+                tasks[label] = asyncio.ensure_future(target)
+            else:
+                tasks[label] = asyncio.ensure_future(asyncio.to_thread(target))
+            limits[label] = limit
+
+        results = FanOutResult()
+
+        for label, task in tasks.items():
+            elapsed = time.monotonic() - start
+            wait_for = max(0.0, min(limits[label], self.deadline) - elapsed)
+
+            done, _ = await asyncio.wait({task}, timeout=wait_for)
+            if not done:
+                task.cancel()
+                results.timed_out.append(label)
+                results[label] = f"[fanout-timeout] {label} did not answer within {min(limits[label], self.deadline)}s"
+                continue
+
+            try:
+                results[label] = task.result()
+            except Exception as e:
+                results.failed.append(label)
+                results[label] = f"[fanout-error] {label}: {str(e)}"
+
+        results.elapsed = round(time.monotonic() - start, 3)
+        return results
@@ -0,0 +1,205 @@
+# agent/core/http_pool.py
+
+import os
+import asyncio
+import threading
+from urllib.parse import urlsplit
+
+from agent.core.tracing import get_tracer, url_template
+
+
+class PooledHTTPClient:
+    """
+    Process-wide HTTP transport shared by all REST tools and backends.
+
+    Replaces bare requests.get/post calls with one keep-alive session:
+      - connection pooling per host (TCP+TLS handshake paid once)
+      - per-host pool sizes
+      - default connect/read timeouts (no more hanging calls)
+      - gzip/deflate response compression
+      - connection reuse counters (per-host pools created / looked up)
+      - one "http" trace span per request (URL template, status, bytes)
+
+    Config (env):
+        AGENT_HTTP_POOL_MAXSIZE      default connections kept per host   (default 10)
+        AGENT_HTTP_POOL_SIZES        per-host override, e.g.
+                                     "api.github.com=20,localhost:9090=4"
+        AGENT_HTTP_CONNECT_TIMEOUT   seconds                              (default 3.05)
+        AGENT_HTTP_READ_TIMEOUT      seconds                              (default 30)
+
+    Tools get their client via get_http_client() instead of building their own.
+    `requests` is imported when the first request is made, not at startup.
+    """
+
+    def __init__(self, pool_maxsize: int = None, pool_sizes: dict = None, timeout=None):
+        self.pool_maxsize = pool_maxsize or int(os.getenv("AGENT_HTTP_POOL_MAXSIZE", "10"))
+        self.pool_sizes = pool_sizes if pool_sizes is not None else self._parse_sizes(
+            os.getenv("AGENT_HTTP_POOL_SIZES", "")
+        )
+        self.timeout = timeout or (
+            float(os.getenv("AGENT_HTTP_CONNECT_TIMEOUT", "3.05")),
+            float(os.getenv("AGENT_HTTP_READ_TIMEOUT", "30")),
+        )
+
+        self._session = None
+        self._adapters = {}
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "adapter_hits": 0, "adapter_misses": 0}
+
+    # ---- SESSION (lazy) ----
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+
+                    session = requests.Session()
+                    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+                    self._session = session
+        return self._session
+
+    # ---- CONFIG ----
+
+    def _parse_sizes(self, raw: str):
+        sizes = {}
+        for item in raw.split(","):
+            if "=" in item:
+                host, size = item.split("=", 1)
+                sizes[host.strip()] = int(size)
+        return sizes
+
+    # ---- POOL PER HOST ----
+
+    def _adapter_for(self, url: str):
+        parts = urlsplit(url)
+        prefix = f"{parts.scheme}://{parts.netloc}/"
+
+        session = self.session
+
+        with self._lock:
+            self._counters["requests"] += 1
+            adapter = self._adapters.get(prefix)
+            if adapter is not None:
+                self._counters["adapter_hits"] += 1
+                return adapter
+
+            self._counters["adapter_misses"] += 1
+            size = self.pool_sizes.get(parts.netloc) or self.pool_sizes.get(parts.hostname) or self.pool_maxsize
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            session.mount(prefix, adapter)
+            self._adapters[prefix] = adapter
+            return adapter
+
+    # ---- REQUESTS ----
+
+    def request(self, method: str, url: str, **kwargs):
+        self._adapter_for(url)
+        kwargs.setdefault("timeout", self.timeout)
+
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return self.session.request(method, url, **kwargs)
+
+        with tracer.span(f"{method} {url_template(url)}", "http") as s:
+            body = kwargs.get("data") or kwargs.get("json")
+            if body is not None:
+                s.set(bytes_out=len(body) if isinstance(body, (str, bytes)) else len(str(body)))
+            response = self.session.request(method, url, **kwargs)
+            s.set(status=response.status_code)
+            if not kwargs.get("stream"):
+                s.set(bytes_in=len(response.content))
+            return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    # ---- ASYNC ----
+
+    async def arequest(self, method: str, url: str, **kwargs):
+        """
+        Awaitable request on the same pooled session.
+        Blocking I/O runs on the default executor, so keep-alive
+        connections and pool counters are shared with the sync path.
+        """
+        return await asyncio.to_thread(self.request, method, url, **kwargs)
+
+    async def aget(self, url: str, **kwargs):
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs):
+        return await self.arequest("POST", url, **kwargs)
+
+    # ---- STATS ----
+
+    def stats(self) -> dict:
+        """
+        adapter_hits    requests whose host already had a pool (not connection reuse)
+        adapter_misses  requests that had to create the pool (first call per host)
+        connections     TCP(+TLS) connections actually opened
+        reuses          requests served on an already-open keep-alive connection
+        """
+        hosts = {}
+        connections = 0
+        served = 0
+
+        with self._lock:
+            counters = dict(self._counters)
+            adapters = dict(self._adapters)
+
+        for prefix, adapter in adapters.items():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                served += pool.num_requests
+                hosts[prefix] = {
+                    "maxsize": pool.pool.maxsize if pool.pool else adapter._pool_maxsize,
+                    "idle": sum(1 for c in list(pool.pool.queue) if c is not None) if pool.pool else 0,
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+
+        counters.update({
+            "connections": connections,
+            "reuses": max(0, served - connections),
+            "hosts": hosts,
+        })
+        return counters
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """
+    Shared client for the life of the process.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = PooledHTTPClient()
+    return _CLIENT
@@ -0,0 +1,326 @@
+# agent/core/logger.py
+
+import os
+import json
+import time
+import atexit
+import threading
+from collections import deque
+
+from agent.core.tracing import current_span
+
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+_NAMES = {v: k for k, v in LEVELS.items()}
+
+# stream → file under the log dir; ERROR records also go to error.log
+STREAMS = {"agent": "agent.log", "tool": "tool.log", "error": "error.log"}
+
+
+class RotatingFile:
+    """
+    Append-only file rotated by size: agent.log → agent.log.1 → ... → .N
+    """
+
+    def __init__(self, path, max_bytes, backups):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rotations = 0
+        self._open()
+
+    def _open(self):
+        self.file = open(self.path, "ab")
+        self.size = self.file.tell()
+
+    def write_lines(self, lines):
+        """
+        Writes encoded lines, rotating between lines when the file is full.
+        """
+        if not self.max_bytes:
+            self.file.write(b"".join(lines))
+            return
+
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            self.size += len(line)
+            if self.size >= self.max_bytes:
+                self.file.write(b"".join(chunk))
+                chunk = []
+                self.rotate()
+        if chunk:
+            self.file.write(b"".join(chunk))
+
+    def rotate(self):
+        self.file.close()
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.truncate(self.path, 0)
+        self.rotations += 1
+        self._open()
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class AgentLogger:
+    """
+    Structured JSON logger that stays off the request path.
+
+    A log call only checks the level, samples debug events and appends a
+    tuple to an in-memory queue (no formatting, no I/O, no lock). A
+    background writer thread drains the queue in batches, encodes one JSON
+    object per line and writes each file once per batch.
+
+    Supports:
+      - debug / info / warning / error(event, stream="agent", **fields)
+      - streams: agent → agent.log, tool → tool.log; errors also → error.log
+      - trace correlation: records made inside a span carry its trace id
+      - size rotation with N backups per file
+      - debug sampling: 1 in AGENT_LOG_DEBUG_SAMPLE per event name
+      - long string fields truncated at write time (tool outputs)
+      - flush(), close() (at exit), stats()
+
+    When the queue is full, new records are dropped and counted rather
+    than blocking the caller.
+
+    Config (env):
+        AGENT_LOGGING            0 disables logging                 (default 1)
+        AGENT_LOG_DIR            directory for the log files         (default logs)
+        AGENT_LOG_LEVEL          debug | info | warning | error      (default info)
+        AGENT_LOG_DEBUG_SAMPLE   keep 1 in N debug events per name   (default 100)
+        AGENT_LOG_MAX_BYTES      rotate when a file reaches this     (default 10485760)
+        AGENT_LOG_BACKUPS        rotated files kept per log          (default 5)
+        AGENT_LOG_QUEUE          max queued records                  (default 100000)
+        AGENT_LOG_FLUSH_MS       writer wake-up interval             (default 200)
+        AGENT_LOG_MAX_FIELD      max chars per string field          (default 2048)
+    """
+
+    def __init__(self, directory: str = None, level: str = None, enabled: bool = None):
+        if enabled is None:
+            enabled = os.getenv("AGENT_LOGGING", "1") not in ("0", "false", "no")
+        self.enabled = enabled
+        self.directory = directory or os.getenv("AGENT_LOG_DIR", "logs")
+        self.level = LEVELS.get((level or os.getenv("AGENT_LOG_LEVEL", "info")).lower(), INFO)
+        self.sample = max(1, int(os.getenv("AGENT_LOG_DEBUG_SAMPLE", "100")))
+        self.max_bytes = int(os.getenv("AGENT_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+        self.backups = int(os.getenv("AGENT_LOG_BACKUPS", "5"))
+        self.capacity = int(os.getenv("AGENT_LOG_QUEUE", "100000"))
+        self.interval = int(os.getenv("AGENT_LOG_FLUSH_MS", "200")) / 1000
+        self.max_field = int(os.getenv("AGENT_LOG_MAX_FIELD", "2048"))
+
+        self._queue = deque()
+        self._seen = {}
+        self._files = {}
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self._lock = threading.Lock()
+        self.counters = {"queued": 0, "written": 0, "dropped": 0, "sampled_out": 0, "batches": 0}
+
+    # ---- REQUEST PATH ----
+
+    def log(self, level: int, event: str, stream: str = "agent", **fields):
+        if level < self.level or not self.enabled:
+            return
+
+        if level == DEBUG and self.sample > 1:
+            seen = self._seen.get(event, 0)
+            self._seen[event] = seen + 1
+            if seen % self.sample:
+                self.counters["sampled_out"] += 1
+                return
+
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            self.counters["dropped"] += 1
+            return
+
+        if self._thread is None:
+            self._start()
+
+        span = current_span()
+        queue.append((time.time(), level, stream, event, span.trace_id if span else None, fields))
+        self.counters["queued"] += 1
+        if level >= ERROR:
+            self._wake.set()
+
+    def debug(self, event: str, stream: str = "agent", **fields):
+        self.log(DEBUG, event, stream, **fields)
+
+    def info(self, event: str, stream: str = "agent", **fields):
+        self.log(INFO, event, stream, **fields)
+
+    def warning(self, event: str, stream: str = "agent", **fields):
+        self.log(WARNING, event, stream, **fields)
+
+    def error(self, event: str, stream: str = "agent", **fields):
+        self.log(ERROR, event, stream, **fields)
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self.enabled and level >= self.level
+
+    # ---- WRITER THREAD ----
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._thread = threading.Thread(target=self._run, name="agent-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            while self._drain():
+                pass
+        while self._drain():
+            pass
+
+    def _drain(self, limit: int = 10000) -> bool:
+        """
+        Writes up to `limit` records; True if more are waiting.
+        """
+        queue = self._queue
+        if not queue:
+            return False
+
+        batches = {}
+        waiters = []
+        written = 0
+        while queue and written < limit:
+            record = queue.popleft()
+            if isinstance(record, threading.Event):
+                waiters.append(record)
+                continue
+
+            ts, level, stream, event, trace_id, fields = record
+            line = self._encode(ts, level, stream, event, trace_id, fields)
+            batches.setdefault(STREAMS.get(stream, STREAMS["agent"]), []).append(line)
+            if level >= ERROR and stream != "error":
+                batches.setdefault(STREAMS["error"], []).append(line)
+            written += 1
+
+            # let request threads have the GIL during a big batch
+            if written % 256 == 0:
+                time.sleep(0)
+
+        for name, lines in batches.items():
+            f = self._file(name)
+            f.write_lines(lines)
+            f.flush()
+
+        self.counters["written"] += written
+        self.counters["batches"] += 1
+        for waiter in waiters:
+            waiter.set()
+        return bool(queue)
+
+    def _encode(self, ts, level, stream, event, trace_id, fields):
+        record = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)) + f".{int(ts % 1 * 1000):03d}Z",
+            "level": _NAMES.get(level, str(level)),
+            "stream": stream,
+            "event": event,
+        }
+        if trace_id is not None:
+            record["trace_id"] = trace_id
+        for key, value in fields.items():
+            if isinstance(value, (str, bytes)) and len(value) > self.max_field:
+                head = value[:self.max_field]
+                if isinstance(head, bytes):
+                    head = head.decode("utf-8", "replace")
+                value = f"{head}… [{len(value) - self.max_field} more]"
+            record[key] = value
+        return (json.dumps(record, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _file(self, name):
+        f = self._files.get(name)
+        if f is None:
+            f = self._files[name] = RotatingFile(os.path.join(self.directory, name), self.max_bytes, self.backups)
+        return f
+
+    # ---- CONTROL ----
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Blocks until everything queued so far is on disk.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return not self._queue
+        done = threading.Event()
+        self._queue.append(done)
+        self._wake.set()
+        return done.wait(timeout)
+
+    def close(self):
+        if self._thread is None or self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def stats(self):
+        return {
+            **self.counters,
+            "pending": len(self._queue),
+            "rotations": sum(f.rotations for f in list(self._files.values())),
+            "level": _NAMES.get(self.level),
+        }
+
+    # ---- TRACE SPANS ----
+
+    def log_span(self, span):
+        """
+        Tracer listener: query spans → agent.log, tool / subprocess / http
+        spans → tool.log. Subprocess and http spans are debug (sampled)
+        unless they failed.
+        """
+        error = span.attrs.get("error")
+        if span.kind in ("query", "workflow"):
+            stream, level = "agent", INFO
+        elif span.kind == "tool":
+            stream, level = "tool", INFO
+        else:
+            stream, level = "tool", DEBUG
+        if error or (span.attrs.get("exit_code") or 0) != 0 or (span.attrs.get("status") or 0) >= 500:
+            level = ERROR
+        if level < self.level:
+            return
+        self.log(level, f"{span.kind}.end", stream, name=span.name, trace_id=span.trace_id,
+                 duration_ms=round(span.duration_ms, 2), **span.attrs)
+
+
+_LOGGER = None
+_LOGGER_LOCK = threading.Lock()
+
+
+def get_logger() -> AgentLogger:
+    """
+    Shared logger for the life of the process. Finished trace spans are
+    logged through it.
+    """
+    global _LOGGER
+    if _LOGGER is None:
+        with _LOGGER_LOCK:
+            if _LOGGER is None:
+                from agent.core.tracing import get_tracer
+
+                _LOGGER = AgentLogger()
+                get_tracer().listeners.append(_LOGGER.log_span)
+    return _LOGGER
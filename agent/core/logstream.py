@@ -0,0 +1,191 @@
+# agent/core/logstream.py
+
+import re
+import json
+import time
+import random
+from collections import OrderedDict
+
+
+# ---- RECORD ----
+
+class LogRecord:
+    """
+    One parsed log line.
+
+      ts       timestamp string as emitted by the source (or None)
+      level    error | warn | info | debug | None
+      message  line text (JSON lines → their msg/message field)
+      labels   source labels (Loki stream labels, pod/container, ...)
+    """
+
+    __slots__ = ("ts", "level", "message", "labels")
+
+    def __init__(self, ts, level, message, labels=None):
+        self.ts = ts
+        self.level = level
+        self.message = message
+        self.labels = labels or {}
+
+    def __repr__(self):
+        return f"LogRecord({self.ts!r}, {self.level!r}, {self.message[:60]!r})"
+
+    def __str__(self):
+        prefix = f"{self.ts} " if self.ts else ""
+        return f"{prefix}{self.message}"
+
+
+_TS = re.compile(r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\s+")
+_LEVEL = re.compile(r"\b(?:level=)?(ERROR|ERR|FATAL|PANIC|CRITICAL|WARN|WARNING|INFO|DEBUG|TRACE)\b", re.IGNORECASE)
+
+_LEVELS = {
+    "error": "error", "err": "error", "fatal": "error", "panic": "error", "critical": "error",
+    "warn": "warn", "warning": "warn",
+    "info": "info",
+    "debug": "debug", "trace": "debug",
+}
+
+
+def parse_line(line, labels=None, ts=None) -> LogRecord:
+    """
+    Parses plain, logfmt or JSON log lines.
+    Leading RFC3339 timestamps (kubectl --timestamps) are split off.
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", "replace")
+    line = line.rstrip("\r\n")
+
+    if ts is None:
+        m = _TS.match(line)
+        if m:
+            ts = m.group(1)
+            line = line[m.end():]
+
+    if line.startswith("{"):
+        try:
+            obj = json.loads(line)
+            level = str(obj.get("level") or obj.get("severity") or "").lower()
+            message = obj.get("msg") or obj.get("message") or line
+            return LogRecord(ts or obj.get("ts") or obj.get("time"), _LEVELS.get(level), str(message), labels)
+        except ValueError:
+            pass
+
+    m = _LEVEL.search(line, 0, 120)
+    level = _LEVELS.get(m.group(1).lower()) if m else None
+    return LogRecord(ts, level, line, labels)
+
+
+# ---- PIPELINE STAGES ----
+#
+# Every stage is a generator over the previous one, so lines are parsed,
+# filtered and sampled while they arrive and only one record is held at a
+# time. Pulling is the backpressure: when the consumer stops reading, the
+# source stops reading its socket / pipe.
+
+def parse(lines, labels=None):
+    for line in lines:
+        if line:
+            yield parse_line(line, labels)
+
+
+def filter_records(records, levels=None, contains=None, pattern=None):
+    """
+    levels:   iterable of levels to keep, e.g. ("error", "warn")
+    contains: substring that must appear in the message
+    pattern:  regex (str or compiled) that must match the message
+    """
+    levels = set(levels) if levels else None
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+
+    for rec in records:
+        if levels and rec.level not in levels:
+            continue
+        if contains and contains not in rec.message:
+            continue
+        if pattern and not pattern.search(rec.message):
+            continue
+        yield rec
+
+
+def sample(records, rate=1.0, keep_levels=("error",)):
+    """
+    Keeps a `rate` fraction of records; levels in keep_levels always pass.
+    """
+    for rec in records:
+        if rate >= 1.0 or rec.level in keep_levels or random.random() < rate:
+            yield rec
+
+
+def take(records, limit=None, seconds=None):
+    """
+    Stops after `limit` records or `seconds` of wall time, whichever first.
+    Closing the upstream generator releases the socket / subprocess.
+    """
+    deadline = time.monotonic() + seconds if seconds else None
+    count = 0
+    try:
+        for rec in records:
+            yield rec
+            count += 1
+            if limit and count >= limit:
+                return
+            if deadline and time.monotonic() >= deadline:
+                return
+    finally:
+        close = getattr(records, "close", None)
+        if close:
+            close()
+
+
+# ---- DIGEST ----
+
+_FINGERPRINT = re.compile(r"0x[0-9a-fA-F]+|[0-9a-fA-F]{8,}|\d+")
+
+
+class ErrorDigest:
+    """
+    Bounded summary of a log stream: counts per message fingerprint
+    (numbers / hex ids masked) plus one example line each.
+
+    Memory is capped at max_groups fingerprints; once full, the least
+    recently seen group is dropped.
+    """
+
+    def __init__(self, max_groups: int = 50):
+        self.max_groups = max_groups
+        self.groups = OrderedDict()   # fingerprint → [count, level, example]
+        self.lines = 0
+        self.levels = {}
+
+    def add(self, rec: LogRecord):
+        self.lines += 1
+        self.levels[rec.level] = self.levels.get(rec.level, 0) + 1
+
+        key = _FINGERPRINT.sub("#", rec.message[:200])
+        group = self.groups.get(key)
+        if group is None:
+            if len(self.groups) >= self.max_groups:
+                self.groups.popitem(last=False)
+            self.groups[key] = [1, rec.level, str(rec)]
+        else:
+            group[0] += 1
+            self.groups.move_to_end(key)
+
+    def consume(self, records):
+        for rec in records:
+            self.add(rec)
+        return self
+
+    def top(self, n: int = 10):
+        ranked = sorted(self.groups.values(), key=lambda g: g[0], reverse=True)
+        return ranked[:n]
+
+    def render(self, n: int = 10):
+        if not self.lines:
+            return "(no matching log lines)"
+        levels = ", ".join(f"{k or 'other'}={v}" for k, v in self.levels.items())
+        out = [f"{self.lines} lines ({levels})"]
+        for count, level, example in self.top(n):
+            out.append(f"  x{count} [{level or '-'}] {example[:300]}")
+        return "\n".join(out)
@@ -0,0 +1,399 @@
+# agent/core/metrics.py
+
+import os
+import time
+import threading
+from urllib.parse import urlsplit
+
+
+# seconds, Prometheus-style
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INF = 'le="+Inf"'
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+# ---- METRIC TYPES ----
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(n, "")) for n in self.label_names)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_labels(self.label_names, key)} {_number(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, seconds: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    counts[i] += 1
+                    break
+            state[1] += seconds
+            state[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._values.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = 'le="' + _number(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, key, _INF)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(round(total, 6))}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {count}")
+        return lines
+
+
+# ---- REGISTRY ----
+
+class AgentMetrics:
+    """
+    The agent's own metrics, in Prometheus text format.
+
+    Request-path numbers are recorded as they happen:
+      - queries, workflows, tool methods, subprocesses, HTTP requests:
+        counts + latency histograms, fed by finished trace spans
+      - LLM requests, latency, time-to-first-token and tokens per provider
+
+    Component state is read at scrape time (collectors):
+      - in-flight queries / workflows / tool calls / subprocesses / HTTP
+      - HTTP pool: requests, pool hits, open / idle connections per host
+      - response cache, plan cache, prompt cache: hits, misses, hit ratio
+      - logger: written / dropped / sampled-out records
+
+    Served at GET /metrics by ui/api/rest_api.py, or on its own port
+    (serve(port)) in REPL mode.
+
+    Config (env):
+        AGENT_METRICS_PORT   REPL mode: port for /metrics   (unset = off)
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.metrics = {}
+        self.collectors = {}
+        self.caches = {}
+        self._lock = threading.Lock()
+
+        self.requests = self.counter("agent_requests_total", "Queries handled by the Router.", ["intent", "status"])
+        self.request_seconds = self.histogram("agent_request_duration_seconds", "Query latency, plan to result.", ["intent"])
+        self.workflows = self.counter("agent_workflow_runs_total", "Workflow runs.", ["workflow", "status"])
+        self.workflow_seconds = self.histogram("agent_workflow_duration_seconds", "Workflow latency.", ["workflow"])
+        self.tool_calls = self.counter("agent_tool_calls_total", "Tool method calls.", ["tool", "method", "status"])
+        self.tool_seconds = self.histogram("agent_tool_duration_seconds", "Tool method latency.", ["tool", "method"])
+        self.subprocesses = self.counter("agent_subprocess_spawns_total", "CLI subprocesses started.", ["command", "status"])
+        self.subprocess_seconds = self.histogram("agent_subprocess_duration_seconds", "CLI subprocess run time.", ["command"])
+        self.http_requests = self.counter("agent_http_requests_total", "Outbound HTTP requests.", ["host", "method", "code"])
+        self.http_seconds = self.histogram("agent_http_request_duration_seconds", "Outbound HTTP latency.", ["host"])
+
+        self.llm_requests = self.counter("agent_llm_requests_total", "LLM requests.", ["provider", "model", "cache"])
+        self.llm_seconds = self.histogram("agent_llm_request_duration_seconds", "LLM latency (full response).", ["provider"])
+        self.llm_ttft = self.histogram("agent_llm_time_to_first_token_seconds", "Streaming LLM time to first token.", ["provider"])
+        self.llm_tokens = self.counter("agent_llm_tokens_total", "LLM tokens (provider usage, or ~4 chars/token).", ["provider", "direction"])
+
+        self.collectors["runtime"] = self._collect_runtime
+
+    # ---- DEFINE ----
+
+    def _add(self, metric):
+        with self._lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, labels=()):
+        return self._add(Counter(name, help, labels))
+
+    def gauge(self, name, help, labels=()):
+        return self._add(Gauge(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def register_collector(self, name: str, fn):
+        """
+        fn() → [(metric name, type, help, {labels tuple: value}, label names)]
+        called on every scrape. Re-registering a name replaces it.
+        """
+        self.collectors[name] = fn
+
+    def register_cache(self, name: str, stats):
+        """
+        stats() → {"hits", "misses", "hit_rate", ...} like the built-in caches.
+        """
+        self.caches[name] = stats
+
+    # ---- RECORD ----
+
+    def record_span(self, span):
+        """
+        Tracer listener: one finished span → counters and histograms.
+        """
+        seconds = span.duration_ms / 1000
+        attrs = span.attrs
+        failed = bool(attrs.get("error"))
+
+        if span.kind == "query":
+            intent = attrs.get("intent") or "unknown"
+            self.requests.inc(intent=intent, status="error" if failed else "ok")
+            self.request_seconds.observe(seconds, intent=intent)
+
+        elif span.kind == "workflow":
+            self.workflows.inc(workflow=span.name, status="error" if failed else "ok")
+            self.workflow_seconds.observe(seconds, workflow=span.name)
+
+        elif span.kind == "tool":
+            tool, _, method = span.name.partition(".")
+            self.tool_calls.inc(tool=tool, method=method, status="error" if failed else "ok")
+            self.tool_seconds.observe(seconds, tool=tool, method=method)
+
+        elif span.kind == "subprocess":
+            code = attrs.get("exit_code")
+            if attrs.get("timed_out"):
+                status = "timeout"
+            else:
+                status = "ok" if code == 0 else "not_found" if code == 127 else "error"
+            self.subprocesses.inc(command=span.name, status=status)
+            self.subprocess_seconds.observe(seconds, command=span.name)
+
+        elif span.kind == "http":
+            method, _, template = span.name.partition(" ")
+            host = template.split("/", 1)[0]
+            code = attrs.get("status") or ("error" if failed else "")
+            self.http_requests.inc(host=host, method=method, code=code)
+            self.http_seconds.observe(seconds, host=host)
+
+    def record_llm(self, provider, model, seconds=None, cache: str = "off", ttft=None):
+        """
+        One LLM response (cache: hit | miss | off). Tokens are counted
+        separately by the model that made the call, see record_tokens().
+        """
+        self.llm_requests.inc(provider=provider, model=model, cache=cache)
+        if seconds is not None:
+            self.llm_seconds.observe(seconds, provider=provider)
+        if ttft is not None:
+            self.llm_ttft.observe(ttft, provider=provider)
+
+    def record_tokens(self, provider, prompt_tokens=0, completion_tokens=0):
+        if prompt_tokens:
+            self.llm_tokens.inc(prompt_tokens, provider=provider, direction="prompt")
+        if completion_tokens:
+            self.llm_tokens.inc(completion_tokens, provider=provider, direction="completion")
+
+    # ---- COLLECT ----
+
+    def _collect_runtime(self):
+        from agent.core.cache import get_response_cache
+        from agent.core.http_pool import get_http_client
+        from agent.core.logger import get_logger
+        from agent.core.planner import get_plan_cache
+        from agent.core.process import get_runner
+        from agent.core.tracing import get_tracer
+
+        out = [
+            ("agent_start_time_seconds", "gauge", "Process start time (unix).", {(): self.started}, ()),
+            ("agent_in_flight", "gauge", "Open queries / workflows / tool calls / subprocesses / HTTP requests.",
+             {(kind,): n for kind, n in dict(get_tracer().active).items()}, ("kind",)),
+        ]
+
+        pool = get_http_client().stats()
+        hosts = {urlsplit(prefix).netloc: s for prefix, s in pool["hosts"].items()}
+        out += [
+            ("agent_http_pool_requests_total", "counter", "Requests through the shared HTTP pool.",
+             {(): pool["requests"]}, ()),
+            ("agent_http_pool_adapter_lookups_total", "counter", "Per-host pool lookups (hit = pool already existed).",
+             {("hit",): pool["adapter_hits"], ("miss",): pool["adapter_misses"]}, ("result",)),
+            ("agent_http_pool_connection_reuses_total", "counter", "Requests served on a kept-alive connection.",
+             {(): pool["reuses"]}, ()),
+            ("agent_http_pool_connections", "gauge", "Connections opened per host pool.",
+             {(h,): s["connections"] for h, s in hosts.items()}, ("host",)),
+            ("agent_http_pool_idle_connections", "gauge", "Idle keep-alive connections per host pool.",
+             {(h,): s["idle"] for h, s in hosts.items()}, ("host",)),
+            ("agent_http_pool_max_connections", "gauge", "Pool size per host.",
+             {(h,): s["maxsize"] for h, s in hosts.items()}, ("host",)),
+        ]
+
+        caches = {"response": get_response_cache().stats(), "plan": get_plan_cache().stats()}
+        for name, stats in list(self.caches.items()):
+            caches[name] = stats()
+        out += [
+            ("agent_cache_lookups_total", "counter", "Cache lookups by result.",
+             {(c, r): s.get(k, 0) for c, s in caches.items()
+              for r, k in (("hit", "hits"), ("approx_hit", "approx_hits"), ("shared", "shared"), ("miss", "misses"))
+              if k in s}, ("cache", "result")),
+            ("agent_cache_hit_ratio", "gauge", "Hits / lookups since start.",
+             {(c,): s.get("hit_rate", 0.0) for c, s in caches.items()}, ("cache",)),
+            ("agent_cache_entries", "gauge", "Entries held.",
+             {(c,): s.get("entries", s.get("size", 0)) for c, s in caches.items()}, ("cache",)),
+        ]
+
+        procs = get_runner().stats()
+        out += [
+            ("agent_subprocess_running", "gauge", "CLI processes running per binary.",
+             {(b,): p["running"] for b, p in procs.items()}, ("binary",)),
+            ("agent_subprocess_waiting", "gauge", "Runs waiting for a concurrency slot per binary.",
+             {(b,): p["waiting"] for b, p in procs.items()}, ("binary",)),
+            ("agent_subprocess_output_spills_total", "counter", "Runs whose output went past the in-memory cap.",
+             {(b,): p["spilled"] for b, p in procs.items()}, ("binary",)),
+        ]
+
+        log = get_logger().stats()
+        out.append(("agent_log_records_total", "counter", "Log records by outcome.",
+                    {(k,): log[k] for k in ("written", "dropped", "sampled_out")}, ("outcome",)))
+        return out
+
+    # ---- EXPOSITION ----
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            lines += metric.render()
+
+        for name, fn in list(self.collectors.items()):
+            try:
+                families = fn()
+            except Exception as e:
+                lines.append(f"# collector {name} failed: {_escape(e)}")
+                continue
+            for metric_name, kind, help, samples, label_names in families:
+                lines.append(f"# HELP {metric_name} {help}")
+                lines.append(f"# TYPE {metric_name} {kind}")
+                for key, value in sorted(samples.items()):
+                    lines.append(f"{metric_name}{_labels(label_names, key)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    # ---- STANDALONE SERVER ----
+
+    def serve(self, port: int = None, host: str = "0.0.0.0"):
+        """
+        /metrics on its own port, for REPL mode. Returns the server
+        (daemon thread), or None if no port is configured.
+        """
+        port = port if port is not None else int(os.getenv("AGENT_METRICS_PORT", "0") or 0)
+        if not port:
+            return None
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+        return server
+
+
+_METRICS = None
+_METRICS_LOCK = threading.Lock()
+
+
+def get_metrics() -> AgentMetrics:
+    """
+    Shared registry for the life of the process. Finished trace spans are
+    counted through it.
+    """
+    global _METRICS
+    if _METRICS is None:
+        with _METRICS_LOCK:
+            if _METRICS is None:
+                from agent.core.tracing import get_tracer
+
+                _METRICS = AgentMetrics()
+                get_tracer().listeners.append(_METRICS.record_span)
+    return _METRICS
+
+
+def estimate_tokens(text) -> int:
+    """
+    Rough token count (~4 characters per token) when a provider reports none.
+    """
+    return (len(text) + 3) // 4 if text else 0
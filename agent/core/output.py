@@ -0,0 +1,260 @@
+# agent/core/output.py
+
+import os
+import re
+import json
+import mmap
+import shutil
+import weakref
+
+from agent.core.process import get_runner
+
+
+def _release(path, resources):
+    for res in reversed(resources):
+        try:
+            res.close()
+        except (BufferError, ValueError):
+            # a memoryview slice is still alive; the mapping goes with it
+            pass
+    resources.clear()
+    if path:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class OutputHandle:
+    """
+    Large CLI output (helm manifests, terraform show, Trivy / Syft JSON)
+    kept in a temp file and memory-mapped on demand instead of held as a
+    Python str.
+
+    Supports:
+      - len(handle)                       size in bytes, nothing read
+      - view(start, end)                  zero-copy memoryview slice
+      - lines()                           decoded lines, one at a time
+      - json() / iter_json(prefix)        whole document, or items streamed
+                                          with ijson when it is installed
+      - find(), `text in handle`, startswith()
+      - str(handle)                       bounded preview: head, tail, size
+      - render()                          the full text (the only call that
+                                          builds the whole str)
+      - save(path), close()
+
+    The temp file is removed on close() or when the handle is garbage
+    collected, so keep the handle (e.g. in Context "last_result") for as
+    long as the full output is needed.
+
+    Config (env):
+        AGENT_OUTPUT_INLINE    outputs up to this size stay a plain str   (default 1048576)
+        AGENT_OUTPUT_PREVIEW   bytes of head / tail shown by str()        (default 2048)
+    """
+
+    def __init__(self, path: str, owned: bool = True):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.preview_bytes = int(os.getenv("AGENT_OUTPUT_PREVIEW", "2048"))
+        self._map = None
+        self._resources = []
+        self._finalizer = weakref.finalize(self, _release, path if owned else None, self._resources)
+
+    def _mmap(self):
+        if self._map is None:
+            f = open(self.path, "rb")
+            self._resources.append(f)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._resources.append(self._map)
+        return self._map
+
+    # ---- BYTES ----
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def view(self, start: int = 0, end: int = None) -> memoryview:
+        if not self.size:
+            return memoryview(b"")
+        return memoryview(self._mmap())[start:end]
+
+    def find(self, text, start: int = 0) -> int:
+        if not self.size:
+            return -1
+        needle = text.encode("utf-8") if isinstance(text, str) else text
+        return self._mmap().find(needle, start)
+
+    def __contains__(self, text):
+        return self.find(text) >= 0
+
+    def startswith(self, prefix) -> bool:
+        needle = prefix.encode("utf-8") if isinstance(prefix, str) else prefix
+        return bytes(self.view(0, len(needle))) == needle
+
+    # ---- TEXT ----
+
+    def lines(self, encoding: str = "utf-8"):
+        # buffered reads, not the mapping: pages already read don't stay resident
+        with open(self.path, "rb") as f:
+            for line in f:
+                yield line.rstrip(b"\n").decode(encoding, "replace")
+
+    def preview(self, limit: int = None) -> str:
+        limit = limit or self.preview_bytes
+        if self.size <= 2 * limit:
+            return self.render()
+        head = bytes(self.view(0, limit)).decode("utf-8", "replace")
+        tail = bytes(self.view(self.size - limit)).decode("utf-8", "replace")
+        omitted = self.size - 2 * limit
+        return f"{head}\n… [{omitted} bytes omitted, full output in {self.path}] …\n{tail}"
+
+    def render(self, encoding: str = "utf-8") -> str:
+        if not self.size:
+            return ""
+        return str(self.view(), encoding, "replace")
+
+    def __str__(self):
+        return self.preview()
+
+    def __repr__(self):
+        return f"OutputHandle({self.path!r}, {self.size} bytes)"
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+    # ---- JSON ----
+
+    def json(self):
+        """
+        Parses the whole document (reads from the file, not via a str copy).
+        """
+        with open(self.path, "rb") as f:
+            return json.load(f)
+
+    def iter_json(self, prefix: str = "item"):
+        """
+        Items under an ijson-style prefix ("Results.item", "artifacts.item").
+        Streams with ijson when installed. Without it, "item" and
+        "<key>.item" (first array under that key) are still streamed one
+        element at a time; other prefixes parse the document once.
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is not None:
+            with open(self.path, "rb") as f:
+                yield from ijson.items(f, prefix)
+            return
+
+        start = self._array_start(prefix)
+        if start is not None:
+            yield from self._array_items(start)
+            return
+
+        nodes = [self.json()]
+        for key in filter(None, prefix.split(".")):
+            if key == "item":
+                nodes = [item for node in nodes if isinstance(node, list) for item in node]
+            else:
+                nodes = [node[key] for node in nodes if isinstance(node, dict) and key in node]
+        yield from nodes
+
+    def _array_start(self, prefix):
+        """
+        Byte offset of the "[" the prefix points at, or None.
+        """
+        if not self.size:
+            return None
+        parts = prefix.split(".")
+        if parts == ["item"]:
+            m = re.compile(rb"\s*\[").match(self._mmap())
+        elif len(parts) == 2 and parts[1] == "item":
+            m = re.compile(rb'"' + re.escape(parts[0].encode("utf-8")) + rb'"\s*:\s*\[').search(self._mmap())
+        else:
+            return None
+        return m.end() - 1 if m else None
+
+    def _array_items(self, start, window: int = 1 << 20):
+        """
+        Decodes array elements one at a time, reading the file in windows;
+        only the current element (and its window) is ever in memory.
+        """
+        decoder = json.JSONDecoder()
+        with open(self.path, "rb") as f:
+            pos = start + 1
+            while True:
+                f.seek(pos)
+                head = f.read(4096).lstrip(b" \t\r\n,")
+                if not head or head[:1] == b"]":
+                    return
+                pos = f.tell() - len(head)
+
+                size = window
+                while True:
+                    f.seek(pos)
+                    data = f.read(size)
+                    complete = pos + len(data) >= self.size
+                    chunk = data.decode("utf-8", "surrogateescape")
+                    try:
+                        obj, end = decoder.raw_decode(chunk)
+                    except ValueError:
+                        if complete:
+                            raise
+                        size *= 2
+                        continue
+                    # a number cut off at the window edge still decodes
+                    if end == len(chunk) and not complete:
+                        size *= 2
+                        continue
+                    break
+
+                yield obj
+                pos += len(chunk[:end].encode("utf-8", "surrogateescape"))
+
+    # ---- LIFETIME ----
+
+    def save(self, dest: str) -> str:
+        shutil.copyfile(self.path, dest)
+        return dest
+
+    def close(self):
+        self._map = None
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_output(cmd, cwd=None, error_tag: str = "exec-error", missing: str = None, timeout=None):
+    """
+    run_text() for commands with potentially huge output: successful
+    outputs over AGENT_OUTPUT_INLINE bytes come back as an OutputHandle
+    over the runner's spill file; everything else (small outputs, errors,
+    missing binary) is the usual str.
+    """
+    inline = int(os.getenv("AGENT_OUTPUT_INLINE", str(1024 * 1024)))
+    result = get_runner().run(cmd, cwd=cwd, timeout=timeout, output_cap=inline)
+    return _handle_or_text(result, error_tag, missing)
+
+
+async def run_output_async(cmd, cwd=None, error_tag: str = "exec-error", missing: str = None, timeout=None):
+    inline = int(os.getenv("AGENT_OUTPUT_INLINE", str(1024 * 1024)))
+    result = await get_runner().run_async(cmd, cwd=cwd, timeout=timeout, output_cap=inline)
+    return _handle_or_text(result, error_tag, missing)
+
+
+def _handle_or_text(result, error_tag, missing):
+    if result.ok and result.spill_path:
+        return OutputHandle(result.spill_path)
+    try:
+        return result.text(error_tag, missing)
+    finally:
+        result.discard()
@@ -1,8 +1,102 @@
 # agent/core/planner.py
 
+import os
+import re
+import threading
+from collections import OrderedDict
+
 from agent.nlp.intent_classifier import IntentClassifier
 from agent.nlp.command_mapper import CommandMapper
 from agent.nlp.parser import Parser
+from agent.nlp.splitter import QuerySplitter
+
+# Memory keys a plan may depend on (fill-ins for entities the query omits)
+MEMORY_KEYS = ("app", "namespace", "cluster")
+
+# steps that change the app; later steps on the same app wait for them
+MUTATING_INTENTS = ("DEPLOY", "ROLLBACK", "SCALE", "BUILD")
+
+
+def normalize_query(query: str) -> str:
+    """
+    "  Deploy nginx   to PROD! " → "deploy nginx to prod"
+    """
+    return re.sub(r"\s+", " ", query.lower()).strip().rstrip("?!.")
+
+
+class PlanCache:
+    """
+    Bounded LRU of plans, shared by every Planner in the process.
+
+    Keys are (normalized query, relevant memory values, entity index
+    version), so a plan is recomputed when the inventory or the session
+    context it was built from changes.
+
+    Config (env):
+        AGENT_PLAN_CACHE_SIZE   max plans kept; 0 disables (default 1024)
+    """
+
+    def __init__(self, max_size: int = None):
+        self.max_size = max_size if max_size is not None else int(os.getenv("AGENT_PLAN_CACHE_SIZE", "1024"))
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key, plan):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._plans),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+_PLAN_CACHE = None
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def copy_plan(plan: dict) -> dict:
+    out = {**plan, "entities": dict(plan["entities"])}
+    if "steps" in plan:
+        out["steps"] = [copy_plan(step) for step in plan["steps"]]
+    return out
+
+
+def get_plan_cache() -> PlanCache:
+    global _PLAN_CACHE
+    if _PLAN_CACHE is None:
+        with _PLAN_CACHE_LOCK:
+            if _PLAN_CACHE is None:
+                _PLAN_CACHE = PlanCache()
+    return _PLAN_CACHE
+
 
 class Planner:
     """
@@ -24,28 +118,125 @@ class Planner:
               },
               "raw": "deploy nginx in prod scaled to 3"
             }
+
+    With a Memory, entities the query omits (app, namespace, cluster)
+    are filled from the session context.
+
+    Compound requests ("scale api to 5 and show logs for backend") become
+    a MULTI plan with one step per clause:
+        {
+          "intent": "MULTI",
+          "workflow": "multi",
+          "steps": [
+              {"id": 1, "intent": "SCALE", ..., "depends_on": []},
+              {"id": 2, "intent": "LOGS",  ..., "depends_on": []},
+          ],
+        }
+    A step depends on the previous one after "then", and on any earlier
+    deploy / rollback / scale / build of the same app. The Executor runs
+    independent steps concurrently.
+
+    Plans are memoized in the shared PlanCache, so repeated queries
+    (chatops bots, retries) skip classification and entity extraction.
     """
 
-    def __init__(self, model):
+    def __init__(self, model, memory=None, cache: PlanCache = None):
         self.model = model
+        self.memory = memory
+        self.cache = cache or get_plan_cache()
         self.intent = IntentClassifier()
         self.mapper = CommandMapper()
         self.parser = Parser()
+        self.splitter = QuerySplitter(self.intent)
+
+    def _key(self, text: str):
+        context = ()
+        if self.memory is not None:
+            context = tuple(self.memory.get(k) for k in MEMORY_KEYS)
+        return text, context, self.parser.index.version
 
     def create_plan(self, user_query: str) -> dict:
-        intent = self.intent.classify(user_query)
+        # plan from the same normalized text the cache is keyed on, so
+        # "scale api to 3" and "Scale api to 3." can share one plan
+        text = normalize_query(user_query)
+        key = self._key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return {**copy_plan(cached), "raw": user_query}
+
+        clauses = self.splitter.split(text)
+        if len(clauses) > 1:
+            plan = self._compound_plan(user_query, clauses)
+        else:
+            plan = self._plan(text, raw=user_query)
+
+        # future: ask cloud model for planning refinement
+        # e.g. self.model.plan(plan)
+
+        self.cache.put(key, copy_plan(plan))
+        return plan
+
+    def _plan(self, text: str, raw: str = None) -> dict:
+        intent = self.intent.classify(text)
         workflow = self.mapper.map_intent(intent)
-        entities = self.parser.parse(user_query)
+        entities = self.parser.parse(text)
 
-        plan = {
-            "raw": user_query,
+        if self.memory is not None:
+            for k in MEMORY_KEYS:
+                if k not in entities and self.memory.get(k) is not None:
+                    entities[k] = self.memory.get(k)
+
+        return {
+            "raw": raw or text,
             "intent": intent,
             "workflow": workflow,
             "entities": entities,
         }
 
-        # future: ask cloud model for planning refinement
-        # e.g. self.model.plan(plan)
+    def _compound_plan(self, user_query: str, clauses) -> dict:
+        steps = []
+        for text, sequential in clauses:
+            step = self._plan(text)
 
-        return plan
+            # "deploy api then show its logs": carry the subject forward
+            if steps:
+                for k in ("app", "namespace"):
+                    if k not in step["entities"] and k in steps[-1]["entities"]:
+                        step["entities"][k] = steps[-1]["entities"][k]
+
+            # "check health and status" → one step
+            if any(s["workflow"] == step["workflow"] and s["entities"] == step["entities"] for s in steps):
+                continue
+
+            depends_on = set()
+            if sequential and steps:
+                depends_on.add(steps[-1]["id"])
+            app = step["entities"].get("app")
+            for s in steps:
+                if app and s["intent"] in MUTATING_INTENTS and s["entities"].get("app") == app:
+                    depends_on.add(s["id"])
+
+            step["id"] = len(steps) + 1
+            step["depends_on"] = sorted(depends_on)
+            steps.append(step)
+
+        if len(steps) == 1:
+            return self._plan(normalize_query(user_query), raw=user_query)
+
+        return {
+            "raw": user_query,
+            "intent": "MULTI",
+            "workflow": "multi",
+            "entities": {},
+            "steps": steps,
+        }
+
+    async def create_plan_async(self, user_query: str) -> dict:
+        """
+        Async variant for the async Router.
+        Planning is pure CPU (regex + lookups), so it runs inline.
+        """
+        return self.create_plan(user_query)
 
+    def stats(self):
+        return self.cache.stats()
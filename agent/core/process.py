@@ -0,0 +1,565 @@
+# agent/core/process.py
+
+import os
+import time
+import errno
+import shutil
+import signal
+import asyncio
+import tempfile
+import threading
+import selectors
+import subprocess
+from collections import deque, defaultdict
+
+from agent.core.tracing import command_template, span
+
+
+CHUNK = 64 * 1024
+
+# long-running CLIs get more room than the default
+DEFAULT_TIMEOUTS = {"terraform": 1800, "docker": 1800, "helm": 600, "trivy": 900, "syft": 900, "infracost": 600}
+DEFAULT_LIMITS = {"terraform": 2, "docker": 4}
+
+
+def _pairs(value):
+    """
+    "kubectl=16,terraform=1" → {"kubectl": 16.0, "terraform": 1.0}
+    """
+    out = {}
+    for item in (value or "").split(","):
+        name, _, n = item.partition("=")
+        if name.strip() and n.strip():
+            out[name.strip()] = float(n)
+    return out
+
+
+class ProcessResult:
+    """
+    One finished CLI run.
+
+    output holds at most the runner's output cap: the head of the output,
+    an omission note and the tail. The complete output is in spill_path
+    when the cap was hit; whoever called run() owns that file (hand it to
+    an OutputHandle, or discard() it).
+    """
+
+    __slots__ = ("cmd", "code", "output", "bytes_out", "elapsed", "timeout", "timed_out", "missing", "spill_path")
+
+    def __init__(self, cmd, code=None, output="", bytes_out=0, elapsed=0.0, timeout=None,
+                 timed_out=False, missing=False, spill_path=None):
+        self.cmd = cmd
+        self.code = code
+        self.output = output
+        self.bytes_out = bytes_out
+        self.elapsed = elapsed
+        self.timeout = timeout
+        self.timed_out = timed_out
+        self.missing = missing
+        self.spill_path = spill_path
+
+    @property
+    def ok(self) -> bool:
+        return self.code == 0 and not self.timed_out
+
+    @property
+    def truncated(self) -> bool:
+        return self.spill_path is not None
+
+    def text(self, error_tag: str = "exec-error", missing: str = None, strip: bool = True) -> str:
+        """
+        The tools' _exec contract: output on success, "[<error_tag>] output"
+        on failure, the missing-binary message if the CLI is not installed.
+        """
+        if self.missing:
+            return missing or f"[{self.cmd[0]}-not-installed] {self.cmd[0]} CLI not found."
+        out = self.output.strip()
+        if self.timed_out:
+            note = f"timed out after {self.timeout:g}s"
+            return f"[{error_tag}] {note}\n{out}" if out else f"[{error_tag}] {note}"
+        if self.code != 0:
+            return f"[{error_tag}] {out}"
+        if self.truncated:
+            # head + tail is not the command's output: never pass it off as a success
+            return f"[{error_tag}] output too large ({self.bytes_out} bytes), only head and tail kept\n{out}"
+        return out if strip else self.output
+
+    def discard(self):
+        """
+        Removes the spill file, if any.
+        """
+        if self.spill_path:
+            try:
+                os.unlink(self.spill_path)
+            except FileNotFoundError:
+                pass
+
+    def as_dict(self):
+        return {
+            "command": command_template(self.cmd),
+            "code": self.code,
+            "elapsed_ms": round(self.elapsed * 1000, 2),
+            "bytes_out": self.bytes_out,
+            "timed_out": self.timed_out,
+            "missing": self.missing,
+            "spill_path": self.spill_path,
+        }
+
+
+class _Output:
+    """
+    Collects process output up to `cap` bytes in memory: the head, plus a
+    rolling tail (where CLIs print their errors). Past the cap everything
+    is also written to a temp file.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.head_cap = cap - cap // 4
+        self.tail_cap = cap // 4
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.size = 0
+        self.spill = None
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self.spill is None and self.size <= self.cap:
+            self.head += chunk
+            return
+
+        if self.spill is None:
+            self.spill = tempfile.NamedTemporaryFile(prefix="agent-proc-", suffix=".out", delete=False)
+            self.spill.write(self.head)
+            overflow = self.head[self.head_cap:]
+            del self.head[self.head_cap:]
+            self.tail += overflow
+        self.spill.write(chunk)
+        self.tail += chunk
+        if len(self.tail) > self.tail_cap:
+            del self.tail[:len(self.tail) - self.tail_cap]
+
+    def finish(self):
+        """
+        (text, spill_path)
+        """
+        if self.spill is None:
+            return self.head.decode("utf-8", "replace"), None
+        self.spill.close()
+        omitted = self.size - len(self.head) - len(self.tail)
+        text = (
+            self.head.decode("utf-8", "replace")
+            + f"\n… [{omitted} bytes omitted] …\n"
+            + self.tail.decode("utf-8", "replace")
+        )
+        return text, self.spill.name
+
+
+class ProcessRunner:
+    """
+    Single entry point for running CLI subprocesses (kubectl, helm,
+    terraform, docker, vault, ...).
+
+    Supports:
+      - per-binary concurrency limits (a slow `terraform plan` storm can't
+        starve kubectl of processes / file descriptors)
+      - per-call and per-binary timeouts; on timeout the whole process
+        group gets SIGTERM, then SIGKILL after a grace period
+      - incremental stdout reading with an in-memory cap; larger outputs
+        spill to a temp file and the result keeps head + tail (run_text
+        reports such a result as an error and removes the file;
+        agent.core.output.run_output hands it to an OutputHandle)
+      - sync run() and async run_async() with the same semantics, and
+        stream() for line-by-line follow mode (kubectl logs -f)
+      - a "subprocess" trace span and a history record (timing, exit
+        code, bytes) for every run; stats() per binary
+
+    Time spent waiting for a concurrency slot counts against the timeout.
+    Streams are not subject to the concurrency limits (they can stay open
+    for as long as the caller reads).
+
+    Config (env):
+        AGENT_PROC_TIMEOUT       default timeout in seconds              (default 120)
+        AGENT_PROC_TIMEOUTS      per-binary, e.g. "terraform=3600,helm=300"
+        AGENT_PROC_CONCURRENCY   default concurrent runs per binary      (default 8)
+        AGENT_PROC_LIMITS        per-binary, e.g. "terraform=1,kubectl=16"
+        AGENT_PROC_KILL_GRACE    seconds between SIGTERM and SIGKILL     (default 5)
+        AGENT_PROC_OUTPUT_CAP    bytes of output kept in memory          (default 4194304)
+        AGENT_PROC_HISTORY       finished runs kept for inspection       (default 200)
+    """
+
+    def __init__(self):
+        self.timeout = float(os.getenv("AGENT_PROC_TIMEOUT", "120"))
+        self.timeouts = {**DEFAULT_TIMEOUTS, **_pairs(os.getenv("AGENT_PROC_TIMEOUTS"))}
+        self.concurrency = int(os.getenv("AGENT_PROC_CONCURRENCY", "8"))
+        self.limits = {**DEFAULT_LIMITS, **{k: int(v) for k, v in _pairs(os.getenv("AGENT_PROC_LIMITS")).items()}}
+        self.kill_grace = float(os.getenv("AGENT_PROC_KILL_GRACE", "5"))
+        self.output_cap = int(os.getenv("AGENT_PROC_OUTPUT_CAP", str(4 * 1024 * 1024)))
+
+        self.history = deque(maxlen=int(os.getenv("AGENT_PROC_HISTORY", "200")))
+        self._slots = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            "runs": 0, "failures": 0, "timeouts": 0, "missing": 0, "spilled": 0,
+            "running": 0, "waiting": 0, "seconds": 0.0, "max_seconds": 0.0,
+        })
+
+    # ---- LIMITS ----
+
+    def _slot(self, binary):
+        sem = self._slots.get(binary)
+        if sem is None:
+            with self._lock:
+                sem = self._slots.get(binary)
+                if sem is None:
+                    sem = self._slots[binary] = threading.BoundedSemaphore(
+                        max(1, self.limits.get(binary, self.concurrency))
+                    )
+        return sem
+
+    def timeout_for(self, binary, timeout=None) -> float:
+        if timeout is not None:
+            return timeout
+        return self.timeouts.get(binary, self.timeout)
+
+    def _popen_args(self, cwd, env, merge_stderr, has_input):
+        return {
+            "stdin": subprocess.PIPE if has_input else subprocess.DEVNULL,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
+            "cwd": cwd,
+            "env": env,
+            "start_new_session": True,
+        }
+
+    # ---- SYNC ----
+
+    def run(self, cmd, cwd=None, env=None, timeout=None, input=None,
+            merge_stderr: bool = True, on_chunk=None, output_cap=None) -> ProcessResult:
+        """
+        Runs cmd to completion (or timeout). Never raises for a failing or
+        missing CLI; check result.ok / result.missing.
+
+        output_cap overrides AGENT_PROC_OUTPUT_CAP for this call.
+        """
+        binary = os.path.basename(cmd[0])
+        timeout = self.timeout_for(binary, timeout)
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        with span(command_template(cmd), "subprocess") as s:
+            self._count(binary, "waiting", 1)
+            acquired = self._slot(binary).acquire(timeout=timeout)
+            self._count(binary, "waiting", -1)
+            if not acquired:
+                return self._finish(s, binary, ProcessResult(cmd, elapsed=time.perf_counter() - start, timeout=timeout, timed_out=True))
+
+            self._count(binary, "running", 1)
+            try:
+                result = self._run(cmd, cwd, env, input, merge_stderr, on_chunk, output_cap, start, deadline)
+                result.timeout = timeout
+            finally:
+                self._count(binary, "running", -1)
+                self._slot(binary).release()
+            return self._finish(s, binary, result)
+
+    def _run(self, cmd, cwd, env, input, merge_stderr, on_chunk, output_cap, start, deadline):
+        try:
+            proc = subprocess.Popen(cmd, **self._popen_args(cwd, env, merge_stderr, input is not None))
+        except FileNotFoundError:
+            return ProcessResult(cmd, code=127, missing=True, elapsed=time.perf_counter() - start)
+
+        if input is not None:
+            try:
+                proc.stdin.write(input.encode("utf-8") if isinstance(input, str) else input)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        output = _Output(output_cap or self.output_cap)
+        timed_out = False
+        fd = proc.stdout.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                if not sel.select(remaining):
+                    continue
+                chunk = os.read(fd, CHUNK)
+                if not chunk:
+                    break
+                output.write(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+
+        if not timed_out:
+            try:
+                proc.wait(max(0.0, deadline - time.perf_counter()))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+        if timed_out:
+            self._kill(proc)
+        proc.stdout.close()
+
+        text, spill_path = output.finish()
+        return ProcessResult(cmd, code=proc.returncode, output=text, bytes_out=output.size,
+                             elapsed=time.perf_counter() - start, timed_out=timed_out, spill_path=spill_path)
+
+    def _kill(self, proc):
+        """
+        SIGTERM the process group, SIGKILL it if still alive after the grace period.
+        """
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+            proc.wait(self.kill_grace)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+        except ProcessLookupError:
+            proc.wait()
+
+    # ---- ASYNC ----
+
+    async def run_async(self, cmd, cwd=None, env=None, timeout=None, input=None,
+                        merge_stderr: bool = True, on_chunk=None, output_cap=None) -> ProcessResult:
+        """
+        Same as run() without blocking the event loop. If the awaiting task
+        is cancelled (e.g. a fan-out timeout) the process group is killed,
+        so no orphaned kubectl/helm survives.
+        """
+        binary = os.path.basename(cmd[0])
+        timeout = self.timeout_for(binary, timeout)
+        start = time.perf_counter()
+        deadline = start + timeout
+        sem = self._slot(binary)
+
+        with span(command_template(cmd), "subprocess") as s:
+            # poll rather than park a thread on the semaphore: a cancelled
+            # task must not leave a thread behind that later takes a slot
+            self._count(binary, "waiting", 1)
+            try:
+                while not sem.acquire(blocking=False):
+                    if time.perf_counter() >= deadline:
+                        return self._finish(s, binary, ProcessResult(cmd, elapsed=timeout, timeout=timeout, timed_out=True))
+                    await asyncio.sleep(0.01)
+            finally:
+                self._count(binary, "waiting", -1)
+
+            self._count(binary, "running", 1)
+            try:
+                result = await self._run_async(cmd, cwd, env, input, merge_stderr, on_chunk, output_cap, start, deadline)
+                result.timeout = timeout
+            finally:
+                self._count(binary, "running", -1)
+                sem.release()
+            return self._finish(s, binary, result)
+
+    async def _run_async(self, cmd, cwd, env, input, merge_stderr, on_chunk, output_cap, start, deadline):
+        try:
+            proc = await asyncio.create_subprocess_exec(*cmd, **self._popen_args(cwd, env, merge_stderr, input is not None))
+        except FileNotFoundError:
+            return ProcessResult(cmd, code=127, missing=True, elapsed=time.perf_counter() - start)
+
+        output = _Output(output_cap or self.output_cap)
+        timed_out = False
+        try:
+            if input is not None:
+                try:
+                    proc.stdin.write(input.encode("utf-8") if isinstance(input, str) else input)
+                    await proc.stdin.drain()
+                    proc.stdin.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                try:
+                    chunk = await asyncio.wait_for(proc.stdout.read(CHUNK), remaining)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    break
+                if not chunk:
+                    break
+                output.write(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+
+            if not timed_out:
+                try:
+                    await asyncio.wait_for(proc.wait(), max(0.0, deadline - time.perf_counter()))
+                except asyncio.TimeoutError:
+                    timed_out = True
+            if timed_out:
+                await self._kill_async(proc)
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                # reap it now, not from a transport finalizer after the loop closed
+                await proc.wait()
+            ProcessResult(cmd, spill_path=output.finish()[1]).discard()
+            raise
+
+        text, spill_path = output.finish()
+        return ProcessResult(cmd, code=proc.returncode, output=text, bytes_out=output.size,
+                             elapsed=time.perf_counter() - start, timed_out=timed_out, spill_path=spill_path)
+
+    async def _kill_async(self, proc):
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+            await asyncio.wait_for(proc.wait(), self.kill_grace)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        except ProcessLookupError:
+            await proc.wait()
+
+    # ---- STREAMING ----
+
+    def stream(self, cmd, cwd=None, env=None, timeout=None):
+        """
+        Returns a generator of decoded output lines of cmd.
+        The process starts on the first next(), so a generator that is
+        never iterated never leaves a process behind; closing it (or the
+        timeout, if given) kills the process.
+        Raises FileNotFoundError right away if the CLI is not installed.
+        """
+        if shutil.which(cmd[0], path=(env or os.environ).get("PATH")) is None:
+            raise FileNotFoundError(errno.ENOENT, "command not found", cmd[0])
+        return self._lines(cmd, cwd, env, timeout)
+
+    def _lines(self, cmd, cwd, env, timeout):
+        proc = subprocess.Popen(
+            cmd, text=True, encoding="utf-8", errors="replace", bufsize=1,
+            **self._popen_args(cwd, env, True, False)
+        )
+        binary = os.path.basename(cmd[0])
+        start = time.perf_counter()
+        timer = None
+        if timeout:
+            timer = threading.Timer(timeout, self._kill, (proc,))
+            timer.daemon = True
+            timer.start()
+
+        size = 0
+        try:
+            for line in proc.stdout:
+                size += len(line)
+                yield line
+        finally:
+            if timer is not None:
+                timer.cancel()
+            # the consumer stopping early is not a failure of the command
+            stopped = proc.poll() is None
+            if stopped:
+                self._kill(proc)
+            proc.stdout.close()
+            proc.wait()
+            elapsed = time.perf_counter() - start
+            timed_out = bool(timeout) and elapsed >= timeout
+            self._record(binary, ProcessResult(cmd, code=0 if stopped and not timed_out else proc.returncode,
+                                               bytes_out=size, elapsed=elapsed, timeout=timeout, timed_out=timed_out))
+
+    # ---- BOOKKEEPING ----
+
+    def _finish(self, s, binary, result):
+        if s is not None:
+            s.set(exit_code=result.code if result.code is not None else -1, bytes_out=result.bytes_out)
+            if result.timed_out:
+                s.set(timed_out=True)
+            if result.spill_path:
+                s.set(spill_path=result.spill_path)
+        self._record(binary, result)
+        return result
+
+    def _count(self, binary, key, n):
+        # counters are bumped from worker threads and the event loop at once
+        with self._stats_lock:
+            self._stats[binary][key] += n
+
+    def _record(self, binary, result):
+        with self._stats_lock:
+            stats = self._stats[binary]
+            stats["runs"] += 1
+            stats["seconds"] += result.elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], result.elapsed)
+            if result.missing:
+                stats["missing"] += 1
+            elif result.timed_out:
+                stats["timeouts"] += 1
+            elif result.code != 0:
+                stats["failures"] += 1
+            if result.spill_path:
+                stats["spilled"] += 1
+        self.history.append(result)
+
+    def stats(self):
+        with self._stats_lock:
+            snapshot = [(binary, dict(s)) for binary, s in self._stats.items()]
+        out = {}
+        for binary, s in snapshot:
+            out[binary] = {
+                **s,
+                "seconds": round(s["seconds"], 3),
+                "max_seconds": round(s["max_seconds"], 3),
+                "limit": self.limits.get(binary, self.concurrency),
+                "timeout": self.timeout_for(binary),
+            }
+        return out
+
+
+_RUNNER = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def get_runner() -> ProcessRunner:
+    """
+    Shared runner for the life of the process, so the concurrency limits
+    hold across every tool and backend.
+    """
+    global _RUNNER
+    if _RUNNER is None:
+        with _RUNNER_LOCK:
+            if _RUNNER is None:
+                _RUNNER = ProcessRunner()
+    return _RUNNER
+
+
+def run_text(cmd, cwd=None, error_tag: str = "exec-error", missing: str = None,
+             timeout=None, env=None, input=None, strip: bool = True) -> str:
+    """
+    The tools' _exec helper on top of the shared runner:
+      - stdout+stderr decoded (and stripped) on success
+      - "[<error_tag>] <output>" on non-zero exit or timeout, and for
+        output over AGENT_PROC_OUTPUT_CAP (use run_output for those)
+      - missing-binary message if the CLI is not installed
+    """
+    result = get_runner().run(cmd, cwd=cwd, env=env, timeout=timeout, input=input)
+    try:
+        return result.text(error_tag, missing, strip)
+    finally:
+        result.discard()
+
+
+async def run_text_async(cmd, cwd=None, error_tag: str = "exec-error", missing: str = None,
+                         timeout=None, env=None, input=None, strip: bool = True) -> str:
+    result = await get_runner().run_async(cmd, cwd=cwd, env=env, timeout=timeout, input=input)
+    try:
+        return result.text(error_tag, missing, strip)
+    finally:
+        result.discard()
@@ -1,7 +1,11 @@
 # agent/core/router.py
 
+from agent.core.async_exec import run_sync
 from agent.core.planner import Planner
-from agent.core.executor import Executor
+from agent.core.executor import Executor, is_failed_result
+from agent.core.logger import get_logger
+from agent.core.metrics import get_metrics
+from agent.core.tracing import span
 
 
 class Router:
@@ -17,26 +21,46 @@ class Router:
         result
 
     This is the agent control loop for DevOps tasks.
+
+    process_async() lets one process serve many concurrent queries
+    (e.g. from the REST API); process() is a thin sync wrapper over it.
+
+    With stream=True, LLM summaries come back as a TokenStream.
+
+    Every query is one trace: a root "query" span with the workflow, tool
+    calls, subprocesses and HTTP requests nested under it (see tracing.py).
+    Finished spans and errors go to logs/*.log through the shared logger,
+    and are counted in the shared metrics registry (GET /metrics).
     """
 
-    def __init__(self, model):
+    def __init__(self, model, stream: bool = False):
         self.model = model
         self.planner = Planner(model)
-        self.executor = Executor(model)
+        self.executor = Executor(model, stream=stream)
+        self.log = get_logger()
+        self.metrics = get_metrics()
 
     def process(self, user_query: str):
+        return run_sync(self.process_async(user_query))
+
+    async def process_async(self, user_query: str):
         if not user_query or not isinstance(user_query, str):
             return "❌ Invalid query."
 
-        try:
-            # 1) create execution plan
-            plan = self.planner.create_plan(user_query)
-
-            # 2) execute workflow based on plan
-            result = self.executor.run(plan)
+        with span("query", "query", query=user_query[:80]) as s:
+            try:
+                # 1) create execution plan
+                plan = await self.planner.create_plan_async(user_query)
+                if s is not None:
+                    s.set(intent=plan.get("intent"))
 
-            return result
+                # 2) execute workflow based on plan
+                result = await self.executor.run_async(plan)
+                if s is not None and isinstance(result, str) and is_failed_result(result):
+                    s.set(error=result[:60])
 
-        except Exception as e:
-            return f"💥 Router error: {str(e)}"
+                return result
 
+            except Exception as e:
+                self.log.error("query.error", query=user_query, error=str(e), type=type(e).__name__)
+                return f"💥 Router error: {str(e)}"
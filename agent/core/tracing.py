@@ -0,0 +1,387 @@
+# agent/core/tracing.py
+
+import os
+import re
+import time
+import inspect
+import itertools
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+
+# latency buckets (ms) for the local histograms
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_CURRENT = contextvars.ContextVar("agent_span", default=None)
+_IDS = itertools.count(1)
+
+
+class Span:
+    """
+    One timed hop: a query, workflow, tool call, subprocess or HTTP request.
+
+    attrs carry the details (command / URL template, bytes in/out, exit
+    code, status, cache hit). Children are the hops made inside it.
+    """
+
+    __slots__ = ("name", "kind", "attrs", "parent", "children", "span_id", "trace_id", "start", "end", "wall")
+
+    def __init__(self, name, kind, attrs, parent):
+        self.name = name
+        self.kind = kind
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+        self.span_id = next(_IDS)
+        self.trace_id = parent.trace_id if parent else self.span_id
+        self.wall = time.time()
+        self.start = time.perf_counter()
+        self.end = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    @property
+    def duration_ms(self):
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "duration_ms": round(self.duration_ms, 2),
+            "attrs": dict(self.attrs),
+            "children": [c.as_dict() for c in self.children],
+        }
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram (ms).
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """
+        p-th percentile, interpolated inside its bucket (capped at max).
+        """
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                low = BUCKETS_MS[i - 1] if i else 0.0
+                high = min(BUCKETS_MS[i], self.max) if i < len(BUCKETS_MS) else self.max
+                return round(low + (high - low) * (rank - seen) / n, 2)
+            seen += n
+        return round(self.max, 2)
+
+
+class Tracer:
+    """
+    In-process tracing for the agent.
+
+    Supports:
+      - span(name, kind, **attrs)   nested via contextvars, so spans made in
+                                    fan-out tasks / threads land under the
+                                    query that started them
+      - annotate(**attrs)           add details to the current span
+      - histograms per (kind, name) and summary() p50/p95/p99
+      - active[kind]                spans currently open (in-flight calls)
+      - last N query traces, render() as an indented tree
+      - optional OpenTelemetry export of finished query traces
+
+    Kinds: query, workflow, tool, subprocess, http (free-form).
+
+    Config (env):
+        AGENT_TRACING         0 disables spans entirely        (default 1)
+        AGENT_TRACE_KEEP      finished query traces kept        (default 50)
+        AGENT_TRACE_OTEL      1 = export to OpenTelemetry       (default 0)
+                              (uses the OTEL_* env of the SDK / OTLP exporter)
+    """
+
+    def __init__(self, enabled: bool = None, keep: int = None, otel: bool = None):
+        if enabled is None:
+            enabled = os.getenv("AGENT_TRACING", "1") not in ("0", "false", "no")
+        if otel is None:
+            otel = os.getenv("AGENT_TRACE_OTEL", "0") in ("1", "true", "yes")
+        self.enabled = enabled
+        self.traces = deque(maxlen=keep or int(os.getenv("AGENT_TRACE_KEEP", "50")))
+        self.histograms = {}
+        self.active = {}
+        self.listeners = []
+        self._otel = None
+        self._otel_wanted = otel
+        self._lock = threading.Lock()
+
+    # ---- SPANS ----
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attrs):
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _CURRENT.get()
+        span = Span(name, kind, attrs, parent)
+        token = _CURRENT.set(span)
+        with self._lock:
+            self.active[kind] = self.active.get(kind, 0) + 1
+        try:
+            yield span
+        except BaseException as e:
+            span.attrs["error"] = type(e).__name__
+            raise
+        finally:
+            _CURRENT.reset(token)
+            self._finish(span)
+
+    def _finish(self, span):
+        span.end = time.perf_counter()
+        key = (span.kind, span.name)
+        with self._lock:
+            self.active[span.kind] -= 1
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(span.duration_ms)
+
+        if span.parent is not None:
+            span.parent.children.append(span)
+        else:
+            self.traces.append(span)
+            if self._otel_wanted:
+                self._export(span)
+
+        for listener in self.listeners:
+            listener(span)
+
+    # ---- REPORTING ----
+
+    def summary(self, kind: str = None):
+        """
+        [{kind, name, count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms, total_ms}]
+        slowest total first.
+        """
+        with self._lock:
+            items = list(self.histograms.items())
+        rows = []
+        for (k, name), h in items:
+            if kind and k != kind:
+                continue
+            rows.append({
+                "kind": k, "name": name, "count": h.count,
+                "mean_ms": round(h.total / h.count, 2),
+                "p50_ms": h.percentile(50), "p95_ms": h.percentile(95), "p99_ms": h.percentile(99),
+                "max_ms": round(h.max, 2), "total_ms": round(h.total, 1),
+            })
+        return sorted(rows, key=lambda r: -r["total_ms"])
+
+    def last_trace(self):
+        return self.traces[-1] if self.traces else None
+
+    def render(self, span: Span = None) -> str:
+        """
+        query "scale api" 412.3ms
+          workflow scale 410.9ms (99%)
+            tool k8s.scale 402.1ms (97%)
+              subprocess kubectl scale deployment 401.7ms (97%) exit_code=0 bytes_out=27
+        """
+        span = span or self.last_trace()
+        if span is None:
+            return "(no traces)"
+
+        root_ms = span.duration_ms or 1e-9
+        lines = []
+
+        def walk(s, depth):
+            attrs = " ".join(f"{k}={v}" for k, v in s.attrs.items() if k != "query")
+            share = "" if s is span else f" ({s.duration_ms / root_ms:.0%})"
+            label = f'"{s.attrs["query"]}"' if "query" in s.attrs else s.name
+            lines.append(f"{'  ' * depth}{s.kind} {label} {s.duration_ms:.1f}ms{share} {attrs}".rstrip())
+            for child in sorted(s.children, key=lambda c: c.start):
+                walk(child, depth + 1)
+
+        walk(span, 0)
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.traces.clear()
+
+    # ---- OPENTELEMETRY ----
+
+    def _otel_tracer(self):
+        if self._otel is None:
+            try:
+                from opentelemetry import trace
+                from opentelemetry.sdk.trace import TracerProvider
+                from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            except ImportError:
+                self._otel_wanted = False
+                return None
+
+            provider = trace.get_tracer_provider()
+            if not isinstance(provider, TracerProvider):
+                provider = TracerProvider()
+                try:
+                    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+                except ImportError:
+                    from opentelemetry.sdk.trace.export import ConsoleSpanExporter as OTLPSpanExporter
+                provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+                trace.set_tracer_provider(provider)
+            self._otel = trace.get_tracer("agent")
+        return self._otel
+
+    def _export(self, root):
+        """
+        Replays a finished query trace into OpenTelemetry with the
+        recorded timestamps (done once per query, off the hot path).
+        """
+        tracer = self._otel_tracer()
+        if tracer is None:
+            return
+        from opentelemetry import trace
+
+        offset = root.wall - root.start
+
+        def emit(span, context):
+            otel_span = tracer.start_span(
+                f"{span.kind} {span.name}", context=context,
+                start_time=int((span.start + offset) * 1e9),
+                attributes={k: v if isinstance(v, (str, int, float, bool)) else str(v)
+                            for k, v in span.attrs.items()},
+            )
+            child_context = trace.set_span_in_context(otel_span)
+            for child in span.children:
+                emit(child, child_context)
+            otel_span.end(end_time=int((span.end + offset) * 1e9))
+
+        emit(root, None)
+
+
+_TRACER = None
+_TRACER_LOCK = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    global _TRACER
+    if _TRACER is None:
+        with _TRACER_LOCK:
+            if _TRACER is None:
+                _TRACER = Tracer()
+    return _TRACER
+
+
+def span(name: str, kind: str = "internal", **attrs):
+    return get_tracer().span(name, kind, **attrs)
+
+
+def current_span():
+    return _CURRENT.get()
+
+
+def annotate(**attrs):
+    """
+    Adds attributes to the current span, if any (e.g. cache="hit").
+    """
+    current = _CURRENT.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+# ---- TEMPLATES ----
+
+_ID_SEGMENT = re.compile(r"^([0-9]+|[0-9a-f]{7,}|[0-9a-f-]{36})$", re.IGNORECASE)
+
+
+def url_template(url: str) -> str:
+    """
+    "https://api.github.com/repos/x/y/actions/runs/123?per_page=5"
+        → "api.github.com/repos/x/y/actions/runs/{id}"
+    """
+    rest = url.split("://", 1)[-1].split("?", 1)[0]
+    host, _, path = rest.partition("/")
+    parts = ["{id}" if _ID_SEGMENT.match(p) else p for p in path.split("/")]
+    return f"{host}/{'/'.join(parts)}".rstrip("/")
+
+
+def command_template(cmd) -> str:
+    """
+    ["kubectl", "get", "pods", "-n", "prod", "-o", "wide"] → "kubectl get pods"
+    Binary plus its leading sub-commands; flags and values are dropped.
+    """
+    if isinstance(cmd, str):
+        cmd = cmd.split()
+    words = [os.path.basename(cmd[0])] if cmd else []
+    for arg in cmd[1:3]:
+        if arg.startswith("-") or "/" in arg or "=" in arg or "." in arg:
+            break
+        words.append(arg)
+    return " ".join(words)
+
+
+# ---- INSTRUMENTED CALLS ----
+
+class TracedTool:
+    """
+    Wraps a tool instance so every public method call is a "tool" span
+    ("k8s.get_pods"). Built by the ToolContainer when tracing is on.
+    """
+
+    def __init__(self, name, tool):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_tool", tool)
+
+    def __getattr__(self, attr):
+        value = getattr(self._tool, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+
+        name = f"{self._name}.{attr}"
+
+        if inspect.iscoroutinefunction(value):
+            async def traced_async(*args, **kwargs):
+                with span(name, "tool") as s:
+                    return _record(s, await value(*args, **kwargs))
+            return traced_async
+
+        def traced(*args, **kwargs):
+            with span(name, "tool") as s:
+                return _record(s, value(*args, **kwargs))
+        return traced
+
+    def __setattr__(self, attr, value):
+        setattr(self._tool, attr, value)
+
+    def __repr__(self):
+        return f"TracedTool({self._name}, {self._tool!r})"
+
+
+def _record(s, result):
+    if s is not None and isinstance(result, (str, bytes)):
+        s.attrs["bytes_in"] = len(result)
+        if isinstance(result, str) and result.startswith("[") and ("error" in result[:40] or "not-installed" in result[:40]):
+            s.attrs["error"] = result[1:result.find("]")]
+    return result
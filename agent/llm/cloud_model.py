@@ -2,6 +2,9 @@
 
 import os
 
+from agent.core.metrics import estimate_tokens, get_metrics
+from agent.llm.streaming import TokenStream
+
 class CloudModel:
     """
     Cloud LLM for reasoning + planning + explanation.
@@ -24,33 +27,41 @@ class CloudModel:
         self.provider = os.getenv("CLOUD_LLM_PROVIDER", "anthropic").lower()
         self.model = os.getenv("CLOUD_LLM_MODEL", "claude-3-sonnet")
 
-        # lazy SDK setup
-        self._setup_provider()
+        # SDK is imported / client built on the first generate() call
+        self._client = None
+        self._ready = False
+
+    @property
+    def client(self):
+        if not self._ready:
+            self._setup_provider()
+            self._ready = True
+        return self._client
 
     def _setup_provider(self):
         if self.provider == "anthropic":
             try:
                 import anthropic
-                self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+                self._client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
             except ImportError:
-                self.client = None
+                self._client = None
 
         elif self.provider == "openai":
             try:
                 import openai
-                self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                self._client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             except ImportError:
-                self.client = None
+                self._client = None
 
         elif self.provider == "cohere":
             try:
                 import cohere
-                self.client = cohere.Client(os.getenv("COHERE_API_KEY"))
+                self._client = cohere.Client(os.getenv("COHERE_API_KEY"))
             except ImportError:
-                self.client = None
+                self._client = None
 
         else:
-            self.client = None
+            self._client = None
 
     def generate(self, prompt: str) -> str:
         """
@@ -71,6 +82,26 @@ class CloudModel:
 
         return f"[unknown-provider:{self.provider}] {prompt}"
 
+    def generate_stream(self, prompt: str) -> TokenStream:
+        """
+        Streaming variant of generate(): yields text chunks as the
+        provider produces them (see TokenStream for TTFT stats).
+        """
+
+        if self.client is None:
+            return TokenStream.of(f"[cloud-disabled] {prompt}")
+
+        if self.provider == "anthropic":
+            return TokenStream(self._counted(prompt, self._stream_anthropic(prompt)))
+
+        if self.provider == "openai":
+            return TokenStream(self._counted(prompt, self._stream_openai(prompt)))
+
+        if self.provider == "cohere":
+            return TokenStream(self._counted(prompt, self._stream_cohere(prompt)))
+
+        return TokenStream.of(f"[unknown-provider:{self.provider}] {prompt}")
+
     # --- Individual Provider Handlers ---
 
     def _call_anthropic(self, prompt: str) -> str:
@@ -80,7 +111,10 @@ class CloudModel:
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=256
             )
-            return response.content[0].text
+            usage = getattr(response, "usage", None)
+            text = response.content[0].text
+            self._count(prompt, text, getattr(usage, "input_tokens", None), getattr(usage, "output_tokens", None))
+            return text
         except Exception as e:
             return f"[anthropic-error] {str(e)}"
 
@@ -91,7 +125,10 @@ class CloudModel:
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=256
             )
-            return response.choices[0].message.content
+            usage = getattr(response, "usage", None)
+            text = response.choices[0].message.content
+            self._count(prompt, text, getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None))
+            return text
         except Exception as e:
             return f"[openai-error] {str(e)}"
 
@@ -102,7 +139,68 @@ class CloudModel:
                 prompt=prompt,
                 max_tokens=200
             )
+            self._count(prompt, response.text)
             return response.text
         except Exception as e:
             return f"[cohere-error] {str(e)}"
 
+    # --- Token Accounting ---
+
+    def _count(self, prompt, text, prompt_tokens=None, completion_tokens=None):
+        """
+        Provider-reported usage when available, else a ~4 chars/token estimate.
+        """
+        get_metrics().record_tokens(
+            self.provider,
+            prompt_tokens or estimate_tokens(prompt),
+            completion_tokens or estimate_tokens(text),
+        )
+
+    def _counted(self, prompt, chunks):
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self._count(prompt, "".join(parts))
+
+    # --- Streaming Provider Handlers ---
+
+    def _stream_anthropic(self, prompt: str):
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=256
+            ) as stream:
+                yield from stream.text_stream
+        except Exception as e:
+            yield f"[anthropic-error] {str(e)}"
+
+    def _stream_openai(self, prompt: str):
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=256,
+                stream=True
+            )
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield f"[openai-error] {str(e)}"
+
+    def _stream_cohere(self, prompt: str):
+        try:
+            response = self.client.generate(
+                model=self.model,
+                prompt=prompt,
+                max_tokens=200,
+                stream=True
+            )
+            for event in response:
+                text = getattr(event, "text", None)
+                if text:
+                    yield text
+        except Exception as e:
+            yield f"[cohere-error] {str(e)}"
@@ -0,0 +1,362 @@
+# agent/llm/compactor.py
+
+import os
+import re
+import json
+
+from agent.core.cache import is_error_result
+from agent.tools.records import RecordList
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate (~4 chars per token for English / logs / JSON).
+    """
+    return len(text) // 4 + 1 if text else 0
+
+
+_NUMBERS = re.compile(r"0x[0-9a-fA-F]+|[0-9a-fA-F]{8,}|\d+")
+
+# a log line starts with a timestamp, a level, a klog header or a JSON log record
+_LOG_LINE = re.compile(
+    r"^\s*(?:\[?\d{4}-\d{2}-\d{2}[T ]\d|\[?\d{2}:\d{2}:\d{2}|[IWEF]\d{4} \d|[A-Z][a-z]{2} [ \d]\d \d{2}:"
+    r"|\[?(?:TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL|PANIC)\b|\{\s*\"(?:ts|time|timestamp|level|msg)\")",
+    re.IGNORECASE,
+)
+_HEALTHY_PHASES = ("Running", "Succeeded", "Completed")
+
+# fields worth sending to the LLM, per payload shape
+_RUN_FIELDS = ("name", "status", "conclusion", "head_branch", "event", "run_number", "created_at")
+_ALERT_LABELS = ("alertname", "severity", "namespace", "pod", "service", "job")
+_NOISY_KEYS = ("node_id", "_links", "avatar_url", "gravatar_id", "managedFields", "head_commit",
+               "repository", "head_repository", "actor", "triggering_actor", "pull_requests")
+
+
+class CompactionReport:
+    """
+    What the compactor removed, per section, and the tokens it saved.
+    """
+
+    def __init__(self):
+        self.sections = []   # (label, tokens_before, tokens_after, notes)
+
+    def add(self, label, before, after, notes):
+        self.sections.append((label, before, after, notes))
+
+    @property
+    def tokens_before(self):
+        return sum(s[1] for s in self.sections)
+
+    @property
+    def tokens_after(self):
+        return sum(s[2] for s in self.sections)
+
+    @property
+    def tokens_saved(self):
+        return self.tokens_before - self.tokens_after
+
+    def as_dict(self):
+        return {
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "sections": {label: notes for label, _, _, notes in self.sections if notes},
+        }
+
+    def render(self):
+        parts = [f"{label}: {', '.join(notes)}" for label, _, _, notes in self.sections if notes]
+        head = f"[compaction] {self.tokens_before} → {self.tokens_after} tokens (saved {self.tokens_saved})"
+        return head + (f" — {'; '.join(parts)}" if parts else "")
+
+
+class ContextCompactor:
+    """
+    Shrinks workflow signals before they are sent to HybridLLM.explain.
+
+    Per section:
+      - kubectl tables / pod lists / Pod records → healthy pods dropped
+      - log text / Loki streams    → repeated lines folded into counts
+      - GitHub runs / alerts / Prometheus vectors → only relevant fields
+      - other JSON                 → noisy keys pruned, long lists cut
+      - token budget per section, then a total budget across sections
+
+    Error strings are passed through untouched.
+
+    Config (env):
+        AGENT_LLM_CONTEXT_BUDGET   total tokens        (default 6000)
+        AGENT_LLM_SECTION_BUDGET   tokens per section  (default 1500)
+    """
+
+    def __init__(self, budget: int = None, section_budget: int = None, budgets: dict = None, max_items: int = 20):
+        self.budget = budget or int(os.getenv("AGENT_LLM_CONTEXT_BUDGET", "6000"))
+        self.section_budget = section_budget or int(os.getenv("AGENT_LLM_SECTION_BUDGET", "1500"))
+        self.budgets = budgets or {}
+        self.max_items = max_items
+
+    # ---- ENTRY ----
+
+    def compact(self, results: dict):
+        """
+        results: label → raw tool result
+        Returns (text, CompactionReport).
+        """
+        report = CompactionReport()
+        sections = {}
+
+        for label, value in results.items():
+            if isinstance(value, RecordList):
+                value = {"summary": value.summary, value.kind: value.as_dicts()} if value.summary else value.as_dicts()
+            raw = value if isinstance(value, str) else self._dump(value)
+            notes = []
+            text = self._compact_value(value, notes)
+            text = self._truncate(text, self.budgets.get(label, self.section_budget), notes)
+            sections[label] = [raw, text, notes]
+
+        self._fit_total(sections)
+
+        for label, (raw, text, notes) in sections.items():
+            report.add(label, estimate_tokens(raw), estimate_tokens(text), notes)
+
+        text = "\n\n".join(f"[{label}]\n{s[1]}" for label, s in sections.items())
+        return text, report
+
+    def _fit_total(self, sections):
+        """
+        Water-filling: small sections keep everything, large ones share
+        what is left of the total budget.
+        """
+        ordered = sorted(sections.values(), key=lambda s: estimate_tokens(s[1]))
+        remaining = self.budget
+        for i, section in enumerate(ordered):
+            share = remaining // (len(ordered) - i)
+            section[1] = self._truncate(section[1], share, section[2])
+            remaining -= estimate_tokens(section[1])
+
+    # ---- DISPATCH BY SHAPE ----
+
+    def _compact_value(self, value, notes):
+        if isinstance(value, str):
+            if is_error_result(value):
+                return value
+            stripped = value.lstrip()
+            if stripped[:1] in ("{", "["):
+                try:
+                    return self._compact_value(json.loads(stripped), notes)
+                except ValueError:
+                    pass
+            if self._is_pod_table(value):
+                return self._compact_pod_table(value, notes)
+            lines = value.splitlines()
+            return self._dedupe_lines(lines, notes, mask=self._is_log(lines))
+
+        if isinstance(value, dict):
+            if "workflow_runs" in value:
+                return self._compact_runs(value["workflow_runs"], notes)
+            if isinstance(value.get("data"), dict) and "result" in value["data"]:
+                return self._compact_loki(value["data"]["result"], notes)
+            if "projects" in value and "totalMonthlyCost" in value:
+                return self._compact_infracost(value, notes)
+            return self._dump(self._prune(value, notes))
+
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            first = value[0]
+            if "phase" in first and "ready" in first:
+                return self._compact_pod_list(value, notes)
+            if "labels" in first and ("startsAt" in first or "annotations" in first):
+                return self._compact_alerts(value, notes)
+            if "metric" in first and ("value" in first or "values" in first):
+                return self._compact_prom(value, notes)
+            if "values" in first and "stream" in first:
+                return self._compact_loki(value, notes)
+
+        if isinstance(value, (list, dict)):
+            return self._dump(self._prune(value, notes))
+        return str(value)
+
+    # ---- PODS ----
+
+    def _is_pod_table(self, text):
+        header = text.split("\n", 1)[0]
+        return header.startswith(("NAME ", "NAMESPACE ")) and "READY" in header and "STATUS" in header
+
+    def _compact_pod_table(self, text, notes):
+        lines = text.splitlines()
+        header = lines[0].split()
+        ready_i = header.index("READY")
+        status_i = header.index("STATUS")
+        restarts_i = header.index("RESTARTS") if "RESTARTS" in header else None
+
+        kept = [lines[0]]
+        dropped = 0
+        for line in lines[1:]:
+            cols = line.split()
+            if len(cols) <= status_i:
+                kept.append(line)
+                continue
+            ready = cols[ready_i].split("/")
+            restarts = cols[restarts_i] if restarts_i is not None and len(cols) > restarts_i else "0"
+            healthy = (
+                cols[status_i] == "Completed"
+                or (cols[status_i] == "Running" and len(ready) == 2 and ready[0] == ready[1] and restarts == "0")
+            )
+            if healthy:
+                dropped += 1
+            else:
+                kept.append(line)
+
+        if dropped:
+            notes.append(f"dropped {dropped} healthy pods")
+        if len(kept) == 1:
+            kept.append(f"(all {dropped} pods healthy)")
+        return "\n".join(kept)
+
+    def _compact_pod_list(self, pods, notes):
+        unhealthy = []
+        for p in pods:
+            ready = str(p.get("ready", "")).split("/")
+            healthy = p.get("phase") in _HEALTHY_PHASES and not p.get("reason") and (
+                p.get("phase") != "Running"
+                or (len(ready) == 2 and ready[0] == ready[1] and not p.get("restarts"))
+            )
+            if not healthy:
+                unhealthy.append({k: p.get(k) for k in ("cluster", "namespace", "name", "phase", "ready", "restarts", "reason", "node")
+                                  if k not in ("cluster", "reason") or p.get(k)})
+
+        dropped = len(pods) - len(unhealthy)
+        if dropped:
+            notes.append(f"dropped {dropped} healthy pods")
+        if not unhealthy:
+            return f"(all {len(pods)} pods healthy)"
+        return self._dump(unhealthy)
+
+    # ---- LOGS ----
+
+    def _is_log(self, lines, sample=50):
+        """
+        Most of the first non-empty lines look like log lines.
+        """
+        head = [line for line in lines[:sample * 2] if line.strip()][:sample]
+        return bool(head) and sum(1 for line in head if _LOG_LINE.match(line)) * 2 >= len(head)
+
+    def _dedupe_lines(self, lines, notes, mask=True):
+        """
+        mask: fold lines that differ only in numbers / ids (log lines);
+        otherwise (tables, describe output) only exact repeats are folded.
+        """
+        groups = {}
+        for line in lines:
+            line = line.rstrip()
+            if not line:
+                continue
+            key = _NUMBERS.sub("#", line) if mask else line
+            if key in groups:
+                groups[key][0] += 1
+            else:
+                groups[key] = [1, line]
+
+        total = sum(g[0] for g in groups.values())
+        if total > len(groups):
+            notes.append(f"folded {total} lines into {len(groups)} distinct")
+            return "\n".join(
+                f"x{count} {line}" if count > 1 else line
+                for count, line in groups.values()
+            )
+        return "\n".join(g[1] for g in groups.values())
+
+    def _compact_loki(self, streams, notes):
+        lines = []
+        for stream in streams:
+            for entry in stream.get("values", []):
+                lines.append(entry[1] if len(entry) > 1 else str(entry))
+        notes.append(f"extracted {len(lines)} log lines from {len(streams)} streams")
+        if not lines:
+            return "(no log lines)"
+        return self._dedupe_lines(lines, notes)
+
+    # ---- CI/CD ----
+
+    def _compact_runs(self, runs, notes):
+        kept = [{k: r.get(k) for k in _RUN_FIELDS if r.get(k) is not None} for r in runs[:self.max_items]]
+        notes.append(f"kept {len(_RUN_FIELDS)} fields of {len(kept)}/{len(runs)} runs")
+        return self._dump(kept)
+
+    # ---- ALERTS / METRICS ----
+
+    def _compact_alerts(self, alerts, notes):
+        kept = []
+        for a in alerts[:self.max_items]:
+            labels = a.get("labels", {})
+            item = {k: labels[k] for k in _ALERT_LABELS if k in labels}
+            summary = (a.get("annotations") or {}).get("summary")
+            if summary:
+                item["summary"] = summary
+            state = (a.get("status") or {}).get("state")
+            if state:
+                item["state"] = state
+            kept.append(item)
+        notes.append(f"kept alert labels/summary for {len(kept)}/{len(alerts)} alerts")
+        return self._dump(kept)
+
+    def _compact_prom(self, vector, notes):
+        kept = []
+        for sample in vector[:self.max_items]:
+            value = sample.get("value") or (sample.get("values") or [[None, None]])[-1]
+            kept.append({**sample.get("metric", {}), "value": value[1] if len(value) > 1 else value})
+        if len(vector) > len(kept):
+            notes.append(f"kept {len(kept)}/{len(vector)} series")
+        return self._dump(kept)
+
+    # ---- COST ----
+
+    def _compact_infracost(self, data, notes):
+        resources = []
+        for project in data.get("projects", []):
+            for r in (project.get("breakdown") or {}).get("resources", []):
+                resources.append({"name": r.get("name"), "monthlyCost": r.get("monthlyCost")})
+        resources.sort(key=lambda r: float(r["monthlyCost"] or 0), reverse=True)
+
+        out = {
+            "totalMonthlyCost": data.get("totalMonthlyCost"),
+            "pastTotalMonthlyCost": data.get("pastTotalMonthlyCost"),
+            "diffTotalMonthlyCost": data.get("diffTotalMonthlyCost"),
+            "top_resources": resources[:self.max_items],
+        }
+        notes.append(f"kept totals + top {len(out['top_resources'])}/{len(resources)} resources")
+        return self._dump(out)
+
+    # ---- GENERIC JSON ----
+
+    def _prune(self, value, notes, depth=0):
+        if isinstance(value, dict):
+            pruned = {}
+            for k, v in value.items():
+                if k in _NOISY_KEYS or k.endswith("_url") or v in (None, "", [], {}):
+                    continue
+                pruned[k] = self._prune(v, notes, depth + 1)
+            if depth == 0 and len(pruned) < len(value):
+                notes.append(f"pruned {len(value) - len(pruned)} fields")
+            return pruned
+        if isinstance(value, list):
+            if len(value) > self.max_items:
+                notes.append(f"kept {self.max_items}/{len(value)} items")
+                value = value[:self.max_items]
+            return [self._prune(v, notes, depth + 1) for v in value]
+        return value
+
+    # ---- BUDGET ----
+
+    def _truncate(self, text, budget, notes):
+        if estimate_tokens(text) <= budget:
+            return text
+        cut = text[:max(0, budget * 4)]
+        nl = cut.rfind("\n")
+        if nl > len(cut) // 2:
+            cut = cut[:nl]
+        notes.append(f"truncated to ~{budget} tokens")
+        return f"{cut}\n... [truncated {estimate_tokens(text) - estimate_tokens(cut)} tokens]"
+
+    def _dump(self, value):
+        try:
+            return json.dumps(value, separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            return str(value)
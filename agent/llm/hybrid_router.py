@@ -1,7 +1,13 @@
 # agent/llm/hybrid_router.py
 
+import os
+import time
+
+from agent.core.metrics import get_metrics
 from agent.llm.cloud_model import CloudModel
 from agent.llm.local_model import LocalModel
+from agent.llm.prompt_cache import PromptCache
+from agent.llm.streaming import TokenStream
 
 
 class HybridLLM:
@@ -10,12 +16,26 @@ class HybridLLM:
 
     Cloud Model = reasoning, planning, summarization, debugging
     Local Model = parsing, execution details, logs, output transforms
+
+    Responses are served from PromptCache when LLM_CACHE_ENABLED=1.
+    Every response is counted in the agent metrics (latency, TTFT and
+    cache result per provider).
+
+    *_stream variants return a TokenStream (chunks as they arrive,
+    with time-to-first-token) for progressive rendering.
     """
 
-    def __init__(self):
+    def __init__(self, cache: PromptCache = None):
         self.cloud = CloudModel()
         self.local = LocalModel()
 
+        if cache is None and os.getenv("LLM_CACHE_ENABLED", "0") in ("1", "true", "yes"):
+            cache = PromptCache()
+        self.cache = cache
+        self.metrics = get_metrics()
+        if cache is not None:
+            self.metrics.register_cache("prompt", cache.stats)
+
     # ---------- HIGH LEVEL ----------
 
     def plan(self, text: str) -> str:
@@ -27,14 +47,22 @@ class HybridLLM:
             - "explain pipeline failure"
         """
         prompt = f"Plan the following DevOps request: {text}"
-        return self.cloud.generate(prompt)
+        return self._generate(self.cloud, self.cloud.provider, prompt)
 
     def explain(self, text: str) -> str:
         """
         Cloud explanation/summarization for logs and CI/CD outputs.
         """
         prompt = f"Explain this in simple language:\n{text}"
-        return self.cloud.generate(prompt)
+        return self._generate(self.cloud, self.cloud.provider, prompt)
+
+    def plan_stream(self, text: str) -> TokenStream:
+        prompt = f"Plan the following DevOps request: {text}"
+        return self._stream(self.cloud, self.cloud.provider, prompt)
+
+    def explain_stream(self, text: str) -> TokenStream:
+        prompt = f"Explain this in simple language:\n{text}"
+        return self._stream(self.cloud, self.cloud.provider, prompt)
 
     # ---------- EXECUTION SIDE ----------
 
@@ -48,15 +76,56 @@ class HybridLLM:
             - log analysis
         """
         prompt = f"Execute/parse: {text}"
-        return self.local.generate(prompt)
+        return self._generate(self.local, self.local.backend, prompt)
+
+    def execute_stream(self, text: str) -> TokenStream:
+        prompt = f"Execute/parse: {text}"
+        return self._stream(self.local, self.local.backend, prompt)
 
     def parse_logs(self, logs: str) -> str:
         prompt = f"Parse logs:\n{logs}"
-        return self.local.generate(prompt)
+        return self._generate(self.local, self.local.backend, prompt)
 
     def parse_error(self, error: str) -> str:
         prompt = f"Parse error message:\n{error}"
-        return self.local.generate(prompt)
+        return self._generate(self.local, self.local.backend, prompt)
+
+    # ---------- CACHE ----------
+
+    def _generate(self, llm, provider: str, prompt: str) -> str:
+        if self.cache is not None:
+            cached = self.cache.get(provider, llm.model, prompt)
+            if cached is not None:
+                self.metrics.record_llm(provider, llm.model, cache="hit")
+                return cached
+
+        start = time.perf_counter()
+        response = llm.generate(prompt)
+        self.metrics.record_llm(provider, llm.model, time.perf_counter() - start,
+                                cache="off" if self.cache is None else "miss")
+
+        if self.cache is not None:
+            self.cache.put(provider, llm.model, prompt, response)
+        return response
+
+    def _stream(self, llm, provider: str, prompt: str) -> TokenStream:
+        if self.cache is not None:
+            cached = self.cache.get(provider, llm.model, prompt)
+            if cached is not None:
+                self.metrics.record_llm(provider, llm.model, cache="hit")
+                return TokenStream.of(cached)
+
+        stream = llm.generate_stream(prompt)
+        cache = "off" if self.cache is None else "miss"
+
+        def on_complete(text):
+            self.metrics.record_llm(provider, llm.model, stream.elapsed, cache=cache, ttft=stream.ttft)
+            # text before a mid-stream "[anthropic-error]" is a partial answer
+            if self.cache is not None and not stream.failed:
+                self.cache.put(provider, llm.model, prompt, text)
+
+        stream.on_complete = on_complete
+        return stream
 
     # ---------- HYBRID LOOP (AGENT STYLE) ----------
 
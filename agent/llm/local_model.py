@@ -1,7 +1,10 @@
 # agent/llm/local_model.py
 
 import os
-import requests
+import json
+from agent.core.http_pool import get_http_client
+from agent.core.metrics import estimate_tokens, get_metrics
+from agent.llm.streaming import TokenStream
 
 class LocalModel:
     """
@@ -18,6 +21,10 @@ class LocalModel:
         - qwen2
         - mistral
         - codellama
+
+    Config (env):
+        OLLAMA_HOST         server URL                     (default http://localhost:11434)
+        OLLAMA_TIMEOUT      read timeout per request, sec  (default 120)
     """
 
     def __init__(self):
@@ -25,6 +32,16 @@ class LocalModel:
         self.model = os.getenv("LOCAL_LLM_MODEL", "llama3")
         self.host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
+        # generation on CPU, or the first call that loads the model, takes
+        # far longer than the pool's 30s default read timeout
+        self.timeout = (
+            float(os.getenv("AGENT_HTTP_CONNECT_TIMEOUT", "3.05")),
+            float(os.getenv("OLLAMA_TIMEOUT", "120")),
+        )
+
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     def generate(self, prompt: str) -> str:
         """
         Unified interface for local inference.
@@ -35,19 +52,85 @@ class LocalModel:
 
         return f"[local-disabled, backend={self.backend}] {prompt}"
 
+    def generate_stream(self, prompt: str) -> TokenStream:
+        """
+        Streaming variant of generate(): yields tokens as Ollama emits them.
+        """
+
+        if self.backend == "ollama":
+            return TokenStream(self._stream_ollama(prompt))
+
+        return TokenStream.of(f"[local-disabled, backend={self.backend}] {prompt}")
+
+    # --- TOKEN ACCOUNTING ---
+
+    def _count(self, prompt, text, prompt_tokens=None, completion_tokens=None):
+        """
+        Ollama's prompt_eval_count / eval_count when present, else ~4 chars/token.
+        """
+        get_metrics().record_tokens(
+            self.backend,
+            prompt_tokens or estimate_tokens(prompt),
+            completion_tokens or estimate_tokens(text),
+        )
+
     # --- OLLAMA CALL ---
 
     def _call_ollama(self, prompt: str) -> str:
         payload = {
             "model": self.model,
-            "prompt": prompt
+            "prompt": prompt,
+            "stream": False     # /api/generate streams NDJSON by default
         }
 
         try:
-            resp = requests.post(f"{self.host}/api/generate", json=payload)
+            resp = self.http.post(f"{self.host}/api/generate", json=payload, timeout=self.timeout)
             if resp.status_code == 200:
-                return resp.json().get("response", "").strip()
+                body = resp.json()
+                text = body.get("response", "").strip()
+                self._count(prompt, text, body.get("prompt_eval_count"), body.get("eval_count"))
+                return text
             return f"[ollama-error:{resp.status_code}] {resp.text}"
         except Exception as e:
             return f"[ollama-connection-error] {str(e)}"
 
+    def _stream_ollama(self, prompt: str):
+        """
+        /api/generate with stream=true returns one JSON object per line:
+          {"response": "<token>", "done": false} ... {"done": true}
+        """
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True
+        }
+
+        try:
+            resp = self.http.post(f"{self.host}/api/generate", json=payload, stream=True, timeout=self.timeout)
+        except Exception as e:
+            yield f"[ollama-connection-error] {str(e)}"
+            return
+
+        parts = []
+        try:
+            if resp.status_code != 200:
+                yield f"[ollama-error:{resp.status_code}] {resp.text}"
+                return
+
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get("error"):
+                    yield f"[ollama-error] {event['error']}"
+                    return
+                if event.get("response"):
+                    parts.append(event["response"])
+                    yield event["response"]
+                if event.get("done"):
+                    self._count(prompt, "".join(parts), event.get("prompt_eval_count"), event.get("eval_count"))
+                    return
+        except Exception as e:
+            yield f"[ollama-connection-error] {str(e)}"
+        finally:
+            resp.close()
@@ -0,0 +1,212 @@
+# agent/llm/prompt_cache.py
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+
+from agent.core.cache import is_error_result
+
+
+# ---- NORMALIZATION ----
+#
+# Volatile tokens that change between otherwise identical prompts
+# (timestamps, pod name hashes, IPs, ids) are replaced by
+# placeholders before hashing, so repeated health checks hit the cache.
+
+_VOLATILE = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"), "<ts>"),
+    (re.compile(r"\b\d{2}:\d{2}:\d{2}(?:\.\d+)?\b"), "<time>"),
+    (re.compile(r"\b1\d{9}(?:\d{3}|\d{6}|\d{9})?\b"), "<epoch>"),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I), "<uuid>"),
+    (re.compile(r"\b(?:sha256:)?[0-9a-f]{32,64}\b"), "<hex>"),
+    (re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}(?::\d+)?\b"), "<ip>"),
+    # deployment pods: name-<replicaset hash>-<5 char suffix>
+    (re.compile(r"\b([a-z0-9][a-z0-9-]*?)-[a-z0-9]{8,10}-[a-z0-9]{5}\b"), r"\1-<pod>"),
+]
+
+# approximate mode only: ids that are still volatile after normalization.
+# Small numbers (replicas, restarts, status codes, ports) are kept, so
+# "scale to 3" and "scale to 30" or a 404 and a 500 never share an answer.
+_SHAPE = [
+    # short hashes: git / image digests, container ids (letters and digits)
+    (re.compile(r"\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{7,31}\b"), "<id>"),
+    # replicaset / job / statefulset-less pod suffixes: name-5d8c7b9f4 / name-x7k2p
+    (re.compile(r"\b([a-z][a-z0-9-]*?)-(?=[a-z0-9]*\d)[a-z0-9]{5,10}\b"), r"\1-<id>"),
+    # resource versions, byte counts, pids
+    (re.compile(r"\b\d{5,}\b"), "<n>"),
+    # kubectl AGE column: 5m, 3h12m, 2d. Also matches CPU millicores
+    # ("100m"), so only the approximate key may fold it
+    (re.compile(r"\b\d+[smhd](?:\d+[smh])?\b"), "<age>"),
+]
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    for pattern, repl in _VOLATILE:
+        prompt = pattern.sub(repl, prompt)
+    return _SPACE.sub(" ", prompt).strip()
+
+
+def shape_prompt(prompt: str) -> str:
+    """
+    Coarser key for approximate mode: short hashes, generated name
+    suffixes and long numbers are masked too, so prompts that differ only
+    in ids collide. Small numbers stay part of the key.
+    """
+    prompt = normalize_prompt(prompt)
+    for pattern, repl in _SHAPE:
+        prompt = pattern.sub(repl, prompt)
+    return prompt
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """
+    Persistent on-disk LLM response cache (sqlite).
+
+    Key = provider + model + normalized prompt.
+
+    Supports:
+      - TTL per entry
+      - size bound (bytes) with least-recently-used eviction
+      - approximate mode: on an exact miss, reuse the newest answer whose
+        prompt has the same shape (differs only in ids, not in counts
+        or status codes)
+      - error responses ("[openai-error] ...") are never stored
+
+    Config (env):
+        LLM_CACHE_ENABLED       1 to enable in HybridLLM      (default 0)
+        LLM_CACHE_PATH          sqlite file                   (default ~/.cache/agent-ai/llm_cache.sqlite3)
+        LLM_CACHE_TTL           seconds                       (default 3600)
+        LLM_CACHE_MAX_MB        size bound                    (default 64)
+        LLM_CACHE_APPROXIMATE   1 to enable shape matching    (default 0)
+    """
+
+    def __init__(self, path: str = None, ttl: float = None, max_bytes: int = None, approximate: bool = None):
+        self.path = path or os.getenv(
+            "LLM_CACHE_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "agent-ai", "llm_cache.sqlite3")
+        )
+        self.ttl = ttl or float(os.getenv("LLM_CACHE_TTL", "3600"))
+        self.max_bytes = max_bytes or int(float(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024)
+        if approximate is None:
+            approximate = os.getenv("LLM_CACHE_APPROXIMATE", "0") in ("1", "true", "yes")
+        self.approximate = approximate
+
+        self.counters = {"hits": 0, "approx_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " shape TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_shape ON responses (shape, created)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+
+    # ---- KEYS ----
+
+    def keys(self, provider: str, model: str, prompt: str):
+        return (
+            _digest(provider, model, normalize_prompt(prompt)),
+            _digest(provider, model, shape_prompt(prompt)),
+        )
+
+    # ---- GET / PUT ----
+
+    def get(self, provider: str, model: str, prompt: str):
+        key, shape = self.keys(provider, model, prompt)
+        now = time.time()
+        fresh = now - self.ttl
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, response FROM responses WHERE key = ? AND created >= ?",
+                (key, fresh)
+            ).fetchone()
+            kind = "hits"
+
+            if row is None and self.approximate:
+                row = self._db.execute(
+                    "SELECT key, response FROM responses WHERE shape = ? AND created >= ?"
+                    " ORDER BY created DESC LIMIT 1",
+                    (shape, fresh)
+                ).fetchone()
+                kind = "approx_hits"
+
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, row[0]))
+            self.counters[kind] += 1
+            return row[1]
+
+    def put(self, provider: str, model: str, prompt: str, response: str):
+        if not isinstance(response, str) or is_error_result(response):
+            return
+        key, shape = self.keys(provider, model, prompt)
+        now = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, shape, response, size, created, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, shape, response, len(response.encode("utf-8")), now, now)
+            )
+            self.counters["stores"] += 1
+            self._evict(now)
+
+    # ---- EVICTION ----
+
+    def _evict(self, now):
+        self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.counters["evictions"] += len(victims)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    # ---- STATS ----
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.counters["hits"] + self.counters["approx_hits"] + self.counters["misses"]
+        hits = self.counters["hits"] + self.counters["approx_hits"]
+        return {
+            **self.counters,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "approximate": self.approximate,
+        }
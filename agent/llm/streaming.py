@@ -0,0 +1,85 @@
+# agent/llm/streaming.py
+
+import re
+import time
+
+
+# providers report a failure mid-stream as its own "[anthropic-error] ..." chunk
+_ERROR_CHUNK = re.compile(r"^\s*\[[\w.-]*error[\w:.-]*\]")
+
+
+class TokenStream:
+    """
+    Iterable of text chunks from a streaming LLM call.
+
+    Tracks:
+      - ttft      seconds from first pull to first chunk (time-to-first-token)
+      - elapsed   seconds until the stream finished
+      - chunks    number of chunks received
+      - text      everything received so far
+      - failed    the provider yielded an error chunk ("[anthropic-error] ...")
+                  or raised mid-stream
+
+    Iterate it to render output progressively; str() drains it and
+    returns the full text, so callers that expect a plain string still work.
+
+    on_complete(text) is called once the stream is fully consumed
+    (used by HybridLLM to fill the prompt cache, unless failed).
+    """
+
+    def __init__(self, chunks, on_complete=None):
+        self._chunks = chunks
+        self.on_complete = on_complete
+        self._parts = []
+        self._done = False
+        self.failed = False
+
+        self.ttft = None
+        self.elapsed = None
+        self.chunks = 0
+
+    def __iter__(self):
+        if self._done:
+            yield from self._parts
+            return
+
+        start = time.monotonic()
+        try:
+            for chunk in self._chunks:
+                if not chunk:
+                    continue
+                if self.ttft is None:
+                    self.ttft = round(time.monotonic() - start, 3)
+                if _ERROR_CHUNK.match(chunk):
+                    self.failed = True
+                self.chunks += 1
+                self._parts.append(chunk)
+                yield chunk
+        except Exception:
+            self.failed = True
+            raise
+
+        self.elapsed = round(time.monotonic() - start, 3)
+        self._done = True
+        if self.on_complete:
+            self.on_complete(self.text)
+
+    @property
+    def text(self):
+        return "".join(self._parts)
+
+    def __str__(self):
+        for _ in self:
+            pass
+        return self.text
+
+    def stats(self):
+        return {"ttft": self.ttft, "elapsed": self.elapsed, "chunks": self.chunks}
+
+    @classmethod
+    def of(cls, text: str):
+        """
+        Single-chunk stream for results that are already complete
+        (cache hits, disabled providers, errors).
+        """
+        return cls(iter([text]))
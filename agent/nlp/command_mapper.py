@@ -7,7 +7,7 @@ class CommandMapper:
         DEPLOY   → deploy
         ROLLBACK → rollback
         DEBUG    → debug
-        LOGS     → logs
+        LOGS     → debug (error digest of the app's logs)
         COST     → cost
         BUILD    → build
         PIPELINE → pipeline_debug
@@ -21,7 +21,7 @@ class CommandMapper:
             "ROLLBACK": "rollback",
             "DEBUG": "debug",
             "BUILD": "build",
-            "LOGS": "logs",
+            "LOGS": "debug",
             "COST": "cost_analysis",
             "PIPELINE": "pipeline_debug",
             "SCALE": "scale",
@@ -0,0 +1,372 @@
+# agent/nlp/gazetteer.py
+
+import os
+import json
+import time
+import threading
+
+from agent.core.process import get_runner
+
+
+# names that exist before any inventory has been loaded
+SEED_ENTITIES = {
+    "app": ["nginx", "api", "backend", "frontend", "mysql", "redis"],
+    "namespace": ["dev", "staging", "prod", "production", "test", "default"],
+    "cluster": ["eks", "aks", "gke", "k3s", "minikube"],
+}
+
+# words that are never an entity name (verbs, fillers, DevOps nouns)
+STOPWORDS = {
+    "please", "can", "you", "the", "a", "an", "to", "in", "on", "for", "of", "from",
+    "and", "then", "with", "my", "our", "me", "is", "are", "was", "why", "what", "how",
+    "show", "check", "get", "list", "tell", "give", "see", "find", "run", "now",
+    "deploy", "deployment", "rollback", "revert", "undo", "scale", "debug", "fix",
+    "logs", "log", "status", "health", "cluster", "clusters", "context", "contexts",
+    "every", "each", "namespace", "service", "pod", "pods",
+    "app", "release", "pipeline", "cost", "build", "image", "replicas", "instances",
+    "restart", "upgrade", "install", "launch", "start", "stop", "tail", "failed",
+    "failing", "crashing", "much", "does", "did", "all", "latest", "version", "up", "down",
+    "it", "its", "them", "their", "this", "that", "also", "after",
+}
+
+_END = object()
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch in "-_"
+
+
+class _Trie:
+    """
+    Character trie of lowercase names → set of kinds.
+    scan() finds the longest known names that start and end on word
+    boundaries, so "dev" does not match inside "devops".
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, name, kind):
+        node = self.root
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node.setdefault(_END, set()).add(kind)
+
+    def remove(self, name, kind):
+        path = [self.root]
+        node = self.root
+        for ch in name:
+            node = node.get(ch)
+            if node is None:
+                return
+            path.append(node)
+
+        kinds = node.get(_END)
+        if not kinds:
+            return
+        kinds.discard(kind)
+        if not kinds:
+            del node[_END]
+
+        # prune empty branches
+        for i in range(len(name) - 1, -1, -1):
+            if path[i + 1]:
+                break
+            del path[i][name[i]]
+
+    def scan(self, text):
+        """
+        Yields (start, end, name, kinds), left to right, longest match first.
+        """
+        i = 0
+        n = len(text)
+        while i < n:
+            if not _is_word(text[i]) or (i > 0 and _is_word(text[i - 1])):
+                i += 1
+                continue
+
+            node = self.root
+            best = None
+            j = i
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node and (j == n or not _is_word(text[j])):
+                    best = (j, node[_END])
+
+            if best:
+                yield i, best[0], text[i:best[0]], set(best[1])
+                i = best[0]
+            else:
+                i += 1
+
+
+class EntityIndex:
+    """
+    Live inventory of entity names for the Parser.
+
+    Kinds:
+      - app        deployments / statefulsets in the cluster
+      - namespace  cluster namespaces
+      - release    Helm releases
+      - cluster    kube contexts
+      - repo       GitHub repositories
+
+    Lookup:
+      - exact: prefix trie scan of the query (word-boundary aware)
+      - fuzzy: rapidfuzz ratio per leftover token, bucketed by first
+               letter so tens of thousands of names stay sub-millisecond
+               (skipped if rapidfuzz is not installed)
+
+    Refresh:
+      refresh() pulls every source and applies only the diff (added /
+      removed names). start() loads once synchronously, then keeps
+      refreshing in a background thread.
+      `version` increases whenever the inventory changes.
+
+      With AGENT_ENTITY_REFRESH=0 (the default) nothing is loaded: the
+      index holds only SEED_ENTITIES and the Parser falls back to its
+      generic extraction for other names. Call refresh() to load once.
+
+    Config (env):
+        AGENT_ENTITY_REFRESH    seconds between background refreshes; 0 = off (default 0)
+        AGENT_ENTITY_FUZZY      rapidfuzz score cutoff 0-100                   (default 85)
+    """
+
+    def __init__(self, sources=None, seeds: dict = None, fuzzy_cutoff: float = None):
+        self.sources = sources if sources is not None else DEFAULT_SOURCES
+        self.fuzzy_cutoff = fuzzy_cutoff or float(os.getenv("AGENT_ENTITY_FUZZY", "85"))
+
+        self.version = 0
+        self.refreshed_at = None
+        self.errors = {}
+
+        self._trie = _Trie()
+        self._names = {}      # kind → set(names) (seeds + live)
+        self._live = {}       # (source, kind) → set(names)
+        self._buckets = {}    # kind → {first char → [names]}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+        for kind, names in (SEED_ENTITIES if seeds is None else seeds).items():
+            self._apply(kind, set(names), set())
+
+    # ---- UPDATES ----
+
+    def _apply(self, kind, added, removed):
+        """
+        Caller holds the lock (or is __init__). The name set is rebuilt
+        and swapped in, never mutated, so names() can copy it lock-free.
+        """
+        names = (self._names.get(kind, set()) | added) - removed
+        for name in added:
+            self._trie.insert(name, kind)
+        for name in removed:
+            self._trie.remove(name, kind)
+        self._names[kind] = names
+
+        # swap in a fresh bucket map so readers never see a half-built one
+        buckets = {}
+        for name in names:
+            buckets.setdefault(name[:1], []).append(name)
+        self._buckets[kind] = buckets
+
+    def replace(self, source: str, kind: str, names):
+        """
+        Sets the names one source reports for a kind; applies only the diff.
+        Returns True if the inventory changed.
+        """
+        new = {str(n).lower() for n in names if n}
+        with self._lock:
+            old = self._live.get((source, kind), set())
+            self._live[(source, kind)] = new
+
+            # a name only disappears when no other source / seed still has it
+            others = set(SEED_ENTITIES.get(kind, ()))
+            for (src, k), other in self._live.items():
+                if k == kind and src != source:
+                    others |= other
+
+            added = new - old
+            removed = (old - new) - others
+            if not added and not removed:
+                return False
+            self._apply(kind, added, removed)
+            self.version += 1
+            return True
+
+    def refresh(self):
+        for name, source in self.sources.items():
+            try:
+                inventory = source()
+            except Exception as e:
+                with self._lock:
+                    self.errors[name] = str(e)
+                continue
+            if inventory is None:
+                continue
+            with self._lock:
+                self.errors.pop(name, None)
+            for kind, names in inventory.items():
+                self.replace(name, kind, names)
+        self.refreshed_at = time.time()
+        return self.version
+
+    # ---- BACKGROUND ----
+
+    def start(self, interval: float = None):
+        interval = interval or float(os.getenv("AGENT_ENTITY_REFRESH", "0"))
+        if interval <= 0 or self._thread is not None:
+            return self
+
+        # first load up front, so the first queries do not see seeds only
+        self.refresh()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.refresh()
+
+        self._thread = threading.Thread(target=loop, name="entity-index", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    # ---- LOOKUP ----
+
+    def find(self, text: str) -> dict:
+        """
+        Exact matches in the query: kind → first matching name.
+        """
+        found = {}
+        for _, _, name, kinds in self._trie.scan(text):
+            for kind in kinds:
+                found.setdefault(kind, name)
+        return found
+
+    def fuzzy(self, token: str, kind: str):
+        """
+        Best typo-tolerant match for a single token, or None.
+        """
+        try:
+            from rapidfuzz import process, fuzz
+        except ImportError:
+            return None
+
+        candidates = self._buckets.get(kind, {}).get(token[:1])
+        if not candidates:
+            return None
+        match = process.extractOne(token, candidates, scorer=fuzz.ratio, score_cutoff=self.fuzzy_cutoff)
+        return match[0] if match else None
+
+    def names(self, kind: str):
+        return set(self._names.get(kind, ()))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "version": self.version,
+                "refreshed_at": self.refreshed_at,
+                "names": {kind: len(names) for kind, names in self._names.items()},
+                "errors": dict(self.errors),
+            }
+
+
+# ---- SOURCES ----
+
+def _run(cmd, timeout):
+    """
+    stdout of a successful, complete run, else None (stderr discarded).
+    """
+    result = get_runner().run(cmd, timeout=timeout, merge_stderr=False)
+    result.discard()
+    return result.output if result.ok and not result.truncated else None
+
+
+def _run_json(cmd):
+    out = _run(cmd, timeout=30)
+    try:
+        return json.loads(out) if out is not None else None
+    except ValueError:
+        return None
+
+
+def kubernetes_source():
+    """
+    apps + namespaces from the cluster (watch cache if running, else kubectl).
+    """
+    from agent.tools.kubernetes_watch_cache import get_watch_cache
+
+    cache = get_watch_cache()
+    deployments = cache.list("deployments") if cache else None
+    if deployments is not None:
+        return {
+            "app": [d["name"] for d in deployments],
+            "namespace": [d["namespace"] for d in deployments],
+        }
+
+    data = _run_json(["kubectl", "get", "deployments,statefulsets", "-A", "-o", "json"])
+    if data is None:
+        return None
+    items = data.get("items", [])
+    return {
+        "app": [i["metadata"]["name"] for i in items],
+        "namespace": [i["metadata"]["namespace"] for i in items],
+    }
+
+
+def helm_source():
+    data = _run_json(["helm", "list", "-A", "-o", "json"])
+    if data is None:
+        return None
+    return {
+        "release": [r.get("name") for r in data],
+        "namespace": [r.get("namespace") for r in data],
+    }
+
+
+def context_source():
+    out = _run(["kubectl", "config", "get-contexts", "-o", "name"], timeout=10)
+    if out is None:
+        return None
+    return {"cluster": out.split()}
+
+
+def github_source():
+    if not os.getenv("GITHUB_TOKEN"):
+        return None
+    from agent.core.container import get_container
+
+    repos = get_container().get("github").list_repos()
+    if not isinstance(repos, list):
+        return None
+    return {"repo": [r.get("name") for r in repos]}
+
+
+DEFAULT_SOURCES = {
+    "kubernetes": kubernetes_source,
+    "helm": helm_source,
+    "contexts": context_source,
+    "github": github_source,
+}
+
+
+_INDEX = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_entity_index() -> EntityIndex:
+    """
+    Shared index; when AGENT_ENTITY_REFRESH > 0 the first call loads the
+    inventory and starts the background refresh, else it holds seeds only.
+    """
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = EntityIndex().start()
+    return _INDEX
@@ -1,74 +1,136 @@
 # agent/nlp/intent_classifier.py
 
+import re
+
+
+# intent → [(keyword or phrase, weight)]
+# Order of intents is the tie-break priority.
+INTENT_KEYWORDS = {
+    "DEPLOY": [
+        ("deploy", 1.0), ("launch", 1.0), ("start", 0.6), ("release", 0.7),
+        ("create deployment", 1.5), ("apply", 0.8), ("install", 0.8),
+    ],
+    "ROLLBACK": [
+        ("rollback", 1.5), ("roll back", 1.5), ("undo", 1.2), ("revert", 1.2),
+        ("previous version", 1.5), ("downgrade", 1.0),
+    ],
+    "DEBUG": [
+        ("debug", 1.2), ("fix", 0.8), ("fail", 1.0), ("error", 0.9), ("why", 0.8),
+        ("troubleshoot", 1.2), ("issue", 0.8), ("crash", 1.0), ("broken", 1.0),
+        ("not working", 1.2), ("crashloop", 1.2), ("oomkilled", 1.2),
+    ],
+    "SCALE": [
+        ("scale", 1.2), ("increase", 0.7), ("decrease", 0.7), ("replicas", 1.0),
+        ("autoscale", 1.2), ("scale up", 1.5), ("scale down", 1.5),
+    ],
+    "BUILD": [
+        ("build", 1.0), ("image", 0.6), ("docker build", 1.5), ("container build", 1.5),
+        ("dockerfile", 1.0),
+    ],
+    "LOGS": [
+        ("logs", 1.2), ("log", 0.9), ("error logs", 1.6), ("kubectl logs", 1.6),
+        ("tail logs", 1.6), ("tail", 0.6),
+    ],
+    "COST": [
+        ("cost", 1.2), ("price", 1.0), ("bill", 1.0), ("billing", 1.2),
+        ("how much", 0.9), ("finops", 1.5), ("spend", 1.0), ("expensive", 1.0),
+    ],
+    "PIPELINE": [
+        ("pipeline", 1.2), ("cicd", 1.2), ("ci/cd", 1.2), ("github actions", 1.5),
+        ("jenkins", 1.2), ("gitlab ci", 1.5), ("workflow", 0.9),
+    ],
+    "STATUS": [
+        ("status", 1.0), ("health", 1.0), ("healthy", 1.0), ("slo", 1.0),
+        ("sli", 1.0), ("uptime", 1.0),
+    ],
+}
+
+# inflected keyword ("failed", "crashing") scores less than the bare word
+INFLECTED_WEIGHT = 0.8
+
+# only these endings count as an inflection: "slo" must not match "slow",
+# nor "log" "login"/"logic"
+INFLECTIONS = r"(s|es|d|ed|ing|ment|ments)?\b"
+
+
 class IntentClassifier:
     """
     Classifies natural language into DevOps intents.
     Example:
-        "deploy nginx"      → DEPLOY
-        "rollback release"  → ROLLBACK
-        "why pipeline fail" → DEBUG
-        "show logs for api" → LOGS
-        "scale app to 5"    → SCALE
-        "how much cost"     → COST
+        "deploy nginx"           → DEPLOY
+        "rollback release"       → ROLLBACK
+        "why pipeline fail"      → DEBUG
+        "show logs for api"      → LOGS
+        "scale app to 5"         → SCALE
+        "how much cost"          → COST
+        "deploy failed, why?"    → DEBUG
+
+    All keywords are compiled into one regex and the query is scanned once.
+    Every intent is scored by weighted keyword hits:
+      - matches must start on a word boundary ("restart" is not "start")
+        and end on one after an optional inflection ("slow" is not "slo")
+      - exact words score full weight, inflections ("failed") less
+      - longer phrases win over their parts ("error logs" vs "error")
+
+    rank() returns all matched intents with confidences (share of the
+    total score); classify() returns the best one or UNKNOWN.
     """
 
+    def __init__(self, keywords: dict = None):
+        self.keywords = keywords or INTENT_KEYWORDS
+        self.priority = {intent: i for i, intent in enumerate(self.keywords)}
+
+        self.table = {}
+        for intent, words in self.keywords.items():
+            for word, weight in words:
+                self.table.setdefault(word, []).append((intent, weight))
+
+        # longest first, so alternation prefers phrases over their parts
+        alternation = "|".join(
+            re.escape(word) for word in sorted(self.table, key=len, reverse=True)
+        )
+        self.pattern = re.compile(rf"\b({alternation}){INFLECTIONS}")
+
+    # ---- SCORING ----
+
+    def scores(self, query: str) -> dict:
+        scores = {}
+        table = self.table
+        for word, suffix in self.pattern.findall(query.lower()):
+            factor = INFLECTED_WEIGHT if suffix else 1.0
+            for intent, weight in table[word]:
+                scores[intent] = scores.get(intent, 0.0) + weight * factor
+        return scores
+
+    def rank(self, query: str) -> list:
+        """
+        [(intent, confidence), ...] best first; confidences sum to 1.
+        """
+        scores = self.scores(query)
+        total = sum(scores.values())
+        if not total:
+            return []
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], self.priority[kv[0]]))
+        return [(intent, round(score / total, 3)) for intent, score in ranked]
+
     def classify(self, query: str) -> str:
-        text = query.lower()
-
-        # ---- DEPLOY ----
-        if any(word in text for word in [
-            "deploy", "launch", "start", "release", "create deployment", "apply"
-        ]):
-            return "DEPLOY"
-
-        # ---- ROLLBACK ----
-        if any(word in text for word in [
-            "rollback", "undo", "revert", "previous version"
-        ]):
-            return "ROLLBACK"
-
-        # ---- DEBUG ----
-        if any(word in text for word in [
-            "debug", "fix", "fail", "error", "why", "troubleshoot", "issue"
-        ]):
-            return "DEBUG"
-
-        # ---- SCALE ----
-        if any(word in text for word in [
-            "scale", "increase", "decrease", "replicas", "autoscale"
-        ]):
-            return "SCALE"
-
-        # ---- BUILD (Docker CI) ----
-        if any(word in text for word in [
-            "build", "image", "docker build", "container build"
-        ]):
-            return "BUILD"
-
-        # ---- LOGS ----
-        if any(word in text for word in [
-            "logs", "error logs", "kubectl logs", "tail logs"
-        ]):
-            return "LOGS"
-
-        # ---- COST / FINOPS ----
-        if any(word in text for word in [
-            "cost", "price", "bill", "billing", "how much", "finops"
-        ]):
-            return "COST"
-
-        # ---- PIPELINE / CI/CD ----
-        if any(word in text for word in [
-            "pipeline", "cicd", "github actions", "jenkins", "gitlab ci", "workflow"
-        ]):
-            return "PIPELINE"
-
-        # ---- STATUS / HEALTH / SRE ----
-        if any(word in text for word in [
-            "status", "health", "slo", "sli", "uptime"
-        ]):
-            return "STATUS"
-
-        # ---- DEFAULT ----
-        return "UNKNOWN"
+        scores = self.scores(query)
+        if not scores:
+            return "UNKNOWN"
+        return min(scores, key=lambda intent: (-scores[intent], self.priority[intent]))
+
+    # ---- BATCH ----
 
+    def classify_many(self, queries) -> list:
+        """
+        Classifies an iterable of queries (e.g. a replayed query log).
+        Repeated queries are scored once.
+        """
+        seen = {}
+        out = []
+        for query in queries:
+            intent = seen.get(query)
+            if intent is None:
+                intent = seen[query] = self.classify(query)
+            out.append(intent)
+        return out
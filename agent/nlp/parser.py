@@ -2,6 +2,11 @@
 
 import re
 
+from agent.nlp.gazetteer import get_entity_index, STOPWORDS
+
+PROVIDERS = ["aws", "gcp", "azure"]
+
+
 class Parser:
     """
     Extracts entities from natural language queries.
@@ -12,20 +17,43 @@ class Parser:
       - image (nginx:1.27)
       - version (v1, v2)
       - cloud provider (aws, gcp, azure)
-      - cluster (eks, aks, gke)
+      - cluster (eks, aks, gke, kube context)
+      - clusters ("all clusters" / "every cluster" → "all")
+      - release (Helm release), repo (GitHub repository)
+
+    Names are resolved against the live EntityIndex (cluster, Helm,
+    kube contexts, repos): exact word-boundary matches first, then
+    typo-tolerant fuzzy matches, then a stopword-aware generic fallback.
     """
 
+    # compiled once for every Parser
+    TOKEN = re.compile(r"[a-z][a-z0-9_-]*")
+    REPLICAS = re.compile(r"(\d+)\s*(replicas?|instances?|pods?)")
+    SCALE_TO = re.compile(r"scale\s*(to)?\s*(\d+)")
+    IMAGE = re.compile(r"([a-z0-9\-]+)/?([a-z0-9\-]+):([a-z0-9\.\-]+)")
+    VERSION = re.compile(r"v[0-9]+(\.[0-9]+)?")
+    VERSION_TOKEN = re.compile(r"v\d+")
+    ALL_CLUSTERS = re.compile(r"\b(all|every|each)\s+(kube\s+)?(clusters?|contexts?)\b")
+
+    def __init__(self, index=None):
+        self.index = index or get_entity_index()
+
     def parse(self, query: str) -> dict:
         text = query.lower()
+        found = self.index.find(text)
+        tokens = self._tokens(text, found)
 
         result = {
-            "app": self._extract_app(text),
+            "app": self._extract_app(text, found, tokens),
             "replicas": self._extract_replicas(text),
-            "namespace": self._extract_namespace(text),
+            "namespace": self._extract_namespace(found, tokens),
             "image": self._extract_image(text),
             "version": self._extract_version(text),
-            "provider": self._extract_provider(text),
-            "cluster": self._extract_cluster(text),
+            "provider": self._extract_provider(tokens),
+            "cluster": found.get("cluster"),
+            "clusters": "all" if self.ALL_CLUSTERS.search(text) else None,
+            "release": found.get("release"),
+            "repo": found.get("repo"),
         }
 
         # remove empty values
@@ -33,58 +61,65 @@ class Parser:
 
     # --- Extractors ---
 
-    def _extract_app(self, text: str):
-        # naive approach for now, later use NER or LLM
-        words = ["nginx", "api", "backend", "frontend", "mysql", "redis"]
-        for w in words:
-            if w in text:
-                return w
-        return self._extract_generic_name(text)
+    def _tokens(self, text: str, found: dict):
+        # candidate name tokens: not filler words, not already matched exactly
+        known = set(found.values())
+        return [
+            t for t in self.TOKEN.findall(text)
+            if t not in STOPWORDS and t not in known
+        ]
+
+    def _fuzzy(self, tokens, *kinds):
+        for t in tokens:
+            if len(t) < 4:
+                continue
+            for kind in kinds:
+                match = self.index.fuzzy(t, kind)
+                if match:
+                    return match
+        return None
+
+    def _extract_app(self, text: str, found: dict, tokens):
+        app = found.get("app") or found.get("release")
+        if app:
+            return app
+        return self._fuzzy(tokens, "app", "release") or self._extract_generic_name(tokens)
 
     def _extract_replicas(self, text: str):
-        match = re.search(r"(\d+)\s*(replicas?|instances?|pods?)", text)
+        match = self.REPLICAS.search(text)
         if match:
             return int(match.group(1))
 
-        match = re.search(r"scale\s*(to)?\s*(\d+)", text)
+        match = self.SCALE_TO.search(text)
         if match:
             return int(match.group(2))
         return None
 
-    def _extract_namespace(self, text: str):
-        for ns in ["dev", "staging", "prod", "production", "test", "default"]:
-            if f"{ns}" in text:
-                return ns
-        return None
+    def _extract_namespace(self, found: dict, tokens):
+        return found.get("namespace") or self._fuzzy(tokens, "namespace")
 
-    def _extract_provider(self, text: str):
-        for cloud in ["aws", "gcp", "azure"]:
-            if cloud in text:
+    def _extract_provider(self, tokens):
+        for cloud in PROVIDERS:
+            if cloud in tokens:
                 return cloud
         return None
 
-    def _extract_cluster(self, text: str):
-        for c in ["eks", "aks", "gke", "k3s", "minikube"]:
-            if c in text:
-                return c
-        return None
-
     def _extract_image(self, text: str):
-        match = re.search(r"([a-z0-9\-]+)/?([a-z0-9\-]+):([a-z0-9\.\-]+)", text)
+        match = self.IMAGE.search(text)
         if match:
             return match.group(0)
         return None
 
     def _extract_version(self, text: str):
-        match = re.search(r"v[0-9]+(\.[0-9]+)?", text)
+        match = self.VERSION.search(text)
         if match:
             return match.group(0)
         return None
 
-    def _extract_generic_name(self, text: str):
-        # generic fallback: first noun-ish piece
-        parts = text.split()
-        for p in parts:
-            if p.isalpha() and len(p) > 2:
-                return p
+    def _extract_generic_name(self, tokens):
+        # generic fallback: first word that is not a filler / known non-app name
+        skip = self.index.names("namespace") | self.index.names("cluster")
+        for t in tokens:
+            if len(t) > 2 and t not in skip and t not in PROVIDERS and not self.VERSION_TOKEN.fullmatch(t):
+                return t
         return None
@@ -0,0 +1,62 @@
+# agent/nlp/splitter.py
+
+import re
+
+from agent.nlp.intent_classifier import IntentClassifier
+
+
+class QuerySplitter:
+    """
+    Splits compound requests into clauses, one per intent.
+    Example:
+        "scale api to 5 and show logs for backend in prod"
+            → [("scale api to 5", False), ("show logs for backend in prod", False)]
+        "deploy api then show its logs"
+            → [("deploy api", False), ("show its logs", True)]
+
+    Splits on "and", "then", "after that" and ";" (a comma only together
+    with one of them). A piece with no intent or no target of its own
+    ("deploy nginx and redis", "... and fix") is glued back onto the
+    clause before it, so only real multi-intent queries are split.
+
+    A later clause that asks about the earlier one ("deploy api and why
+    did it fail?") is not a second task: the whole query keeps one intent.
+
+    The flag is True when the clause must wait for the previous one
+    ("then", "after that").
+    """
+
+    SEPARATOR = re.compile(r"(\s*(?:;|,?\s*\b(?:and then|after that|then|and)\b)\s*)", re.IGNORECASE)
+    SEQUENTIAL = re.compile(r"\b(then|after)\b", re.IGNORECASE)
+    QUESTION = re.compile(r"\?\s*$|^(?:why|how|what|is|are|was|were|did|does|do)\b", re.IGNORECASE)
+    FOLLOW_UP = re.compile(r"\b(?:it|its|that|this|them)\b", re.IGNORECASE)
+
+    def __init__(self, classifier: IntentClassifier = None):
+        self.classifier = classifier or IntentClassifier()
+
+    def split(self, query: str) -> list:
+        pieces = self.SEPARATOR.split(query)
+        if len(pieces) == 1:
+            return [(query, False)]
+
+        clauses = []    # [text, intent, sequential]
+        sep = ""
+        for i, piece in enumerate(pieces):
+            if i % 2:
+                sep = piece
+                continue
+            text = piece.strip()
+            if not text:
+                continue
+
+            intent = self.classifier.classify(text)
+            if clauses and (intent == "UNKNOWN" or len(text.split()) < 2):
+                clauses[-1][0] += sep + text
+                continue
+            if clauses and (self.QUESTION.search(text) or (intent == "DEBUG" and self.FOLLOW_UP.search(text))):
+                return [(query, False)]
+            clauses.append([text, intent, bool(clauses) and bool(self.SEQUENTIAL.search(sep))])
+
+        if len(clauses) < 2 or clauses[0][1] == "UNKNOWN":
+            return [(query, False)]
+        return [(text, sequential) for text, _, sequential in clauses]
@@ -1,9 +1,9 @@
 # agent/tools/aws_tool.py
 
-import subprocess
-import boto3
 import os
 
+from agent.core.process import run_text
+
 
 class AWSTool:
     """
@@ -17,16 +17,40 @@ class AWSTool:
       - S3: list buckets
       - IAM: identity info
       - CloudWatch: logs + metrics (future)
+
+    boto3 is imported, and each client created, on first use of that
+    service: CLI-only calls (get_eks_kubeconfig) never load the SDK.
     """
 
     def __init__(self, region: str = None):
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
+        self._clients = {}
+
+    # ---- boto3 clients (lazy) ----
+
+    def _client(self, service: str):
+        client = self._clients.get(service)
+        if client is None:
+            import boto3
+            client = boto3.client(service, region_name=self.region)
+            self._clients[service] = client
+        return client
 
-        # boto3 clients
-        self.eks = boto3.client("eks", region_name=self.region)
-        self.ec2 = boto3.client("ec2", region_name=self.region)
-        self.s3 = boto3.client("s3", region_name=self.region)
-        self.iam = boto3.client("sts", region_name=self.region)
+    @property
+    def eks(self):
+        return self._client("eks")
+
+    @property
+    def ec2(self):
+        return self._client("ec2")
+
+    @property
+    def s3(self):
+        return self._client("s3")
+
+    @property
+    def iam(self):
+        return self._client("sts")
 
     # ---- EKS: LIST CLUSTERS ----
 
@@ -96,10 +120,8 @@ class AWSTool:
     # ---- INTERNAL EXEC (AWS CLI) ----
 
     def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[aws-cli-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[aws-cli-not-installed] AWS CLI not found."
+        return run_text(
+            cmd,
+            error_tag="aws-cli-error",
+            missing="[aws-cli-not-installed] AWS CLI not found."
+        )
@@ -1,7 +1,6 @@
 # agent/tools/cicd_tool.py
 
-from agent.tools.github_tool import GitHubTool
-from agent.tools.gitlab_tool import GitLabTool
+from agent.core.container import ToolRef
 
 
 class CICDTool:
@@ -20,11 +19,13 @@ class CICDTool:
       - trigger pipelines
 
     Workflows will not need to know whether CI/CD is GitHub or GitLab.
+
+    Provider clients come from the shared tool container and are only
+    built when that provider is first used.
     """
 
-    def __init__(self):
-        self.github = GitHubTool()
-        self.gitlab = GitLabTool()
+    github = ToolRef("github")
+    gitlab = ToolRef("gitlab")
 
     # ---- UNIFIED STATUS ----
 
@@ -1,8 +1,9 @@
 # agent/tools/cost_tool.py
 
-import requests
+from agent.core.http_pool import get_http_client
+from agent.core.cache import cached
+from agent.core.process import run_text
 import os
-import subprocess
 
 
 class CostTool:
@@ -25,12 +26,16 @@ class CostTool:
         self.kubecost_url = os.getenv("KUBECOST_URL", "http://localhost:9090")
         self.infracost_bin = os.getenv("INFRACOST_BIN", "infracost")
 
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     # ---- KUBECOST (K8s Cost) ----
 
+    @cached("kubecost", ttl=300)
     def namespace_cost(self, namespace: str):
         url = f"{self.kubecost_url}/model/namespaces"
         try:
-            resp = requests.get(url)
+            resp = self.http.get(url)
             if resp.status_code != 200:
                 return f"[kubecost-error:{resp.status_code}] {resp.text}"
 
@@ -50,7 +55,7 @@ class CostTool:
     def service_cost(self, service: str):
         url = f"{self.kubecost_url}/model/services"
         try:
-            resp = requests.get(url)
+            resp = self.http.get(url)
             if resp.status_code != 200:
                 return f"[kubecost-error:{resp.status_code}] {resp.text}"
 
@@ -90,11 +95,8 @@ class CostTool:
     # ---- INTERNAL EXEC ----
 
     def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[infracost-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[infracost-not-installed] Infracost CLI not found."
-
+        return run_text(
+            cmd,
+            error_tag="infracost-error",
+            missing="[infracost-not-installed] Infracost CLI not found."
+        )
@@ -1,6 +1,8 @@
 # agent/tools/docker_tool.py
 
-import subprocess
+
+from agent.core.process import run_text
+
 
 class DockerTool:
     """
@@ -70,10 +72,8 @@ class DockerTool:
     # ---- PRIVATE EXEC HELPER ----
 
     def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[docker-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[docker-not-installed] Docker CLI not found."
+        return run_text(
+            cmd,
+            error_tag="docker-error",
+            missing="[docker-not-installed] Docker CLI not found."
+        )
@@ -1,8 +1,9 @@
 # agent/tools/git_tool.py
 
-import subprocess
 import os
 
+from agent.core.process import run_text
+
 
 class GitTool:
     """
@@ -96,16 +97,9 @@ class GitTool:
     # ---- INTERNAL EXEC ----
 
     def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(
-                cmd,
-                stderr=subprocess.STDOUT,
-                cwd=self.workdir
-            )
-            return result.decode("utf-8").strip()
-
-        except subprocess.CalledProcessError as e:
-            return f"[git-error] {e.output.decode('utf-8').strip()}"
-
-        except FileNotFoundError:
-            return "[git-not-installed] git CLI not found."
+        return run_text(
+            cmd,
+            cwd=self.workdir,
+            error_tag="git-error",
+            missing="[git-not-installed] git CLI not found."
+        )
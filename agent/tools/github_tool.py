@@ -1,7 +1,8 @@
 # agent/tools/github_tool.py
 
 import os
-import requests
+from agent.core.http_pool import get_http_client
+from agent.core.cache import cached, invalidates
 
 
 class GitHubTool:
@@ -34,6 +35,9 @@ class GitHubTool:
 
         self.base = "https://api.github.com"
 
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     # ---- LIST REPOS ----
 
     def list_repos(self, user: str = None):
@@ -76,6 +80,7 @@ class GitHubTool:
 
     # ---- WORKFLOW RUNS (CI/CD) ----
 
+    @cached("github", ttl=30)
     def get_workflow_runs(self, repo: str, user: str = None):
         user = user or self.user
         if not user:
@@ -99,6 +104,7 @@ class GitHubTool:
 
     # ---- TRIGGER WORKFLOW (Optional) ----
 
+    @invalidates("github")
     def trigger_workflow(self, repo: str, workflow: str, ref="main", user: str = None):
         user = user or self.user
         if not user:
@@ -112,7 +118,7 @@ class GitHubTool:
 
     def _get(self, url):
         try:
-            resp = requests.get(url, headers=self.headers)
+            resp = self.http.get(url, headers=self.headers)
             if resp.status_code == 200:
                 return resp.json()
             return f"[github-error:{resp.status_code}] {resp.text}"
@@ -121,7 +127,7 @@ class GitHubTool:
 
     def _post(self, url, payload):
         try:
-            resp = requests.post(url, headers=self.headers, json=payload)
+            resp = self.http.post(url, headers=self.headers, json=payload)
             if resp.status_code in (200, 201, 204):
                 return "Triggered workflow successfully."
             return f"[github-error:{resp.status_code}] {resp.text}"
@@ -1,7 +1,7 @@
 # agent/tools/gitlab_tool.py
 
 import os
-import requests
+from agent.core.http_pool import get_http_client
 
 
 class GitLabTool:
@@ -29,6 +29,9 @@ class GitLabTool:
             "PRIVATE-TOKEN": self.token
         } if self.token else {}
 
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     # ---- LIST PROJECTS ----
 
     def list_projects(self, user: str = None):
@@ -91,7 +94,7 @@ class GitLabTool:
 
     def _get(self, url):
         try:
-            resp = requests.get(url, headers=self.headers)
+            resp = self.http.get(url, headers=self.headers)
             if resp.status_code == 200:
                 return resp.json()
             return f"[gitlab-error:{resp.status_code}] {resp.text}"
@@ -100,7 +103,7 @@ class GitLabTool:
 
     def _post(self, url, payload):
         try:
-            resp = requests.post(url, headers=self.headers, json=payload)
+            resp = self.http.post(url, headers=self.headers, json=payload)
             if resp.status_code in (200, 201):
                 return resp.json()
             elif resp.status_code == 204:
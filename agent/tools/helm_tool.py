@@ -1,6 +1,11 @@
 # agent/tools/helm_tool.py
 
-import subprocess
+
+from agent.core.cache import cached, invalidates
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools import records
+from agent.tools.records import output_mode
 
 
 class HelmTool:
@@ -23,10 +28,19 @@ class HelmTool:
       - Minikube
       - K3s
       - Kind
+
+    Output (AGENT_OUTPUT_MODE env):
+      - text        helm tables (default)
+      - structured  list() runs `helm list -o json` and returns Release
+                    records (agent.tools.records)
     """
 
+    def __init__(self):
+        self.structured = output_mode() == "structured"
+
     # ---- INSTALL ----
 
+    @invalidates("helm", "kubectl")
     def install(self, release: str, chart: str, namespace: str = None, values: str = None):
         cmd = ["helm", "install", release, chart]
 
@@ -40,6 +54,7 @@ class HelmTool:
 
     # ---- UPGRADE ----
 
+    @invalidates("helm", "kubectl")
     def upgrade(self, release: str, chart: str, namespace: str = None, values: str = None):
         cmd = ["helm", "upgrade", release, chart]
 
@@ -53,6 +68,7 @@ class HelmTool:
 
     # ---- UNINSTALL ----
 
+    @invalidates("helm", "kubectl")
     def uninstall(self, release: str, namespace: str = None):
         cmd = ["helm", "uninstall", release]
 
@@ -63,12 +79,15 @@ class HelmTool:
 
     # ---- LIST RELEASES ----
 
+    @cached("helm", ttl=30)
     def list(self, namespace: str = None):
         cmd = ["helm", "list"]
 
         if namespace:
             cmd.extend(["-n", namespace])
 
+        if self.structured:
+            return records.releases(self._exec(cmd + ["-o", "json"], large=True))
         return self._exec(cmd)
 
     # ---- TEMPLATE (local rendering) ----
@@ -95,11 +114,10 @@ class HelmTool:
 
     # ---- INTERNAL EXECUTE ----
 
-    def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[helm-not-installed] helm CLI not found."
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            error_tag="helm-error",
+            missing="[helm-not-installed] helm CLI not found."
+        )
@@ -0,0 +1,280 @@
+# agent/tools/kubernetes_api_backend.py
+
+import os
+import time
+import threading
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+_BUILD_LOCKS = {}     # context → lock held while that context's client is built
+
+
+def get_api_client(context: str = None):
+    """
+    Cached, authenticated ApiClient per kube context.
+
+    kubeconfig parsing and auth-plugin execution (e.g. `aws eks get-token`)
+    happen once per context instead of once per call; the client's urllib3
+    pool keeps connections to the API server alive between calls.
+
+    Clients are rebuilt after KUBE_API_CLIENT_TTL seconds (default 600)
+    so short-lived exec-plugin tokens get refreshed.
+
+    A client is built under its own context's lock, never the global one:
+    a slow exec plugin for one cluster does not hold up the others, and
+    concurrent callers for the same context wait for a single build.
+    """
+    ttl = float(os.getenv("KUBE_API_CLIENT_TTL", "600"))
+    key = context or os.getenv("KUBE_CONTEXT") or None
+
+    def fresh():
+        cached = _CLIENTS.get(key)
+        return cached[0] if cached and time.monotonic() - cached[1] < ttl else None
+
+    with _CLIENTS_LOCK:
+        api_client = fresh()
+        if api_client is not None:
+            return api_client
+        build_lock = _BUILD_LOCKS.setdefault(key, threading.Lock())
+
+    with build_lock:
+        with _CLIENTS_LOCK:
+            api_client = fresh()
+        if api_client is not None:
+            return api_client
+
+        from kubernetes import client, config
+
+        if key is None and os.getenv("KUBERNETES_SERVICE_HOST"):
+            # running inside a pod → service account credentials
+            configuration = client.Configuration()
+            config.load_incluster_config(client_configuration=configuration)
+            api_client = client.ApiClient(configuration)
+        else:
+            api_client = config.new_client_from_config(
+                config_file=os.getenv("KUBE_CONFIG") or None,
+                context=key
+            )
+
+        with _CLIENTS_LOCK:
+            _CLIENTS[key] = (api_client, time.monotonic())
+        return api_client
+
+
+_NAMESPACES = {}
+_SA_NAMESPACE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
+
+def default_namespace(context: str = None) -> str:
+    """
+    The namespace kubectl uses when -n is not given: the context's
+    namespace in kubeconfig (the service account's in a pod), else "default".
+    """
+    key = context or os.getenv("KUBE_CONTEXT") or None
+    namespace = _NAMESPACES.get(key)
+    if namespace is not None:
+        return namespace
+
+    namespace = None
+    try:
+        if key is None and os.getenv("KUBERNETES_SERVICE_HOST") and os.path.exists(_SA_NAMESPACE):
+            with open(_SA_NAMESPACE) as f:
+                namespace = f.read().strip()
+        else:
+            from kubernetes import config
+
+            contexts, active = config.list_kube_config_contexts(config_file=os.getenv("KUBE_CONFIG") or None)
+            current = next((c for c in contexts if c["name"] == key), None) if key else active
+            namespace = ((current or {}).get("context") or {}).get("namespace")
+    except Exception:
+        pass
+
+    namespace = _NAMESPACES[key] = namespace or "default"
+    return namespace
+
+
+class KubernetesAPIBackend:
+    """
+    Native Kubernetes API backend (no kubectl subprocess).
+
+    Same method names as KubernetesTool, but:
+      - talks to the API server through a cached authenticated client
+      - reuses keep-alive connections
+      - returns structured objects (lists of dicts) instead of -o wide text
+
+    Like kubectl, namespace=None means the context's default namespace;
+    lists take all_namespaces=True for every namespace (kubectl -A).
+
+    Supports:
+      - get pods/services/nodes
+      - logs
+      - describe (pod + events)
+      - scale
+      - delete
+
+    Not supported natively (KubernetesTool falls back to kubectl):
+      - apply (client-side apply semantics live in kubectl)
+      - rollout status
+
+    Requires:
+      kubernetes python client (pip install kubernetes)
+    """
+
+    def __init__(self, context: str = None):
+        self.context = context
+
+    @property
+    def namespace(self):
+        return default_namespace(self.context)
+
+    # ---- CLIENTS ----
+
+    def _core(self):
+        from kubernetes import client
+        return client.CoreV1Api(get_api_client(self.context))
+
+    def _apps(self):
+        from kubernetes import client
+        return client.AppsV1Api(get_api_client(self.context))
+
+    # ---- GET PODS ----
+
+    def get_pods(self, namespace: str = None, all_namespaces: bool = False):
+        def call():
+            core = self._core()
+            if all_namespaces:
+                items = core.list_pod_for_all_namespaces().items
+            else:
+                items = core.list_namespaced_pod(namespace or self.namespace).items
+            return [self._pod(p) for p in items]
+        return self._call(call)
+
+    # ---- GET SERVICES ----
+
+    def get_services(self, namespace: str = None, all_namespaces: bool = False):
+        def call():
+            core = self._core()
+            if all_namespaces:
+                items = core.list_service_for_all_namespaces().items
+            else:
+                items = core.list_namespaced_service(namespace or self.namespace).items
+            return [self._service(s) for s in items]
+        return self._call(call)
+
+    # ---- GET NODES ----
+
+    def get_nodes(self):
+        return self._call(lambda: [self._node(n) for n in self._core().list_node().items])
+
+    # ---- LOGS ----
+
+    def logs(self, pod: str, namespace: str = None):
+        return self._call(lambda: self._core().read_namespaced_pod_log(
+            pod, namespace or self.namespace
+        ))
+
+    # ---- DESCRIBE ----
+
+    def describe(self, pod: str, namespace: str = None):
+        def call():
+            core = self._core()
+            ns = namespace or self.namespace
+            obj = core.read_namespaced_pod(pod, ns)
+            events = core.list_namespaced_event(
+                ns, field_selector=f"involvedObject.name={pod}"
+            ).items
+            out = self._pod(obj)
+            out["conditions"] = [
+                {"type": c.type, "status": c.status, "reason": c.reason}
+                for c in (obj.status.conditions or [])
+            ]
+            out["events"] = [
+                {"type": e.type, "reason": e.reason, "message": e.message, "count": e.count}
+                for e in events
+            ]
+            return out
+        return self._call(call)
+
+    # ---- SCALE ----
+
+    def scale(self, deployment: str, replicas: int, namespace: str = None):
+        def call():
+            self._apps().patch_namespaced_deployment_scale(
+                deployment, namespace or self.namespace, {"spec": {"replicas": int(replicas)}}
+            )
+            return f"deployment.apps/{deployment} scaled"
+        return self._call(call)
+
+    # ---- DELETE ----
+
+    def delete(self, kind: str, name: str, namespace: str = None):
+        kinds = {
+            "pod": lambda ns: self._core().delete_namespaced_pod(name, ns),
+            "pods": lambda ns: self._core().delete_namespaced_pod(name, ns),
+            "svc": lambda ns: self._core().delete_namespaced_service(name, ns),
+            "service": lambda ns: self._core().delete_namespaced_service(name, ns),
+            "deployment": lambda ns: self._apps().delete_namespaced_deployment(name, ns),
+            "deploy": lambda ns: self._apps().delete_namespaced_deployment(name, ns),
+        }
+        handler = kinds.get(kind.lower())
+        if handler is None:
+            return None  # unsupported kind → caller falls back to kubectl
+
+        def call():
+            handler(namespace or self.namespace)
+            return f"{kind} \"{name}\" deleted"
+        return self._call(call)
+
+    # ---- SERIALIZERS (compact, -o wide equivalent) ----
+
+    def _pod(self, p):
+        statuses = p.status.container_statuses or []
+        ready = sum(1 for c in statuses if c.ready)
+        return {
+            "name": p.metadata.name,
+            "namespace": p.metadata.namespace,
+            "phase": p.status.phase,
+            "ready": f"{ready}/{len(p.spec.containers or [])}",
+            "restarts": sum(c.restart_count or 0 for c in statuses),
+            "node": p.spec.node_name,
+            "ip": p.status.pod_ip,
+            "created": p.metadata.creation_timestamp.isoformat() if p.metadata.creation_timestamp else None,
+        }
+
+    def _service(self, s):
+        return {
+            "name": s.metadata.name,
+            "namespace": s.metadata.namespace,
+            "type": s.spec.type,
+            "cluster_ip": s.spec.cluster_ip,
+            "ports": [f"{port.port}/{port.protocol}" for port in (s.spec.ports or [])],
+        }
+
+    def _node(self, n):
+        conditions = n.status.conditions or []
+        ready = next((c.status for c in conditions if c.type == "Ready"), "Unknown")
+        labels = n.metadata.labels or {}
+        ips = [a.address for a in (n.status.addresses or []) if a.type == "InternalIP"]
+        return {
+            "name": n.metadata.name,
+            "ready": ready == "True",
+            "unschedulable": bool(n.spec.unschedulable),
+            "roles": ",".join(k.rsplit("/", 1)[-1] for k in labels if k.startswith("node-role.kubernetes.io/")) or None,
+            "kubelet": n.status.node_info.kubelet_version if n.status.node_info else None,
+            "ip": ips[0] if ips else None,
+        }
+
+    # ---- INTERNAL CALL ----
+
+    def _call(self, fn):
+        try:
+            return fn()
+        except ImportError:
+            return "[k8s-api-missing] kubernetes python client not installed."
+        except Exception as e:
+            status = getattr(e, "status", None)
+            reason = getattr(e, "reason", None) or str(e)
+            if status:
+                return f"[k8s-api-error:{status}] {reason}"
+            return f"[k8s-api-error] {reason}"
@@ -1,6 +1,33 @@
 # agent/tools/kubernetes_tool.py
 
-import subprocess
+import os
+import asyncio
+
+from agent.core.async_exec import exec_async
+from agent.core.cache import invalidates
+from agent.core.output import run_output, run_output_async
+from agent.core.process import run_text
+from agent.tools import records
+from agent.tools.records import output_mode
+from agent.tools.kubernetes_api_backend import KubernetesAPIBackend, default_namespace
+from agent.tools.kubernetes_watch_cache import get_watch_cache
+
+
+def with_context(cmd, context=None):
+    """
+    kubectl argv → the same argv pinned to one kube context with
+    --context, so the shared kubeconfig is never switched.
+    """
+    if not context:
+        return cmd
+    return cmd[:1] + ["--context", context] + cmd[1:]
+
+
+def _namespace_args(namespace=None, all_namespaces=False):
+    if all_namespaces:
+        return ["-A"]
+    return ["-n", namespace] if namespace else []
+
 
 class KubernetesTool:
     """
@@ -8,7 +35,8 @@ class KubernetesTool:
 
     Supports:
       - deploy yaml
-      - get pods/services
+      - get pods/services/nodes
+      - rollout status
       - logs
       - describe
       - scale
@@ -21,33 +49,148 @@ class KubernetesTool:
       - Minikube
       - Kind
       - K3s
+
+    Backends (KUBE_BACKEND env or backend=...):
+      - kubectl  spawn kubectl per call, text output (default)
+      - api      native API client (KubernetesAPIBackend): cached auth,
+                 keep-alive connections, structured results.
+                 Calls it cannot serve natively fall back to kubectl.
+
+    Output (AGENT_OUTPUT_MODE env):
+      - text        kubectl tables (default)
+      - structured  kubectl -o json parsed into Pod / Service / Node
+                    records (agent.tools.records), rendered as compact
+                    tables. The JSON is read through run_output, so a
+                    large cluster's list is parsed from the spill file
+                    instead of being cut at the runner's output cap.
+
+    Cluster (KUBE_CONTEXT env or context=...):
+      every call is pinned to that kube context (kubectl --context, one
+      API client per context); the current-context in kubeconfig is never
+      read or switched. for_context(name) gives a tool for another
+      cluster; MultiCluster (agent.tools.multi_cluster) fans a query out
+      over many.
+
+    Watch cache (KUBE_WATCH_CACHE=1):
+      get_pods / get_nodes are answered from the informer-fed
+      KubernetesWatchCache while it is fresh; otherwise the configured
+      backend does a live list.
+
+    Namespaces: every backend (kubectl, api, watch cache) treats
+    namespace=None as the context's default namespace, like kubectl
+    without -n; get_pods / get_services take all_namespaces=True for -A. The cache follows KUBE_CONTEXT, so tools
+      bound to other contexts always list live.
     """
 
+    def __init__(self, backend: str = None, context: str = None, timeout: float = None,
+                 structured: bool = None):
+        self.backend = (backend or os.getenv("KUBE_BACKEND", "kubectl")).lower()
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+        self.timeout = timeout
+        self.api = KubernetesAPIBackend(self.context) if self.backend == "api" else None
+        self.structured = output_mode() == "structured" if structured is None else structured
+        self._contexts = {}
+
+    def for_context(self, context: str):
+        """
+        Same tool (backend, output mode, timeout) bound to another context.
+        """
+        if not context or context == self.context:
+            return self
+        tool = self._contexts.get(context)
+        if tool is None:
+            tool = KubernetesTool(self.backend, context, self.timeout, self.structured)
+            tool = self._contexts.setdefault(context, tool)
+        return tool
+
     # ---- APPLY YAML ----
 
+    @invalidates("kubectl")
     def apply(self, yaml_path: str):
         cmd = ["kubectl", "apply", "-f", yaml_path]
         return self._exec(cmd)
 
     # ---- GET PODS ----
 
-    def get_pods(self, namespace: str = None):
-        cmd = ["kubectl", "get", "pods", "-o", "wide"]
-        if namespace:
-            cmd.extend(["-n", namespace])
-        return self._exec(cmd)
+    def get_pods(self, namespace: str = None, all_namespaces: bool = False):
+        cached = self._cached("pods", namespace, all_namespaces)
+        if cached is not None:
+            return cached
+        if self.api:
+            return self.api.get_pods(namespace, all_namespaces)
+        return self._list(self._pods_cmd(namespace, all_namespaces), records.pods)
+
+    async def get_pods_async(self, namespace: str = None, all_namespaces: bool = False):
+        cached = self._cached("pods", namespace, all_namespaces)
+        if cached is not None:
+            return cached
+        if self.api:
+            return await asyncio.to_thread(self.api.get_pods, namespace, all_namespaces)
+        return await self._alist(self._pods_cmd(namespace, all_namespaces), records.pods)
+
+    def _pods_cmd(self, namespace, all_namespaces=False):
+        cmd = ["kubectl", "get", "pods", "-o", "json" if self.structured else "wide"]
+        return cmd + _namespace_args(namespace, all_namespaces)
 
     # ---- GET SERVICES ----
 
-    def get_services(self, namespace: str = None):
+    def get_services(self, namespace: str = None, all_namespaces: bool = False):
+        if self.api:
+            return self.api.get_services(namespace, all_namespaces)
+        return self._list(self._services_cmd(namespace, all_namespaces), records.services)
+
+    async def get_services_async(self, namespace: str = None, all_namespaces: bool = False):
+        if self.api:
+            return await asyncio.to_thread(self.api.get_services, namespace, all_namespaces)
+        return await self._alist(self._services_cmd(namespace, all_namespaces), records.services)
+
+    def _services_cmd(self, namespace, all_namespaces=False):
         cmd = ["kubectl", "get", "svc"]
+        if self.structured:
+            cmd += ["-o", "json"]
+        return cmd + _namespace_args(namespace, all_namespaces)
+
+    # ---- GET NODES ----
+
+    def get_nodes(self):
+        cached = self._cached("nodes", None)
+        if cached is not None:
+            return cached
+        if self.api:
+            return self.api.get_nodes()
+        return self._list(self._nodes_cmd(), records.nodes)
+
+    async def get_nodes_async(self):
+        cached = self._cached("nodes", None)
+        if cached is not None:
+            return cached
+        if self.api:
+            return await asyncio.to_thread(self.api.get_nodes)
+        return await self._alist(self._nodes_cmd(), records.nodes)
+
+    def _nodes_cmd(self):
+        return ["kubectl", "get", "nodes", "-o", "json" if self.structured else "wide"]
+
+    # ---- ROLLOUT STATUS ----
+
+    def rollout_status(self, deployment: str, namespace: str = None):
+        return self._exec(self._rollout_cmd(deployment, namespace))
+
+    async def rollout_status_async(self, deployment: str, namespace: str = None):
+        return await self._aexec(self._rollout_cmd(deployment, namespace))
+
+    def _rollout_cmd(self, deployment, namespace):
+        # --watch=false: report the current state instead of blocking until done
+        cmd = ["kubectl", "rollout", "status", f"deployment/{deployment}", "--watch=false"]
         if namespace:
             cmd.extend(["-n", namespace])
-        return self._exec(cmd)
+        return cmd
 
     # ---- LOGS ----
 
     def logs(self, pod: str, namespace: str = None):
+        if self.api:
+            return self.api.logs(pod, namespace)
         cmd = ["kubectl", "logs", pod]
         if namespace:
             cmd.extend(["-n", namespace])
@@ -56,6 +199,8 @@ class KubernetesTool:
     # ---- DESCRIBE ----
 
     def describe(self, pod: str, namespace: str = None):
+        if self.api:
+            return self.api.describe(pod, namespace)
         cmd = ["kubectl", "describe", "pod", pod]
         if namespace:
             cmd.extend(["-n", namespace])
@@ -63,7 +208,10 @@ class KubernetesTool:
 
     # ---- SCALE ----
 
+    @invalidates("kubectl")
     def scale(self, deployment: str, replicas: int, namespace: str = None):
+        if self.api:
+            return self.api.scale(deployment, replicas, namespace)
         cmd = ["kubectl", "scale", "deployment", deployment, f"--replicas={replicas}"]
         if namespace:
             cmd.extend(["-n", namespace])
@@ -71,19 +219,56 @@ class KubernetesTool:
 
     # ---- DELETE ----
 
+    @invalidates("kubectl")
     def delete(self, kind: str, name: str, namespace: str = None):
+        if self.api:
+            result = self.api.delete(kind, name, namespace)
+            if result is not None:
+                return result
         cmd = ["kubectl", "delete", kind, name]
         if namespace:
             cmd.extend(["-n", namespace])
         return self._exec(cmd)
 
+    # ---- WATCH CACHE ----
+
+    def _cached(self, kind, namespace, all_namespaces=False):
+        if self.context != (os.getenv("KUBE_CONTEXT") or None):
+            return None
+        cache = get_watch_cache()
+        if cache is None:
+            return None
+        # the cache holds every namespace; answer like kubectl without -n
+        if kind != "nodes" and not all_namespaces:
+            namespace = namespace or default_namespace(self.context)
+        return cache.list(kind, namespace)
+
     # ---- INTERNAL EXEC ----
 
-    def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[kubectl-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-not-installed] kubectl CLI not found."
+    def _list(self, cmd, parse):
+        if self.structured:
+            return parse(self._exec(cmd, large=True))
+        return self._exec(cmd)
+
+    async def _alist(self, cmd, parse):
+        if self.structured:
+            return parse(await self._aexec(cmd, large=True))
+        return await self._aexec(cmd)
+
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            with_context(cmd, self.context),
+            error_tag="kubectl-error",
+            missing="[kubectl-not-installed] kubectl CLI not found.",
+            timeout=self.timeout
+        )
+
+    async def _aexec(self, cmd, large=False):
+        run = run_output_async if large else exec_async
+        return await run(
+            with_context(cmd, self.context),
+            error_tag="kubectl-error",
+            missing="[kubectl-not-installed] kubectl CLI not found.",
+            timeout=self.timeout
+        )
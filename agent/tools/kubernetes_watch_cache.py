@@ -0,0 +1,361 @@
+# agent/tools/kubernetes_watch_cache.py
+
+import os
+import time
+import threading
+
+from agent.tools.kubernetes_api_backend import get_api_client
+
+
+class WatchError(Exception):
+    """
+    ERROR event on a watch stream; status is the API Status code
+    (410 = resourceVersion expired), like ApiException.status.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ResourceInformer:
+    """
+    Informer for one resource kind: LIST once, then WATCH from the
+    returned resourceVersion and apply ADDED / MODIFIED / DELETED events
+    to an in-memory store.
+
+    Keeps:
+      - store            "namespace/name" → compact dict
+      - namespace index  namespace → keys
+      - label index      "key=value" → keys
+      - resourceVersion  resume point for the next watch
+      - last_sync        monotonic time we were last known in sync
+
+    On 410 Gone (resourceVersion too old) the informer re-lists. Other
+    ERROR events back off and retry; only events that were applied
+    (or a bookmark) count as being in sync.
+    """
+
+    def __init__(self, kind: str, list_call, serializer, watch_timeout: int = 60, context: str = None):
+        self.kind = kind
+        self.list_call = list_call
+        self.serializer = serializer
+        self.watch_timeout = watch_timeout
+        self.context = context
+
+        self.store = {}
+        self.by_namespace = {}
+        self.by_label = {}
+        self.resource_version = None
+        self.last_sync = None
+        self.error = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ---- LIFECYCLE ----
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name=f"informer-{self.kind}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        backoff = 1
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch()
+                backoff = 1
+            except Exception as e:
+                if getattr(e, "status", None) == 410:
+                    # resourceVersion expired → full re-list on next turn
+                    self.resource_version = None
+                    continue
+                self.error = str(e)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+    # ---- LIST + WATCH ----
+
+    def _relist(self):
+        resp = self.list_call(get_api_client(self.context))()
+        items = {}
+        for obj in resp.items:
+            rec = self.serializer(obj)
+            items[self._key(rec)] = rec
+
+        with self._lock:
+            self.store = {}
+            self.by_namespace = {}
+            self.by_label = {}
+            for key, rec in items.items():
+                self._index(key, rec)
+                self.store[key] = rec
+            self.resource_version = resp.metadata.resource_version
+            self.last_sync = time.monotonic()
+            self.error = None
+
+    def _watch(self):
+        from kubernetes import watch
+
+        w = watch.Watch()
+        stream = w.stream(
+            self.list_call(get_api_client(self.context)),
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+        )
+        for event in stream:
+            if self._stop.is_set():
+                w.stop()
+                return
+            self._apply(event)
+
+        # stream ended cleanly at timeout_seconds → still in sync
+        with self._lock:
+            self.last_sync = time.monotonic()
+
+    def _apply(self, event):
+        etype = event.get("type")
+        raw = event.get("raw_object") or {}
+        rv = (raw.get("metadata") or {}).get("resourceVersion")
+
+        if etype == "ERROR":
+            raise WatchError(raw.get("code"), raw.get("message") or f"{self.kind} watch error")
+        if etype not in ("ADDED", "MODIFIED", "DELETED", "BOOKMARK"):
+            return
+
+        with self._lock:
+            if etype == "BOOKMARK":
+                pass
+            elif etype in ("ADDED", "MODIFIED"):
+                rec = self.serializer(event["object"])
+                key = self._key(rec)
+                self._unindex(key)
+                self._index(key, rec)
+                self.store[key] = rec
+            elif etype == "DELETED":
+                rec = self.serializer(event["object"])
+                key = self._key(rec)
+                self._unindex(key)
+                self.store.pop(key, None)
+
+            if rv:
+                self.resource_version = rv
+            self.last_sync = time.monotonic()
+
+    # ---- INDEXES ----
+
+    def _key(self, rec):
+        ns = rec.get("namespace")
+        return f"{ns}/{rec['name']}" if ns else rec["name"]
+
+    def _index(self, key, rec):
+        self.by_namespace.setdefault(rec.get("namespace"), set()).add(key)
+        for k, v in (rec.get("labels") or {}).items():
+            self.by_label.setdefault(f"{k}={v}", set()).add(key)
+
+    def _unindex(self, key):
+        old = self.store.get(key)
+        if old is None:
+            return
+        self.by_namespace.get(old.get("namespace"), set()).discard(key)
+        for k, v in (old.get("labels") or {}).items():
+            self.by_label.get(f"{k}={v}", set()).discard(key)
+
+    # ---- QUERY ----
+
+    def age(self):
+        if self.last_sync is None:
+            return None
+        return time.monotonic() - self.last_sync
+
+    def list(self, namespace: str = None, selector: str = None):
+        with self._lock:
+            keys = None
+            if namespace:
+                keys = set(self.by_namespace.get(namespace, ()))
+            if selector:
+                for term in selector.split(","):
+                    matched = self.by_label.get(term.strip(), set())
+                    keys = set(matched) if keys is None else keys & matched
+            if keys is None:
+                return list(self.store.values())
+            return [self.store[k] for k in sorted(keys) if k in self.store]
+
+
+class KubernetesWatchCache:
+    """
+    Local in-memory object cache for pods, nodes, deployments and events,
+    fed by list+watch (informer pattern).
+
+    Workflows answer from memory instead of re-LISTing the API server on
+    every query. Reads are only served while the cache is within its
+    staleness bound; otherwise list() returns None and the caller falls
+    back to a live call.
+
+    Config (env):
+        KUBE_WATCH_CACHE            1 to enable in KubernetesTool    (default off)
+        KUBE_WATCH_CACHE_KINDS      comma list                       (default pods,nodes,deployments,events)
+        KUBE_WATCH_MAX_STALENESS    seconds                          (default 120)
+    """
+
+    def __init__(self, kinds=None, max_staleness: float = None, context: str = None):
+        self.max_staleness = max_staleness or float(os.getenv("KUBE_WATCH_MAX_STALENESS", "120"))
+        kinds = kinds or os.getenv("KUBE_WATCH_CACHE_KINDS", "pods,nodes,deployments,events").split(",")
+
+        watch_timeout = max(5, int(self.max_staleness / 2))
+        self.informers = {}
+        for kind in kinds:
+            kind = kind.strip()
+            spec = _KINDS.get(kind)
+            if spec is None:
+                continue
+            list_call, serializer = spec
+            self.informers[kind] = ResourceInformer(
+                kind, list_call, serializer, watch_timeout=watch_timeout, context=context
+            )
+
+    def start(self):
+        for informer in self.informers.values():
+            informer.start()
+        return self
+
+    def stop(self):
+        for informer in self.informers.values():
+            informer.stop()
+
+    def is_fresh(self, kind: str) -> bool:
+        informer = self.informers.get(kind)
+        if informer is None:
+            return False
+        age = informer.age()
+        return age is not None and age <= self.max_staleness
+
+    def list(self, kind: str, namespace: str = None, selector: str = None):
+        """
+        Cached objects, or None if the kind is not cached / too stale.
+        namespace=None means every namespace (the informers list
+        cluster-wide); callers answering like kubectl pass the default.
+        """
+        if not self.is_fresh(kind):
+            return None
+        return self.informers[kind].list(namespace, selector)
+
+    def stats(self):
+        return {
+            kind: {
+                "objects": len(inf.store),
+                "resource_version": inf.resource_version,
+                "age": round(inf.age(), 2) if inf.age() is not None else None,
+                "error": inf.error,
+            }
+            for kind, inf in self.informers.items()
+        }
+
+
+# ---- SERIALIZERS (compact records) ----
+
+def _meta(obj):
+    m = obj.metadata
+    return {
+        "name": m.name,
+        "namespace": m.namespace,
+        "labels": dict(m.labels or {}),
+    }
+
+
+def _pod(p):
+    rec = _meta(p)
+    statuses = (p.status.container_statuses if p.status else None) or []
+    ready = sum(1 for c in statuses if c.ready)
+    rec.update({
+        "phase": p.status.phase if p.status else None,
+        "ready": f"{ready}/{len(p.spec.containers or []) if p.spec else 0}",
+        "restarts": sum(c.restart_count or 0 for c in statuses),
+        "node": p.spec.node_name if p.spec else None,
+        "ip": p.status.pod_ip if p.status else None,
+    })
+    return rec
+
+
+def _node(n):
+    rec = _meta(n)
+    conditions = (n.status.conditions if n.status else None) or []
+    ready = next((c.status for c in conditions if c.type == "Ready"), "Unknown")
+    rec.update({
+        "ready": ready == "True",
+        "unschedulable": bool(n.spec.unschedulable) if n.spec else False,
+        "kubelet": n.status.node_info.kubelet_version if n.status and n.status.node_info else None,
+    })
+    return rec
+
+
+def _deployment(d):
+    rec = _meta(d)
+    st = d.status
+    rec.update({
+        "replicas": d.spec.replicas if d.spec else None,
+        "ready": (st.ready_replicas or 0) if st else 0,
+        "updated": (st.updated_replicas or 0) if st else 0,
+        "available": (st.available_replicas or 0) if st else 0,
+    })
+    return rec
+
+
+def _event(e):
+    rec = _meta(e)
+    obj = e.involved_object
+    rec.update({
+        "type": e.type,
+        "reason": e.reason,
+        "message": e.message,
+        "count": e.count,
+        "object": f"{obj.kind}/{obj.name}" if obj else None,
+    })
+    return rec
+
+
+def _core(api_client):
+    from kubernetes import client
+    return client.CoreV1Api(api_client)
+
+
+def _apps(api_client):
+    from kubernetes import client
+    return client.AppsV1Api(api_client)
+
+
+_KINDS = {
+    "pods": (lambda c: _core(c).list_pod_for_all_namespaces, _pod),
+    "nodes": (lambda c: _core(c).list_node, _node),
+    "deployments": (lambda c: _apps(c).list_deployment_for_all_namespaces, _deployment),
+    "events": (lambda c: _core(c).list_event_for_all_namespaces, _event),
+}
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_watch_cache():
+    """
+    Shared watch cache, started on first use when KUBE_WATCH_CACHE=1.
+    Returns None when disabled.
+    """
+    global _CACHE
+    if os.getenv("KUBE_WATCH_CACHE", "0") not in ("1", "true", "yes"):
+        return None
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = KubernetesWatchCache().start()
+    return _CACHE
@@ -1,7 +1,11 @@
 # agent/tools/logging_tool.py
 
-import requests
+from agent.core.http_pool import get_http_client
+from agent.core.logstream import parse_line, filter_records, take, ErrorDigest
+from urllib.parse import urlencode
 import os
+import json
+import time
 
 
 class LoggingTool:
@@ -9,7 +13,8 @@ class LoggingTool:
     Logging Tool abstraction for DevOps agent.
 
     Supports:
-      - Loki queries
+      - Loki queries (instant + bounded range backfill)
+      - Loki live tail (streamed LogRecords, follow mode)
       - Elasticsearch search (ELK stack)
       - error correlation (future)
       - log filtering & parsing (via LLM hybrid)
@@ -25,6 +30,9 @@ class LoggingTool:
         self.loki_url = os.getenv("LOKI_URL", "http://localhost:3100")
         self.elastic_url = os.getenv("ELASTIC_URL", "http://localhost:9200")
 
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     # ---- LOKI QUERY ----
 
     def loki_query(self, query: str):
@@ -32,35 +40,142 @@ class LoggingTool:
         url = f"{self.loki_url}/loki/api/v1/query"
 
         try:
-            resp = requests.get(url, params=params)
-            if resp.status_code == 200:
-                return resp.json()
-            return f"[loki-error:{resp.status_code}] {resp.text}"
+            resp = self.http.get(url, params=params)
+            return self._loki_result(resp)
+        except Exception as e:
+            return f"[loki-connection-error] {str(e)}"
+
+    async def loki_query_async(self, query: str):
+        params = {"query": query}
+        url = f"{self.loki_url}/loki/api/v1/query"
+
+        try:
+            resp = await self.http.aget(url, params=params)
+            return self._loki_result(resp)
         except Exception as e:
             return f"[loki-connection-error] {str(e)}"
 
+    def loki_query_range(self, query: str, since: int = 900, limit: int = 5000):
+        """
+        The newest `limit` entries of the last `since` seconds, in one
+        bounded request: returns as soon as Loki has answered.
+        """
+        params = {
+            "query": query,
+            "start": str(int((time.time() - since) * 1e9)),
+            "limit": str(limit),
+            "direction": "backward",
+        }
+        url = f"{self.loki_url}/loki/api/v1/query_range"
+
+        try:
+            resp = self.http.get(url, params=params)
+            return self._loki_result(resp)
+        except Exception as e:
+            return f"[loki-connection-error] {str(e)}"
+
+    def _range_records(self, result):
+        for stream in result.get("data", {}).get("result", []):
+            labels = stream.get("stream", {})
+            for ts, line in stream.get("values", []):
+                yield parse_line(line, labels, ts=ts)
+
+    def _loki_result(self, resp):
+        if resp.status_code == 200:
+            return resp.json()
+        return f"[loki-error:{resp.status_code}] {resp.text}"
+
     # ---- LOKI STREAM (TAIL) ----
 
-    def loki_tail(self, query: str):
-        url = f"{self.loki_url}/loki/api/v1/tail"
+    def loki_tail(self, query: str, since: int = None, limit: int = None, idle_timeout: float = 30):
+        """
+        Loki tail websocket:
+        WS /loki/api/v1/tail?query=<expr>&start=<ns>&limit=<n>
+
+        Returns a generator of LogRecord (agent.core.logstream) that yields
+        entries as Loki pushes them, or an error string if the stream
+        cannot be opened.
+
+          since         backfill the last N seconds before going live
+          idle_timeout  end the stream after N quiet seconds
+
+        Requires:
+          websocket-client (pip install websocket-client)
+        """
+        try:
+            from websocket import create_connection
+        except ImportError:
+            return "[loki-stream-missing] websocket-client not installed."
 
         params = {"query": query}
+        if since:
+            params["start"] = str(int((time.time() - since) * 1e9))
+        if limit:
+            params["limit"] = str(limit)
+
+        base = self.loki_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        url = f"{base}/loki/api/v1/tail?{urlencode(params)}"
 
         try:
-            resp = requests.get(url, params=params, stream=True)
-            if resp.status_code == 200:
-                return "[loki-streaming] (not parsed yet)"
-            return f"[loki-error:{resp.status_code}] {resp.text}"
+            ws = create_connection(url, timeout=idle_timeout)
         except Exception as e:
             return f"[loki-connection-error] {str(e)}"
 
+        return self._tail_records(ws)
+
+    def _tail_records(self, ws):
+        from websocket import WebSocketTimeoutException
+
+        try:
+            while True:
+                try:
+                    frame = ws.recv()
+                except WebSocketTimeoutException:
+                    return
+                if not frame:
+                    return
+                data = json.loads(frame)
+                for stream in data.get("streams", []):
+                    labels = stream.get("stream", {})
+                    for ts, line in stream.get("values", []):
+                        yield parse_line(line, labels, ts=ts)
+        finally:
+            ws.close()
+
+    def error_digest(self, app: str, namespace: str = None, since: int = 900,
+                     max_lines: int = 5000, follow: bool = False, seconds: float = 5):
+        """
+        The app's recent logs through filter → digest.
+
+        By default the last `since` seconds are backfilled with one
+        bounded query_range (at most `max_lines` entries), so the digest
+        is ready as soon as history is drained.
+
+        follow=True also watches live: the tail stream is read for
+        `seconds` (or `max_lines`) after the backfill, for explicit
+        "follow the logs" requests. Falls back to the backfill alone
+        when the tail stream is unavailable.
+        """
+        query = self._service_query(app, namespace)
+        if follow:
+            stream = self.loki_tail(query, since=since, idle_timeout=seconds)
+            if not isinstance(stream, str):
+                records = take(stream, limit=max_lines, seconds=seconds)
+                return ErrorDigest().consume(filter_records(records, levels=("error", "warn"))).render()
+
+        result = self.loki_query_range(query, since=since, limit=max_lines)
+        if isinstance(result, str):
+            return result
+        records = filter_records(self._range_records(result), levels=("error", "warn"))
+        return ErrorDigest().consume(records).render()
+
     # ---- ELASTICSEARCH SEARCH ----
 
     def elastic_search(self, index: str, query: dict):
         url = f"{self.elastic_url}/{index}/_search"
 
         try:
-            resp = requests.post(url, json=query)
+            resp = self.http.post(url, json=query)
             if resp.status_code == 200:
                 return resp.json()
             return f"[elastic-error:{resp.status_code}] {resp.text}"
@@ -80,10 +195,16 @@ class LoggingTool:
         return self.loki_query(query)
 
     def service_logs(self, app: str, namespace: str = None):
+        return self.loki_query(self._service_query(app, namespace))
+
+    async def service_logs_async(self, app: str, namespace: str = None):
+        return await self.loki_query_async(self._service_query(app, namespace))
+
+    def _service_query(self, app, namespace):
         query = f'{{app="{app}"}}'
         if namespace:
             query = f'{{app="{app}", namespace="{namespace}"}}'
-        return self.loki_query(query)
+        return query
 
     # ---- FUTURE: CORRELATION ----
 
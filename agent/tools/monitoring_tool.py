@@ -1,6 +1,7 @@
 # agent/tools/monitoring_tool.py
 
-import requests
+from agent.core.http_pool import get_http_client
+from agent.core.cache import cached
 import os
 
 
@@ -26,6 +27,9 @@ class MonitoringTool:
         self.grafana_url = os.getenv("GRAFANA_URL", "http://localhost:3000")
         self.alert_url = os.getenv("ALERTMANAGER_URL", "http://localhost:9093")
 
+        # shared keep-alive transport
+        self.http = get_http_client()
+
     # ---- PROMETHEUS QUERY ----
 
     def prom_query(self, query: str):
@@ -36,16 +40,28 @@ class MonitoringTool:
         url = f"{self.prom_url}/api/v1/query"
         params = {"query": query}
         try:
-            resp = requests.get(url, params=params)
-            if resp.status_code == 200:
-                data = resp.json()
-                if data.get("status") == "success":
-                    return data.get("data", {}).get("result", [])
-                return f"[prometheus-error] {data}"
-            return f"[prometheus-http-error:{resp.status_code}] {resp.text}"
+            resp = self.http.get(url, params=params)
+            return self._prom_result(resp)
         except Exception as e:
             return f"[prometheus-connection-error] {str(e)}"
 
+    async def prom_query_async(self, query: str):
+        url = f"{self.prom_url}/api/v1/query"
+        params = {"query": query}
+        try:
+            resp = await self.http.aget(url, params=params)
+            return self._prom_result(resp)
+        except Exception as e:
+            return f"[prometheus-connection-error] {str(e)}"
+
+    def _prom_result(self, resp):
+        if resp.status_code == 200:
+            data = resp.json()
+            if data.get("status") == "success":
+                return data.get("data", {}).get("result", [])
+            return f"[prometheus-error] {data}"
+        return f"[prometheus-http-error:{resp.status_code}] {resp.text}"
+
     # ---- SIMPLE HEALTH CHECKS ----
 
     def node_cpu(self):
@@ -55,10 +71,16 @@ class MonitoringTool:
         return self.prom_query("node_memory_MemAvailable_bytes")
 
     def pod_restarts(self, namespace: str = None):
+        return self.prom_query(self._restarts_query(namespace))
+
+    async def pod_restarts_async(self, namespace: str = None):
+        return await self.prom_query_async(self._restarts_query(namespace))
+
+    def _restarts_query(self, namespace):
         q = "sum(kube_pod_container_status_restarts_total)"
         if namespace:
             q += f"{{namespace=\"{namespace}\"}}"
-        return self.prom_query(q)
+        return q
 
     def http_requests(self, service: str = None):
         q = "sum(rate(http_requests_total[5m]))"
@@ -68,16 +90,29 @@ class MonitoringTool:
 
     # ---- ALERTMANAGER ----
 
+    @cached("alertmanager", ttl=15)
     def list_alerts(self):
         url = f"{self.alert_url}/api/v2/alerts"
         try:
-            resp = requests.get(url)
-            if resp.status_code == 200:
-                return resp.json()
-            return f"[alertmanager-error:{resp.status_code}] {resp.text}"
+            resp = self.http.get(url)
+            return self._alerts_result(resp)
+        except Exception as e:
+            return f"[alertmanager-connection-error] {str(e)}"
+
+    @cached("alertmanager", ttl=15, name="list_alerts")
+    async def list_alerts_async(self):
+        url = f"{self.alert_url}/api/v2/alerts"
+        try:
+            resp = await self.http.aget(url)
+            return self._alerts_result(resp)
         except Exception as e:
             return f"[alertmanager-connection-error] {str(e)}"
 
+    def _alerts_result(self, resp):
+        if resp.status_code == 200:
+            return resp.json()
+        return f"[alertmanager-error:{resp.status_code}] {resp.text}"
+
     # ---- FUTURE: GRAFANA DASHBOARDS ----
 
     def grafana_dashboards(self):
@@ -0,0 +1,227 @@
+# agent/tools/multi_cluster.py
+
+import os
+import asyncio
+
+from agent.core.cache import is_error_result
+from agent.core.fanout import FanOut, FanOutResult
+from agent.core.process import run_text
+from agent.tools.kubernetes_tool import KubernetesTool
+from agent.tools.records import ClusterHealth, Node, Pod, RecordList, Rollout, tag
+
+
+def list_contexts():
+    """
+    KUBE_CONTEXTS (comma list), else every context in kubeconfig.
+    [] when kubectl is missing or kubeconfig has no contexts.
+    """
+    configured = os.getenv("KUBE_CONTEXTS")
+    if configured:
+        return [c.strip() for c in configured.split(",") if c.strip()]
+    out = run_text(
+        ["kubectl", "config", "get-contexts", "-o", "name"],
+        error_tag="kubectl-error",
+        missing="[kubectl-missing]",
+        timeout=10
+    )
+    return [] if is_error_result(out) else out.split()
+
+
+class ClusterResults(FanOutResult):
+    """
+    One MultiCluster query: context → that cluster's result, in the order
+    the contexts were given. Clusters that timed out or failed hold the
+    usual "[fanout-timeout]" / "[fanout-error]" string.
+
+    Supports:
+      - errors     context → error string, for clusters with no answer
+      - merged()   one RecordList across clusters, every row tagged with
+                   its cluster (count_by("cluster"), where(cluster=...))
+      - str()      the merged table
+    """
+
+    def __init__(self, results: FanOutResult, kind: str, record):
+        super().__init__()
+        self.update(results)
+        self.timed_out = results.timed_out
+        self.failed = results.failed
+        self.elapsed = results.elapsed
+        self.kind = kind
+        self.record = record
+
+    @property
+    def errors(self):
+        return {ctx: out for ctx, out in self.items() if is_error_result(out)}
+
+    def merged(self) -> RecordList:
+        """
+        Row-per-cluster kinds (health, rollout) get a row for an
+        unreachable cluster too; for list kinds (pods, nodes) those
+        clusters are named in the summary line.
+        """
+        per_cluster = "cluster" in self.record.fields
+        rows = RecordList(kind=self.kind)
+        missing = []
+
+        for ctx, out in self.items():
+            if is_error_result(out):
+                status = "timeout" if ctx in self.timed_out else "error"
+                if per_cluster:
+                    rows.append(self.record(ctx, status=status, message=_first_line(out)))
+                else:
+                    missing.append(f"{ctx}: {_first_line(out)}")
+            elif per_cluster:
+                rows.append(out)
+            else:
+                rows.extend(tag(out, ctx, self.record))
+
+        answered = len(self) - len(self.errors)
+        rows.summary = "\n".join([f"{answered}/{len(self)} clusters answered in {self.elapsed}s"] + missing)
+        return rows
+
+    def render(self):
+        return self.merged().render()
+
+    def __str__(self):
+        return self.render()
+
+
+class MultiCluster:
+    """
+    Runs the same Kubernetes query against many clusters at once.
+
+    Each cluster is reached through a KubernetesTool pinned to its kube
+    context (kubectl --context / one API client per context), so nothing
+    switches the current-context in the shared kubeconfig and concurrent
+    users never race each other.
+
+    Supports:
+      - pods(namespace, all_namespaces), nodes()
+      - rollout_status(deployment, namespace)
+      - health(namespace)      nodes ready, pods, unhealthy pods, restarts
+      - query(call, ...)       any call(tool) → result
+      - *_async variants       same on the event loop; a cluster that
+                               times out has its kubectl killed
+
+    Every method returns ClusterResults; str() of it is the merged,
+    cluster-tagged table. Tools always run in structured mode, so rows
+    are typed records whichever backend (kubectl / api) answered.
+
+    Example:
+        clusters = MultiCluster(["prod-eu", "prod-us"], timeout=5)
+        print(clusters.health("payments"))
+        clusters.pods().merged().where(phase="Pending").count_by("cluster")
+
+    Config (env):
+        KUBE_CONTEXTS           clusters to query, comma list   (default: all kubeconfig contexts)
+        KUBE_CLUSTER_TIMEOUT    per-cluster timeout, sec        (default 10)
+        KUBE_CLUSTER_DEADLINE   whole fan-out, sec              (default 30)
+
+    The sync path shares the fan-out pool (AGENT_FANOUT_WORKERS) and both
+    paths the kubectl limit of the ProcessRunner (AGENT_PROC_LIMITS);
+    raise those for very large fleets.
+    """
+
+    def __init__(self, contexts=None, timeout: float = None, deadline: float = None, backend: str = None):
+        self._contexts = list(contexts) if contexts else None
+        self.timeout = timeout or float(os.getenv("KUBE_CLUSTER_TIMEOUT", "10"))
+        self.deadline = deadline or float(os.getenv("KUBE_CLUSTER_DEADLINE", "30"))
+        self.tool = KubernetesTool(backend, timeout=self.timeout, structured=True)
+
+    @property
+    def contexts(self):
+        if self._contexts is None:
+            self._contexts = list_contexts()
+        return self._contexts
+
+    # ---- FAN-OUT ----
+
+    def query(self, call, contexts=None, kind: str = "results", record=None) -> ClusterResults:
+        """
+        call(tool) on every cluster; tool is a KubernetesTool bound to it.
+        record: record type of the rows call returns (for merged()).
+        """
+        fanout = FanOut(timeout=self.timeout, deadline=self.deadline)
+        tools = {ctx: self.tool.for_context(ctx) for ctx in contexts or self.contexts}
+        results = fanout.run({ctx: (lambda t=tool: call(t), self.timeout) for ctx, tool in tools.items()})
+        return ClusterResults(results, kind, record)
+
+    async def query_async(self, call, contexts=None, kind: str = "results", record=None) -> ClusterResults:
+        """
+        call(tool) → awaitable, e.g. lambda t: t.get_pods_async("prod").
+        """
+        fanout = FanOut(timeout=self.timeout, deadline=self.deadline)
+        tools = {ctx: self.tool.for_context(ctx) for ctx in contexts or self.contexts}
+        results = await fanout.run_async({ctx: (call(tool), self.timeout) for ctx, tool in tools.items()})
+        return ClusterResults(results, kind, record)
+
+    # ---- PODS / NODES ----
+
+    def pods(self, namespace: str = None, contexts=None, all_namespaces: bool = False):
+        return self.query(lambda t: t.get_pods(namespace, all_namespaces), contexts, "pods", Pod)
+
+    async def pods_async(self, namespace: str = None, contexts=None, all_namespaces: bool = False):
+        return await self.query_async(lambda t: t.get_pods_async(namespace, all_namespaces), contexts, "pods", Pod)
+
+    def nodes(self, contexts=None):
+        return self.query(lambda t: t.get_nodes(), contexts, "nodes", Node)
+
+    async def nodes_async(self, contexts=None):
+        return await self.query_async(lambda t: t.get_nodes_async(), contexts, "nodes", Node)
+
+    # ---- ROLLOUT STATUS ----
+
+    def rollout_status(self, deployment: str, namespace: str = None, contexts=None):
+        def call(t):
+            return _rollout(t.context, deployment, namespace, t.rollout_status(deployment, namespace))
+        return self.query(call, contexts, "rollouts", Rollout)
+
+    async def rollout_status_async(self, deployment: str, namespace: str = None, contexts=None):
+        async def call(t):
+            out = await t.rollout_status_async(deployment, namespace)
+            return _rollout(t.context, deployment, namespace, out)
+        return await self.query_async(call, contexts, "rollouts", Rollout)
+
+    # ---- HEALTH ----
+
+    def health(self, namespace: str = None, contexts=None):
+        def call(t):
+            return _health(t.context, t.get_nodes(), t.get_pods(namespace))
+        return self.query(call, contexts, "clusters", ClusterHealth)
+
+    async def health_async(self, namespace: str = None, contexts=None):
+        async def call(t):
+            nodes, pods = await asyncio.gather(t.get_nodes_async(), t.get_pods_async(namespace))
+            return _health(t.context, nodes, pods)
+        return await self.query_async(call, contexts, "clusters", ClusterHealth)
+
+
+# ---- PER-CLUSTER ROWS ----
+
+def _first_line(text):
+    return text.strip().splitlines()[0] if text and text.strip() else ""
+
+
+def _rollout(ctx, deployment, namespace, out):
+    if is_error_result(out):
+        status = "error"
+    elif "successfully rolled out" in out:
+        status = "rolled-out"
+    else:
+        status = "progressing"
+    return Rollout(ctx, namespace, deployment, status, _first_line(out))
+
+
+def _health(ctx, nodes, pods):
+    for out in (nodes, pods):
+        if isinstance(out, str):
+            return ClusterHealth(ctx, "error", message=_first_line(out))
+
+    nodes, pods = tag(nodes, ctx, Node), tag(pods, ctx, Pod)
+    ready = sum(1 for n in nodes if n.ready)
+    unhealthy = sum(1 for p in pods if not p.healthy)
+    status = "ok" if ready == len(nodes) and not unhealthy else "degraded"
+    return ClusterHealth(
+        ctx, status, f"{ready}/{len(nodes)}", len(pods), unhealthy,
+        sum(p.restarts or 0 for p in pods),
+    )
@@ -0,0 +1,366 @@
+# agent/tools/records.py
+
+import os
+import json
+
+from agent.core.cache import is_error_result
+from agent.core.output import OutputHandle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def output_mode() -> str:
+    """
+    AGENT_OUTPUT_MODE: text (CLI tables / plain text, default) | structured
+    """
+    return os.getenv("AGENT_OUTPUT_MODE", "text").lower()
+
+
+def loads(data):
+    """
+    JSON → Python, with orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ---- RECORDS ----
+
+class Record:
+    """
+    Compact typed record: fixed __slots__, no per-instance dict.
+
+    Supports:
+      - attribute access (pod.phase)
+      - mapping-style access (pod["phase"], pod.get("phase")), so code
+        written for the API backend's / watch cache's dicts works as is
+      - as_dict(), one-line str() for reports
+
+    fields is every slot in column order, inherited ones included (see
+    clustered()).
+    """
+
+    __slots__ = ()
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "fields" not in cls.__dict__:
+            cls.fields = cls.fields + cls.__slots__
+
+    def __init__(self, *args, **kwargs):
+        for name, value in zip(self.fields, args):
+            setattr(self, name, value)
+        for name in self.fields[len(args):]:
+            setattr(self, name, kwargs.get(name))
+
+    def __getitem__(self, key):
+        if key not in self.fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.fields else default
+
+    def __contains__(self, key):
+        return key in self.fields
+
+    def keys(self):
+        return self.fields
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in self.fields}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __str__(self):
+        return " ".join(f"{k}={getattr(self, k)}" for k in self.fields if getattr(self, k) not in (None, ""))
+
+
+class Pod(Record):
+    __slots__ = ("namespace", "name", "phase", "ready", "restarts", "reason", "node", "ip")
+
+    @property
+    def healthy(self) -> bool:
+        if self.phase in ("Succeeded", "Completed"):
+            return True
+        done, _, total = (self.ready or "").partition("/")
+        return self.phase == "Running" and done == total and not self.restarts and not self.reason
+
+    @classmethod
+    def from_json(cls, item):
+        meta, spec, status = item.get("metadata", {}), item.get("spec", {}), item.get("status", {})
+        statuses = status.get("containerStatuses") or []
+        containers = spec.get("containers") or statuses
+        reason = status.get("reason")
+        for c in statuses:
+            state = c.get("state") or {}
+            waiting = state.get("waiting") or state.get("terminated")
+            if waiting and waiting.get("reason") not in (None, "Completed"):
+                reason = waiting["reason"]
+                break
+        return cls(
+            meta.get("namespace"),
+            meta.get("name"),
+            status.get("phase"),
+            f"{sum(1 for c in statuses if c.get('ready'))}/{len(containers)}",
+            sum(c.get("restartCount", 0) for c in statuses),
+            reason,
+            spec.get("nodeName"),
+            status.get("podIP"),
+        )
+
+
+class Service(Record):
+    __slots__ = ("namespace", "name", "type", "cluster_ip", "external_ip", "ports")
+
+    @classmethod
+    def from_json(cls, item):
+        meta, spec = item.get("metadata", {}), item.get("spec", {})
+        ingress = ((item.get("status") or {}).get("loadBalancer") or {}).get("ingress") or []
+        external = [i.get("ip") or i.get("hostname") for i in ingress] or spec.get("externalIPs") or []
+        ports = [f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in spec.get("ports") or []]
+        return cls(
+            meta.get("namespace"),
+            meta.get("name"),
+            spec.get("type"),
+            spec.get("clusterIP"),
+            ",".join(external) or None,
+            ",".join(ports),
+        )
+
+
+class Node(Record):
+    __slots__ = ("name", "ready", "unschedulable", "roles", "kubelet", "ip")
+
+    @classmethod
+    def from_json(cls, item):
+        meta, spec, status = item.get("metadata", {}), item.get("spec", {}), item.get("status", {})
+        conditions = status.get("conditions") or []
+        ready = next((c.get("status") for c in conditions if c.get("type") == "Ready"), "Unknown")
+        roles = [k.rsplit("/", 1)[-1] for k in meta.get("labels") or {} if k.startswith("node-role.kubernetes.io/")]
+        ips = [a.get("address") for a in status.get("addresses") or [] if a.get("type") == "InternalIP"]
+        return cls(
+            meta.get("name"),
+            ready == "True",
+            bool(spec.get("unschedulable")),
+            ",".join(roles) or None,
+            (status.get("nodeInfo") or {}).get("kubeletVersion"),
+            ips[0] if ips else None,
+        )
+
+
+class Release(Record):
+    __slots__ = ("namespace", "name", "revision", "status", "chart", "app_version", "updated")
+
+    @classmethod
+    def from_json(cls, item):
+        revision = item.get("revision")
+        return cls(
+            item.get("namespace"),
+            item.get("name"),
+            int(revision) if str(revision).isdigit() else revision,
+            item.get("status"),
+            item.get("chart"),
+            item.get("app_version"),
+            item.get("updated"),
+        )
+
+
+class PlanChange(Record):
+    __slots__ = ("address", "resource_type", "action", "reason")
+
+    @classmethod
+    def from_json(cls, event):
+        change = event.get("change", {})
+        resource = change.get("resource", {})
+        return cls(resource.get("addr"), resource.get("resource_type"), change.get("action"), change.get("reason"))
+
+
+class ClusterHealth(Record):
+    """
+    One cluster's line in a multi-cluster health view.
+    """
+    __slots__ = ("cluster", "status", "nodes", "pods", "unhealthy", "restarts", "message")
+
+
+class Rollout(Record):
+    __slots__ = ("cluster", "namespace", "deployment", "status", "message")
+
+
+class RecordList(list):
+    """
+    List of records that renders as a compact table.
+
+    Supports:
+      - where(field=value, ...) / count_by(field) — filter and aggregate
+        without parsing text
+      - as_dicts() for JSON / the LLM compactor
+      - summary: one line printed above the table (e.g. plan totals)
+    """
+
+    def __init__(self, items=(), kind: str = "records", summary: str = None):
+        super().__init__(items)
+        self.kind = kind
+        self.summary = summary
+
+    def where(self, **match):
+        return RecordList((r for r in self if all(r.get(k) == v for k, v in match.items())), self.kind)
+
+    def count_by(self, field):
+        counts = {}
+        for r in self:
+            key = r.get(field)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def as_dicts(self):
+        return [r.as_dict() for r in self]
+
+    def render(self):
+        head = [self.summary] if self.summary else []
+        if not self:
+            return "\n".join(head + [f"(no {self.kind})"])
+
+        fields = self[0].fields
+        rows = [[("" if getattr(r, f) is None else str(getattr(r, f))) for f in fields] for r in self]
+        # drop columns that are empty everywhere
+        keep = [i for i in range(len(fields)) if any(row[i] for row in rows)]
+        header = [fields[i].upper() for i in keep]
+        widths = [max(len(header[n]), *(len(row[i]) for row in rows)) for n, i in enumerate(keep)]
+        lines = ["  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip()]
+        lines += ["  ".join(row[i].ljust(w) for i, w in zip(keep, widths)).rstrip() for row in rows]
+        return "\n".join(head + lines)
+
+    def __str__(self):
+        return self.render()
+
+
+# ---- CLUSTER TAGS ----
+
+_CLUSTERED = {}
+
+
+def clustered(cls):
+    """
+    Subclass of a record type with a leading "cluster" field, for
+    multi-cluster views. Built once per type; keeps properties such as
+    Pod.healthy.
+    """
+    tagged = _CLUSTERED.get(cls)
+    if tagged is None:
+        tagged = type(cls.__name__, (cls,), {"__slots__": ("cluster",), "fields": ("cluster",) + cls.fields})
+        tagged = _CLUSTERED.setdefault(cls, tagged)
+    return tagged
+
+
+def tag(items, cluster, cls):
+    """
+    Records (or the API backend's / watch cache's dicts) → cls records
+    tagged with their cluster.
+    """
+    tagged = clustered(cls)
+    out = []
+    for item in items:
+        values = item.as_dict() if isinstance(item, Record) else item
+        out.append(tagged(cluster, **{k: values.get(k) for k in cls.fields}))
+    return out
+
+
+# ---- PARSERS (CLI JSON → records) ----
+
+def _parse(out, build, error_tag):
+    """
+    out is the CLI output: a str, or an OutputHandle when it was too big
+    to keep in memory (see run_output; the handle is closed once parsed).
+    Error strings pass through untouched; output that does not parse is
+    reported as "[<error_tag>] ..." rather than returned as if it were a
+    result.
+    """
+    if is_error_result(out):
+        return out
+    try:
+        return build(out)
+    except (ValueError, TypeError, AttributeError, KeyError) as e:
+        return f"[{error_tag}] could not parse JSON output: {e}"
+    finally:
+        if isinstance(out, OutputHandle):
+            out.close()
+
+
+def _items(out):
+    """
+    items of a kubectl List, streamed from a handle one object at a time.
+    """
+    if isinstance(out, OutputHandle):
+        return out.iter_json("items.item")
+    return loads(out)["items"]
+
+
+def pods(out, error_tag: str = "kubectl-error"):
+    """
+    kubectl get pods -o json
+    """
+    return _parse(out, lambda o: RecordList((Pod.from_json(i) for i in _items(o)), "pods"), error_tag)
+
+
+def services(out, error_tag: str = "kubectl-error"):
+    """
+    kubectl get svc -o json
+    """
+    return _parse(out, lambda o: RecordList((Service.from_json(i) for i in _items(o)), "services"), error_tag)
+
+
+def nodes(out, error_tag: str = "kubectl-error"):
+    """
+    kubectl get nodes -o json
+    """
+    return _parse(out, lambda o: RecordList((Node.from_json(i) for i in _items(o)), "nodes"), error_tag)
+
+
+def releases(out, error_tag: str = "helm-error"):
+    """
+    helm list -o json
+    """
+    def build(o):
+        items = o.iter_json("item") if isinstance(o, OutputHandle) else loads(o) or []
+        return RecordList((Release.from_json(i) for i in items), "releases")
+
+    return _parse(out, build, error_tag)
+
+
+def plan_changes(out, error_tag: str = "terraform-error"):
+    """
+    terraform plan -json: one JSON event per line; keeps planned_change
+    events, with the change_summary message as the list summary.
+    """
+    def build(o):
+        changes = RecordList(kind="changes")
+        for line in o.lines() if isinstance(o, OutputHandle) else o.splitlines():
+            if not line.startswith("{"):
+                continue
+            event = loads(line)
+            if event.get("type") == "planned_change":
+                changes.append(PlanChange.from_json(event))
+            elif event.get("type") == "change_summary":
+                changes.summary = event.get("@message")
+        return changes
+
+    return _parse(out, build, error_tag)
+
+
+# kubectl resource name → parser, for kinds that have a record type
+KUBECTL_PARSERS = {
+    "pods": pods, "pod": pods, "po": pods,
+    "services": services, "service": services, "svc": services,
+    "nodes": nodes, "node": nodes, "no": nodes,
+}
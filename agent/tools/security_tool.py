@@ -1,6 +1,8 @@
 # agent/tools/security_tool.py
 
-import subprocess
+
+from agent.core.output import run_output
+from agent.core.process import run_text
 
 
 class SecurityTool:
@@ -28,14 +30,14 @@ class SecurityTool:
         Scan container image for vulnerabilities.
         """
         cmd = ["trivy", "image", "--quiet", "--format", "json", image]
-        return self._exec(cmd)
+        return self._exec(cmd, large=True)
 
     def scan_filesystem(self, path: str):
         """
         Scan local directory for vulnerabilities / secrets.
         """
         cmd = ["trivy", "fs", "--quiet", "--format", "json", path]
-        return self._exec(cmd)
+        return self._exec(cmd, large=True)
 
     def scan_sbom(self, path: str):
         """
@@ -73,11 +75,10 @@ class SecurityTool:
 
     # ---- INTERNAL EXEC ----
 
-    def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return result.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[security-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return f"[security-tool-missing] {cmd[0]} not installed."
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            error_tag="security-error",
+            missing=f"[security-tool-missing] {cmd[0]} not installed."
+        )
@@ -1,8 +1,13 @@
 # agent/tools/terraform_tool.py
 
-import subprocess
 import os
 
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools import records
+from agent.tools.records import output_mode
+
+
 class TerraformTool:
     """
     Terraform Tool for running IaC jobs using terraform CLI.
@@ -21,11 +26,18 @@ class TerraformTool:
       - Azure
       - K8s cluster provisioning
       - EKS/AKS/GKE modules
+
+    Output (AGENT_OUTPUT_MODE env):
+      - text        -no-color text (default)
+      - structured  plan() runs `terraform plan -json` and returns
+                    PlanChange records with the change summary
+                    (agent.tools.records)
     """
 
     def __init__(self, workdir: str = None):
         # allow user to specify terraform directory
         self.workdir = workdir or os.getcwd()
+        self.structured = output_mode() == "structured"
 
     # ---- INIT ----
 
@@ -36,6 +48,8 @@ class TerraformTool:
     # ---- PLAN ----
 
     def plan(self):
+        if self.structured:
+            return records.plan_changes(self._exec(["terraform", "plan", "-no-color", "-json"], large=True))
         cmd = ["terraform", "plan", "-no-color"]
         return self._exec(cmd)
 
@@ -74,17 +88,11 @@ class TerraformTool:
 
     # ---- INTERNAL EXEC ----
 
-    def _exec(self, cmd):
-        try:
-            result = subprocess.check_output(
-                cmd,
-                stderr=subprocess.STDOUT,
-                cwd=self.workdir
-            )
-            return result.decode("utf-8").strip()
-
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-error] {e.output.decode('utf-8').strip()}"
-
-        except FileNotFoundError:
-            return "[terraform-not-installed] terraform CLI not found."
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            cwd=self.workdir,
+            error_tag="terraform-error",
+            missing="[terraform-not-installed] terraform CLI not found."
+        )
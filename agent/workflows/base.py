@@ -0,0 +1,79 @@
+# agent/workflows/base.py
+
+import asyncio
+
+from agent.core.fanout import FanOut
+from agent.llm.compactor import ContextCompactor
+
+
+class BaseWorkflow:
+    """
+    Common base for multi-signal workflows.
+
+    Provides:
+      - shared context / memory / llm wiring
+      - fan-out of independent tool calls (concurrent, with timeouts)
+      - async entry point (run_async) used by the async Executor
+      - rendering of "[label]\\nvalue" report sections
+      - token-budgeted LLM explanation of the collected signals
+    """
+
+    name = None
+
+    # set by the Executor: explain() returns a TokenStream instead of a str
+    stream = False
+
+    def __init__(self, context=None, memory=None, llm=None):
+        self.context = context
+        self.memory = memory
+        self.llm = llm
+        self.compaction = None
+
+    # ---- FAN-OUT ----
+
+    def fanout(self, calls: dict, timeout: float = None, deadline: float = None):
+        """
+        Run independent signals concurrently.
+        Returns a FanOutResult (label → result, partial on timeout/failure).
+        """
+        return FanOut(timeout=timeout, deadline=deadline).run(calls)
+
+    async def fanout_async(self, calls: dict, timeout: float = None, deadline: float = None):
+        """
+        Same as fanout(), but awaits coroutines on the running event loop.
+        """
+        return await FanOut(timeout=timeout, deadline=deadline).run_async(calls)
+
+    # ---- ASYNC ENTRY ----
+
+    async def run_async(self, plan: dict):
+        """
+        Default async path: run the sync workflow on a worker thread so it
+        never blocks the event loop. Multi-signal workflows override this
+        with native awaits.
+        """
+        return await asyncio.to_thread(self.run, plan)
+
+    # ---- LLM ----
+
+    def explain(self, instruction: str, results: dict) -> str:
+        """
+        Compacts the signals (ContextCompactor) before sending them to
+        llm.explain. The compaction report is kept on self.compaction
+        and in context["compaction"].
+        """
+        text, report = ContextCompactor().compact(results)
+        self.compaction = report
+
+        if self.context:
+            self.context.set("compaction", report.as_dict())
+
+        prompt = f"{instruction}\n{text}"
+        if self.stream and hasattr(self.llm, "explain_stream"):
+            return self.llm.explain_stream(prompt)
+        return self.llm.explain(prompt)
+
+    # ---- REPORT ----
+
+    def render(self, results: dict) -> str:
+        return "\n\n".join(f"[{label}]\n{value}" for label, value in results.items())
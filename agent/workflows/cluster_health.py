@@ -1,12 +1,12 @@
 # agent/workflows/cluster_health.py
 
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.monitoring_tool import MonitoringTool
-from agent.tools.logging_tool import LoggingTool
-from agent.tools.helper_tool import HelperTool
+import asyncio
 
+from agent.core.container import ToolRef
+from agent.workflows.base import BaseWorkflow
 
-class ClusterHealthWorkflow:
+
+class ClusterHealthWorkflow(BaseWorkflow):
     """
     Cluster Health Workflow for SRE & DevOps situational awareness.
 
@@ -25,17 +25,22 @@ class ClusterHealthWorkflow:
       - AKS
       - Minikube / Kind
       - K3s
+
+    Multi-cluster: with entities["clusters"] ("all", or a list of kube
+    contexts) the same health check runs on every cluster in parallel
+    (MultiCluster) and the report is one cluster-tagged table.
     """
 
-    def __init__(self, context=None, memory=None, llm=None):
-        self.context = context
-        self.memory = memory
-        self.llm = llm
+    name = "cluster_health"
 
-        self.k8s = KubernetesTool()
-        self.monitor = MonitoringTool()
-        self.logging = LoggingTool()
-        self.helper = HelperTool()
+    k8s = ToolRef("k8s")
+    clusters = ToolRef("clusters")
+    monitor = ToolRef("monitor")
+    logging = ToolRef("logging")
+    helper = ToolRef("helper")
+
+    def __init__(self, context=None, memory=None, llm=None):
+        super().__init__(context, memory, llm)
 
     def run(self, plan: dict):
         """
@@ -51,44 +56,78 @@ class ClusterHealthWorkflow:
         entities = plan.get("entities", {})
         namespace = entities.get("namespace")
 
-        output = []
+        if entities.get("clusters"):
+            results = self.clusters.health(namespace, self._contexts(entities))
+            return self._finish_clusters(namespace, results)
 
-        # ---- Pods ----
-        pods = self.k8s.get_pods(namespace)
-        output.append(f"[pods]\n{pods}")
+        # ---- Signals (fetched concurrently) ----
+        results = self.fanout({
+            "pods": lambda: self.k8s.get_pods(namespace),
+            "services": lambda: self.k8s.get_services(namespace),
+            "restarts": lambda: self.monitor.pod_restarts(namespace),
+            "alerts": self.monitor.list_alerts,
+        })
 
-        # ---- Services ----
-        svcs = self.k8s.get_services(namespace)
-        output.append(f"[services]\n{svcs}")
+        # ---- Nodes (optional future) ----
+        # can use prom_query("kube_node_status_condition")
 
-        # ---- Restart Counts ----
-        restarts = self.monitor.pod_restarts(namespace)
-        output.append(f"[restarts]\n{restarts}")
+        return self._finish(namespace, results)
 
-        # ---- Alerts ----
-        alerts = self.monitor.list_alerts()
-        output.append(f"[alerts]\n{alerts}")
+    async def run_async(self, plan: dict):
+        entities = plan.get("entities", {})
+        namespace = entities.get("namespace")
 
-        # ---- Nodes (optional future) ----
-        # can use prom_query("kube_node_status_condition")
+        if entities.get("clusters"):
+            results = await self.clusters.health_async(namespace, self._contexts(entities))
+            return await asyncio.to_thread(self._finish_clusters, namespace, results)
+
+        results = await self.fanout_async({
+            "pods": self.k8s.get_pods_async(namespace),
+            "services": self.k8s.get_services_async(namespace),
+            "restarts": self.monitor.pod_restarts_async(namespace),
+            "alerts": self.monitor.list_alerts_async(),
+        })
 
-        raw_output = "\n\n".join(output)
+        # LLM summary is a blocking call → keep it off the event loop
+        return await asyncio.to_thread(self._finish, namespace, results)
 
+    def _finish(self, namespace, results):
         # ---- LLM Summary ----
         if self.llm:
-            explained = self.llm.explain(
-                f"Analyze Kubernetes cluster health and summarize:\n{raw_output}"
+            explained = self.explain(
+                "Analyze Kubernetes cluster health and summarize:", results
+            )
+            self._update_context(namespace, status="analysis-complete", results=results)
+            return explained
+
+        self._update_context(namespace, status="raw", results=results)
+        return self.render(results)
+
+    # ---- MULTI-CLUSTER ----
+
+    def _contexts(self, entities):
+        clusters = entities["clusters"]
+        if clusters == "all":
+            return None     # every context MultiCluster knows
+        return [clusters] if isinstance(clusters, str) else list(clusters)
+
+    def _finish_clusters(self, namespace, results):
+        merged = results.merged()
+        if self.llm:
+            explained = self.explain(
+                "Compare the health of these Kubernetes clusters and summarize:", {"clusters": merged}
             )
-            self._update_context(namespace, status="analysis-complete")
+            self._update_context(namespace, status="analysis-complete", results=results)
             return explained
 
-        self._update_context(namespace, status="raw")
-        return raw_output
+        self._update_context(namespace, status="raw", results=results)
+        return merged.render()
 
-    def _update_context(self, namespace, status):
+    def _update_context(self, namespace, status, results):
         if self.context:
             self.context.update({
                 "workflow": "cluster_health",
                 "namespace": namespace,
-                "status": status
+                "status": status,
+                "partial": results.timed_out + results.failed
             })
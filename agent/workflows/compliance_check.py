@@ -1,7 +1,6 @@
 # agent/workflows/compliance_check.py
 
-from agent.tools.security_tool import SecurityTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class ComplianceCheckWorkflow:
@@ -23,14 +22,14 @@ class ComplianceCheckWorkflow:
       - severity prioritization
     """
 
+    security = ToolRef("security")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, llm=None):
         self.context = context
         self.memory = memory
         self.llm = llm
 
-        self.security = SecurityTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         Example plan:
@@ -62,7 +61,7 @@ class ComplianceCheckWorkflow:
         if target == "image" and image:
             scan = self.security.scan_image(image)
             output.append(f"[image-compliance]\n{scan}")
-            return self._finish(output)
+            return self._finish(output, scan)
 
         # ---- SBOM POLICY COMPLIANCE ----
         if target == "sbom" and path:
@@ -78,14 +77,17 @@ class ComplianceCheckWorkflow:
 
         return "[compliance-error] unsupported target or missing entity."
 
-    def _finish(self, output):
+    def _finish(self, output, result=None):
+        # large scan results are OutputHandles: the report gets a preview,
+        # the context keeps the handle (and its file) for the full output
         raw = "\n\n".join(output)
 
         # update context
         if self.context:
             self.context.update({
                 "workflow": "compliance_check",
-                "status": "ok"
+                "status": "ok",
+                "last_result": result
             })
 
         # LLM interpretation + remediation
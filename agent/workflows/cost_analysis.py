@@ -1,10 +1,10 @@
 # agent/workflows/cost_analysis.py
 
-from agent.tools.cost_tool import CostTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
+from agent.workflows.base import BaseWorkflow
 
 
-class CostAnalysisWorkflow:
+class CostAnalysisWorkflow(BaseWorkflow):
     """
     Cost Analysis Workflow for FinOps automation.
 
@@ -19,13 +19,13 @@ class CostAnalysisWorkflow:
       - recommending optimization strategies
     """
 
-    def __init__(self, context=None, memory=None, llm=None):
-        self.context = context
-        self.memory = memory
-        self.llm = llm
+    name = "cost_analysis"
+
+    cost = ToolRef("cost")
+    helper = ToolRef("helper")
 
-        self.cost = CostTool()
-        self.helper = HelperTool()
+    def __init__(self, context=None, memory=None, llm=None):
+        super().__init__(context, memory, llm)
 
     def run(self, plan: dict):
         """
@@ -47,35 +47,30 @@ class CostAnalysisWorkflow:
         service = entities.get("service")
         path = entities.get("path")
 
-        output = []
-
         # ---- K8s Namespace Cost ----
         if target == "namespace" and namespace:
             ns_cost = self.cost.namespace_cost(namespace)
-            output.append(f"[namespace-cost]\n{ns_cost}")
-            return self._finish(output)
+            return self._finish({"namespace-cost": ns_cost})
 
         # ---- K8s Service Cost ----
         if target == "service" and service:
             svc_cost = self.cost.service_cost(service)
-            output.append(f"[service-cost]\n{svc_cost}")
-            return self._finish(output)
+            return self._finish({"service-cost": svc_cost})
 
         # ---- Terraform Infra Cost ----
         if target == "terraform" and path:
-            breakdown = self.cost.terraform_cost(path)
-            diff = self.cost.terraform_diff(path)
-            output.append(f"[infra-cost-breakdown]\n{breakdown}")
-            output.append(f"[infra-cost-diff]\n{diff}")
-            return self._finish(output)
+            # breakdown + diff are independent infracost runs
+            results = self.fanout({
+                "infra-cost-breakdown": lambda: self.cost.terraform_cost(path),
+                "infra-cost-diff": lambda: self.cost.terraform_diff(path),
+            })
+            return self._finish(results)
 
         return "[cost-analysis-error] missing target or required entities."
 
     # ---- Finalization with optional LLM explanation ----
 
-    def _finish(self, output):
-        raw = "\n\n".join(output)
-
+    def _finish(self, results):
         # update context for traceability
         if self.context:
             self.context.update({
@@ -85,8 +80,8 @@ class CostAnalysisWorkflow:
 
         # LLM Explanation + Recommendations
         if self.llm:
-            return self.llm.explain(
-                f"Analyze and explain cost data for FinOps context:\n{raw}"
+            return self.explain(
+                "Analyze and explain cost data for FinOps context:", results
             )
 
-        return raw
+        return self.render(results)
@@ -1,19 +1,18 @@
 # agent/workflows/debug.py
 
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.logging_tool import LoggingTool
-from agent.tools.monitoring_tool import MonitoringTool
-from agent.tools.cicd_tool import CICDTool
-from agent.tools.helper_tool import HelperTool
+import asyncio
 
+from agent.core.container import ToolRef
+from agent.workflows.base import BaseWorkflow
 
-class DebugWorkflow:
+
+class DebugWorkflow(BaseWorkflow):
     """
     Debugging Workflow for SRE + DevOps troubleshooting.
 
     Performs multi-signal debugging:
       - kubectl describe
-      - kubectl logs
+      - error digest of app logs (bounded Loki range backfill)
       - metrics (Prometheus)
       - alerts (Alertmanager)
       - pipeline status (CI/CD)
@@ -22,16 +21,16 @@ class DebugWorkflow:
     Outputs can be explained via cloud LLM for human clarity.
     """
 
-    def __init__(self, context=None, memory=None, llm=None):
-        self.context = context
-        self.memory = memory
-        self.llm = llm
+    name = "debug"
 
-        self.k8s = KubernetesTool()
-        self.logging = LoggingTool()
-        self.monitor = MonitoringTool()
-        self.cicd = CICDTool()
-        self.helper = HelperTool()
+    k8s = ToolRef("k8s")
+    logging = ToolRef("logging")
+    monitor = ToolRef("monitor")
+    cicd = ToolRef("cicd")
+    helper = ToolRef("helper")
+
+    def __init__(self, context=None, memory=None, llm=None):
+        super().__init__(context, memory, llm)
 
     def run(self, plan: dict):
         """
@@ -48,51 +47,88 @@ class DebugWorkflow:
         }
         """
         entities = plan.get("entities", {})
+
+        # all signals are independent → fetch concurrently
+        results = self.fanout(self._signals(entities))
+        return self._finish(entities, results)
+
+    async def run_async(self, plan: dict):
+        entities = plan.get("entities", {})
+        results = await self.fanout_async(self._signals_async(entities))
+
+        # LLM explanation is a blocking call → keep it off the event loop
+        return await asyncio.to_thread(self._finish, entities, results)
+
+    # ---- SIGNALS ----
+
+    def _signals(self, entities):
         app = entities.get("app")
         namespace = entities.get("namespace")
         provider = entities.get("provider")
         repo = entities.get("repo")
 
-        output = []
+        signals = {}
 
         # ---- KUBERNETES DEBUG ----
         if app:
-            pods = self.k8s.get_pods(namespace)
-            output.append(f"[pods]\n{pods}")
+            signals["pods"] = lambda: self.k8s.get_pods(namespace)
 
-            # logs from app
-            logs = self.logging.service_logs(app, namespace)
-            output.append(f"[logs]\n{logs}")
+            # logs from app: one bounded backfill, digested (no live tail wait)
+            signals["logs"] = lambda: self.logging.error_digest(app, namespace)
 
             # restarts
-            restarts = self.monitor.pod_restarts(namespace)
-            output.append(f"[restarts]\n{restarts}")
+            signals["restarts"] = lambda: self.monitor.pod_restarts(namespace)
 
         # ---- PIPELINE DEBUG (CI/CD) ----
         if provider and repo:
-            status = self.cicd.status(provider, repo)
-            output.append(f"[pipeline]\n{status}")
+            signals["pipeline"] = lambda: self.cicd.status(provider, repo)
 
         # ---- ALERTS ----
-        alerts = self.monitor.list_alerts()
-        output.append(f"[alerts]\n{alerts}")
+        signals["alerts"] = self.monitor.list_alerts
 
-        full_output = "\n\n".join(output)
+        return signals
 
+    def _signals_async(self, entities):
+        app = entities.get("app")
+        namespace = entities.get("namespace")
+        provider = entities.get("provider")
+        repo = entities.get("repo")
+
+        signals = {}
+
+        if app:
+            signals["pods"] = self.k8s.get_pods_async(namespace)
+            signals["logs"] = lambda: self.logging.error_digest(app, namespace)
+            signals["restarts"] = self.monitor.pod_restarts_async(namespace)
+
+        if provider and repo:
+            # no native async CI/CD client yet → worker thread
+            signals["pipeline"] = lambda: self.cicd.status(provider, repo)
+
+        signals["alerts"] = self.monitor.list_alerts_async()
+
+        return signals
+
+    # ---- REPORT ----
+
+    def _finish(self, entities, results):
+        app = entities.get("app")
+        namespace = entities.get("namespace")
         # ---- Hybrid LLM Explanation ----
         if self.llm:
-            explained = self.llm.explain(f"debug results: {full_output}")
-            self._update_context(status="analysis-complete", app=app, namespace=namespace)
+            explained = self.explain("debug results:", results)
+            self._update_context("analysis-complete", app, namespace, results)
             return explained
 
-        self._update_context(status="raw-debug", app=app, namespace=namespace)
-        return full_output
+        self._update_context("raw-debug", app, namespace, results)
+        return self.render(results)
 
-    def _update_context(self, status, app, namespace):
+    def _update_context(self, status, app, namespace, results):
         if self.context:
             self.context.update({
                 "workflow": "debug",
                 "app": app,
                 "namespace": namespace,
-                "status": status
+                "status": status,
+                "partial": results.timed_out + results.failed
             })
@@ -1,11 +1,6 @@
 # agent/workflows/deploy.py
 
-from agent.tools.docker_tool import DockerTool
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.helm_tool import HelmTool
-from agent.tools.terraform_tool import TerraformTool
-from agent.tools.aws_tool import AWSTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class DeployWorkflow:
@@ -32,18 +27,18 @@ class DeployWorkflow:
         - bootstrap cluster with AWS + kubeconfig
     """
 
+    docker = ToolRef("docker")
+    k8s = ToolRef("k8s")
+    helm = ToolRef("helm")
+    tf = ToolRef("tf")
+    aws = ToolRef("aws")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, llm=None):
         self.context = context
         self.memory = memory
         self.llm = llm
 
-        self.docker = DockerTool()
-        self.k8s = KubernetesTool()
-        self.helm = HelmTool()
-        self.tf = TerraformTool()
-        self.aws = AWSTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         plan dict structure (example):
@@ -1,12 +1,10 @@
 # agent/workflows/pipeline_debug.py
 
-from agent.tools.cicd_tool import CICDTool
-from agent.tools.logging_tool import LoggingTool
-from agent.tools.monitoring_tool import MonitoringTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
+from agent.workflows.base import BaseWorkflow
 
 
-class PipelineDebugWorkflow:
+class PipelineDebugWorkflow(BaseWorkflow):
     """
     Pipeline Debug Workflow for CI/CD troubleshooting.
 
@@ -22,15 +20,15 @@ class PipelineDebugWorkflow:
       - future: Jenkins / ArgoCD / Tekton / Bitbucket
     """
 
-    def __init__(self, context=None, memory=None, llm=None):
-        self.context = context
-        self.memory = memory
-        self.llm = llm
+    name = "pipeline_debug"
+
+    cicd = ToolRef("cicd")
+    logging = ToolRef("logging")
+    monitor = ToolRef("monitor")
+    helper = ToolRef("helper")
 
-        self.cicd = CICDTool()
-        self.logging = LoggingTool()
-        self.monitor = MonitoringTool()
-        self.helper = HelperTool()
+    def __init__(self, context=None, memory=None, llm=None):
+        super().__init__(context, memory, llm)
 
     def run(self, plan: dict):
         """
@@ -55,44 +53,33 @@ class PipelineDebugWorkflow:
         branch = entities.get("branch")
         namespace = entities.get("namespace")
 
-        output = []
-
         # ---- PIPELINE STATUS ----
         if provider and repo:
-            status = self.cicd.status(provider, repo)
-            output.append(f"[pipeline-status]\n{status}")
-
-            runs = self.cicd.list_runs(provider, repo)
-            output.append(f"[pipeline-runs]\n{runs}")
-
+            target = repo
         elif provider and project_id:
-            status = self.cicd.status(provider, str(project_id))
-            output.append(f"[pipeline-status]\n{status}")
-
-            runs = self.cicd.list_runs(provider, str(project_id))
-            output.append(f"[pipeline-runs]\n{runs}")
-
+            target = str(project_id)
         else:
             return "[pipeline-debug-error] missing provider + repo/project_id"
 
-        # ---- ALERT / METRICS CONTEXT (Optional) ----
-        alerts = self.monitor.list_alerts()
-        output.append(f"[alerts]\n{alerts}")
+        # status, runs and alerts are independent → fetch concurrently
+        results = self.fanout({
+            "pipeline-status": lambda: self.cicd.status(provider, target),
+            "pipeline-runs": lambda: self.cicd.list_runs(provider, target),
 
-        # Future: fetch pipeline logs (GH/GitLab artifacts)
+            # ---- ALERT / METRICS CONTEXT (Optional) ----
+            "alerts": self.monitor.list_alerts,
+        })
 
-        raw_output = "\n\n".join(output)
+        # Future: fetch pipeline logs (GH/GitLab artifacts)
 
         # ---- EXPLANATION VIA LLM ----
         if self.llm:
-            explanation = self.llm.explain(
-                f"Pipeline debug info: {raw_output}"
-            )
+            explanation = self.explain("Pipeline debug info:", results)
             self._update_context(provider, repo or project_id)
             return explanation
 
         self._update_context(provider, repo or project_id)
-        return raw_output
+        return self.render(results)
 
     def _update_context(self, provider, repo):
         if self.context:
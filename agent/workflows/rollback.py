@@ -1,10 +1,6 @@
 # agent/workflows/rollback.py
 
-from agent.tools.docker_tool import DockerTool
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.helm_tool import HelmTool
-from agent.tools.terraform_tool import TerraformTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class RollbackWorkflow:
@@ -25,18 +21,18 @@ class RollbackWorkflow:
       - memory of version/tag/commit
     """
 
+    docker = ToolRef("docker")
+    k8s = ToolRef("k8s")
+    helm = ToolRef("helm")
+    tf = ToolRef("tf")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, safety=None, llm=None):
         self.context = context
         self.memory = memory
         self.safety = safety
         self.llm = llm
 
-        self.docker = DockerTool()
-        self.k8s = KubernetesTool()
-        self.helm = HelmTool()
-        self.tf = TerraformTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         Plan example:
@@ -112,9 +108,6 @@ class RollbackWorkflow:
             })
 
     def _shell(self, cmd):
-        import subprocess
-        try:
-            out = subprocess.check_output(cmd.split(), stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except Exception as e:
-            return f"[rollback-shell-error] {str(e)}"
+        from agent.core.process import run_text
+
+        return run_text(cmd.split(), error_tag="rollback-shell-error")
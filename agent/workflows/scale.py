@@ -1,8 +1,6 @@
 # agent/workflows/scale.py
 
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.docker_tool import DockerTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class ScaleWorkflow:
@@ -17,15 +15,15 @@ class ScaleWorkflow:
       - future: metric-based scaling
     """
 
+    k8s = ToolRef("k8s")
+    docker = ToolRef("docker")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, llm=None):
         self.context = context
         self.memory = memory
         self.llm = llm
 
-        self.k8s = KubernetesTool()
-        self.docker = DockerTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         Example plan:
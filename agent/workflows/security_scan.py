@@ -1,7 +1,6 @@
 # agent/workflows/security_scan.py
 
-from agent.tools.security_tool import SecurityTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class SecurityScanWorkflow:
@@ -21,14 +20,14 @@ class SecurityScanWorkflow:
       - remediation suggestions
     """
 
+    security = ToolRef("security")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, llm=None):
         self.context = context
         self.memory = memory
         self.llm = llm
 
-        self.security = SecurityTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         Example plan:
@@ -57,14 +56,14 @@ class SecurityScanWorkflow:
                 return "[security-scan-error] missing image name."
             scan = self.security.scan_image(image)
             output.append(f"[image-scan]\n{scan}")
-            return self._finish(output)
+            return self._finish(output, scan)
 
         # ---- FILESYSTEM SCAN ----
         if target == "fs":
             path = entities.get("path") or "."
             scan = self.security.scan_filesystem(path)
             output.append(f"[filesystem-scan]\n{scan}")
-            return self._finish(output)
+            return self._finish(output, scan)
 
         # ---- SBOM ----
         if target == "sbom":
@@ -90,13 +89,16 @@ class SecurityScanWorkflow:
 
         return f"[security-scan-error] unsupported target '{target}'"
 
-    def _finish(self, output):
+    def _finish(self, output, result=None):
+        # large scan results are OutputHandles: the report gets a preview,
+        # the context keeps the handle (and its file) for the full output
         raw = "\n\n".join(output)
 
         if self.context:
             self.context.update({
                 "workflow": "security_scan",
-                "status": "ok"
+                "status": "ok",
+                "last_result": result
             })
 
         # Hybrid LLM adds remediation & prioritization
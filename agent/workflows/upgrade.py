@@ -1,10 +1,6 @@
 # agent/workflows/upgrade.py
 
-from agent.tools.helm_tool import HelmTool
-from agent.tools.kubernetes_tool import KubernetesTool
-from agent.tools.docker_tool import DockerTool
-from agent.tools.terraform_tool import TerraformTool
-from agent.tools.helper_tool import HelperTool
+from agent.core.container import ToolRef
 
 
 class UpgradeWorkflow:
@@ -23,18 +19,18 @@ class UpgradeWorkflow:
       - context tracks upgrade phase
     """
 
+    helm = ToolRef("helm")
+    k8s = ToolRef("k8s")
+    docker = ToolRef("docker")
+    tf = ToolRef("tf")
+    helper = ToolRef("helper")
+
     def __init__(self, context=None, memory=None, safety=None, llm=None):
         self.context = context
         self.memory = memory
         self.safety = safety
         self.llm = llm
 
-        self.helm = HelmTool()
-        self.k8s = KubernetesTool()
-        self.docker = DockerTool()
-        self.tf = TerraformTool()
-        self.helper = HelperTool()
-
     def run(self, plan: dict):
         """
         Example plan:
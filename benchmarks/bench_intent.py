@@ -0,0 +1,112 @@
+# benchmarks/bench_intent.py
+#
+# Intent classifier benchmark: accuracy on a labelled corpus and
+# throughput of classify_many, compared with the previous sequential
+# first-match classifier.
+#
+# Usage (from repo root):
+#   python -m benchmarks.bench_intent
+#   python -m benchmarks.bench_intent --repeat 2000 --show-errors
+#   python -m benchmarks.bench_intent --replay requests.jsonl   # any jsonl with query/title/body
+
+import os
+import json
+import time
+import argparse
+from collections import Counter
+
+from agent.nlp.intent_classifier import IntentClassifier
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_corpus.jsonl")
+
+
+# previous implementation: nine sequential substring scans, first match wins
+_LEGACY = [
+    ("DEPLOY", ["deploy", "launch", "start", "release", "create deployment", "apply"]),
+    ("ROLLBACK", ["rollback", "undo", "revert", "previous version"]),
+    ("DEBUG", ["debug", "fix", "fail", "error", "why", "troubleshoot", "issue"]),
+    ("SCALE", ["scale", "increase", "decrease", "replicas", "autoscale"]),
+    ("BUILD", ["build", "image", "docker build", "container build"]),
+    ("LOGS", ["logs", "error logs", "kubectl logs", "tail logs"]),
+    ("COST", ["cost", "price", "bill", "billing", "how much", "finops"]),
+    ("PIPELINE", ["pipeline", "cicd", "github actions", "jenkins", "gitlab ci", "workflow"]),
+    ("STATUS", ["status", "health", "slo", "sli", "uptime"]),
+]
+
+
+def legacy_classify(query):
+    text = query.lower()
+    for intent, words in _LEGACY:
+        if any(word in text for word in words):
+            return intent
+    return "UNKNOWN"
+
+
+def load(path):
+    rows = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line))
+    return rows
+
+
+def accuracy(classify, rows):
+    wrong = [(r["query"], r["intent"], classify(r["query"])) for r in rows if classify(r["query"]) != r["intent"]]
+    return 1 - len(wrong) / len(rows), wrong
+
+
+def throughput(fn, queries, repeat):
+    batch = queries * repeat
+    start = time.perf_counter()
+    fn(batch)
+    elapsed = time.perf_counter() - start
+    return len(batch) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="intent classifier accuracy + throughput")
+    parser.add_argument("--corpus", default=CORPUS)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--show-errors", action="store_true")
+    parser.add_argument("--replay", default=None, help="jsonl query log to classify")
+    args = parser.parse_args()
+
+    clf = IntentClassifier()
+    rows = load(args.corpus)
+    queries = [r["query"] for r in rows]
+
+    new_acc, new_wrong = accuracy(clf.classify, rows)
+    old_acc, old_wrong = accuracy(legacy_classify, rows)
+
+    # distinct strings per repeat, so classify_many's dedupe does not flatter it
+    def distinct(batch):
+        return [f"{q} #{i}" for i, q in enumerate(batch)]
+
+    new_qps = throughput(lambda b: clf.classify_many(distinct(b)), queries, args.repeat)
+    old_qps = throughput(lambda b: [legacy_classify(q) for q in distinct(b)], queries, args.repeat)
+
+    print(f"corpus: {len(rows)} labelled queries ({args.corpus})")
+    print(f"{'classifier':<12} {'accuracy':>9} {'queries/s':>12}")
+    print(f"{'compiled':<12} {new_acc:>8.1%} {new_qps:>12,.0f}")
+    print(f"{'legacy':<12} {old_acc:>8.1%} {old_qps:>12,.0f}")
+
+    if args.show_errors:
+        print("\nmisclassified (compiled):")
+        for query, expected, got in new_wrong:
+            print(f"  {query!r}: expected {expected}, got {got} {clf.rank(query)}")
+
+    if args.replay:
+        log = load(args.replay)
+        texts = [r.get("query") or f"{r.get('title', '')} {r.get('body', '')}" for r in log]
+        start = time.perf_counter()
+        intents = clf.classify_many(texts)
+        elapsed = time.perf_counter() - start
+        print(f"\nreplay: {len(texts)} queries in {elapsed * 1000:.1f} ms")
+        for intent, count in Counter(intents).most_common():
+            print(f"  {intent:<10} {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/bench_logging.py
+#
+# Request-path cost of the structured logger (agent/core/logger.py).
+#
+# Times each log call on the calling thread while the background writer
+# is running, for the kinds of records a query produces: a small info
+# event, a tool result carrying a large output, sampled debug events,
+# filtered debug events, errors and finished trace spans. Then reports
+# how long the writer takes to get everything on disk.
+#
+# Logs go to a temporary directory unless --dir is given. Exits 1 if any
+# scenario's p99 is over the budget.
+#
+# Usage (from repo root):
+#   python -m benchmarks.bench_logging
+#   python -m benchmarks.bench_logging --calls 200000 --output-kb 1024 --budget-us 50
+#   python -m benchmarks.bench_logging --dir /tmp/agent-logs --max-bytes 1048576
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from agent.core.logger import AgentLogger
+from agent.core.tracing import Tracer
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def measure(fn, calls):
+    """
+    Per-call wall time in µs, measured around each call.
+    """
+    clock = time.perf_counter_ns
+    out = []
+    for i in range(calls):
+        start = clock()
+        fn(i)
+        out.append((clock() - start) / 1000)
+    return out
+
+
+def scenarios(logger, output, tracer):
+    spans = []
+
+    def finished_span(i):
+        # a tool span as the tracer hands it to the logger
+        if not spans:
+            with tracer.span("k8s.get_pods", "tool", bytes_in=len(output), cache="miss") as s:
+                pass
+            spans.append(s)
+        logger.log_span(spans[0])
+
+    return {
+        "info (small)": lambda i: logger.info("query.start", query="check cluster health in prod", n=i),
+        "tool output": lambda i: logger.info("tool.result", "tool", tool="k8s.get_pods", output=output),
+        "debug sampled": lambda i: logger.debug("http.request", "tool", url="prometheus/api/v1/query", n=i),
+        "error": lambda i: logger.error("tool.error", "tool", tool="helm.upgrade", error="timeout", n=i),
+        "trace span": finished_span,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="logger request-path latency")
+    parser.add_argument("--calls", type=int, default=50_000, help="calls per scenario")
+    parser.add_argument("--output-kb", type=int, default=256, help="size of the large tool output")
+    parser.add_argument("--budget-us", type=float, default=50.0)
+    parser.add_argument("--dir", default=None, help="log directory (default: temporary)")
+    parser.add_argument("--max-bytes", type=int, default=None, help="rotate size (default: AGENT_LOG_MAX_BYTES)")
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix="agent-logs-")
+    logger = AgentLogger(directory=directory, level="debug", enabled=True)
+    if args.max_bytes:
+        logger.max_bytes = args.max_bytes
+    logger.capacity = max(logger.capacity, args.calls * 8)
+    tracer = Tracer(enabled=True, otel=False)
+    output = "NAME   READY   STATUS    RESTARTS   AGE\n" * (args.output_kb * 1024 // 40)
+
+    # debug records below the level cost only the level check
+    filtered = AgentLogger(directory=directory, level="info", enabled=True)
+
+    cases = scenarios(logger, output, tracer)
+    cases["debug filtered"] = lambda i: filtered.debug("http.request", "tool", n=i)
+
+    print(f"logs: {directory}   calls/scenario: {args.calls}   tool output: {args.output_kb} KiB")
+    print(f"{'scenario':<17}{'mean':>9}{'p50':>9}{'p99':>9}{'p99.9':>9}{'max':>10}")
+
+    over = []
+    start = time.perf_counter()
+    for name, fn in cases.items():
+        fn(0)
+        times = measure(fn, args.calls)
+        p99 = percentile(times, 99)
+        print(
+            f"{name:<17}{sum(times) / len(times):>7.2f}µs{percentile(times, 50):>7.2f}µs"
+            f"{p99:>7.2f}µs{percentile(times, 99.9):>7.2f}µs{max(times):>8.1f}µs"
+        )
+        if p99 > args.budget_us:
+            over.append(name)
+    produced = time.perf_counter() - start
+
+    flush_start = time.perf_counter()
+    logger.flush(timeout=120)
+    flushed = time.perf_counter() - flush_start
+    stats = logger.stats()
+    logger.close()
+
+    size = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+    print()
+    print(f"written {stats['written']} records ({size / 1e6:.1f} MB on disk) in {stats['batches']} batches, "
+          f"{stats['rotations']} rotations, {stats['sampled_out']} debug sampled out, {stats['dropped']} dropped")
+    print(f"writer caught up {flushed * 1000:.0f}ms after the last call ({produced:.2f}s of logging)")
+
+    if over:
+        print(f"\nover the {args.budget_us:.0f}µs p99 budget: {', '.join(over)}")
+        sys.exit(1)
+    print(f"\nall scenarios within the {args.budget_us:.0f}µs p99 budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_output.py
+#
+# Peak RSS of handling one large CLI output (a Trivy-style JSON report)
+# the old way (decoded str, joined into the workflow report) versus as an
+# OutputHandle (agent/core/output.py).
+#
+# Each scenario runs in a fresh interpreter so peak RSS is not shared; the
+# "baseline" scenario only imports the agent and reads nothing. The report
+# is produced by `cat` on a generated file, so the CLI itself is not part
+# of the numbers.
+#
+# Usage (from repo root):
+#   python -m benchmarks.bench_output
+#   python -m benchmarks.bench_output --mb 500
+
+import os
+import sys
+import json
+import argparse
+import resource
+import tempfile
+import subprocess
+
+
+def make_report(path, mb):
+    """
+    Trivy-like JSON: Results[].Vulnerabilities[] until the file is ~mb MB.
+    """
+    vuln = {
+        "VulnerabilityID": "CVE-2024-0000", "PkgName": "openssl", "InstalledVersion": "3.0.2",
+        "FixedVersion": "3.0.13", "Severity": "HIGH",
+        "Description": "A long vulnerability description " * 8,
+    }
+    line = json.dumps(vuln)
+    per_result = 1000
+    results = max(1, mb * 1024 * 1024 // (len(line) * per_result))
+    with open(path, "w") as f:
+        f.write('{"Results": [')
+        for r in range(results):
+            f.write("," if r else "")
+            f.write(f'{{"Target": "layer-{r}", "Vulnerabilities": [')
+            f.write(",".join([line] * per_result))
+            f.write("]}")
+        f.write("]}")
+
+
+def child(scenario, path):
+    from agent.core.output import OutputHandle, run_output
+
+    cmd = ["cat", path]
+    if scenario == "str":
+        out = subprocess.check_output(cmd).decode("utf-8").strip()
+        report = "\n\n".join([f"[image-scan]\n{out}"])
+        count = sum(len(r["Vulnerabilities"]) for r in json.loads(out)["Results"])
+    elif scenario == "handle":
+        out = run_output(cmd)
+        assert isinstance(out, OutputHandle)
+        report = "\n\n".join([f"[image-scan]\n{out}"])
+        count = sum(len(r["Vulnerabilities"]) for r in out.iter_json("Results.item"))
+    else:
+        report, count = "", 0
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_mb": peak_kb / 1024, "report_chars": len(report), "vulns": count}))
+
+
+def run_child(scenario, path):
+    out = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.bench_output", "--child", scenario, "--file", path]
+    )
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="peak RSS: str vs OutputHandle")
+    parser.add_argument("--mb", type=int, default=200, help="report size")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--file", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.file)
+        return
+
+    fd, path = tempfile.mkstemp(prefix="agent-report-", suffix=".json")
+    os.close(fd)
+    try:
+        make_report(path, args.mb)
+        print(f"report: {os.path.getsize(path) / 1e6:.0f} MB")
+        base = run_child("baseline", path)
+        print(f"{'scenario':<10}{'peak RSS':>12}{'over baseline':>16}{'report chars':>15}{'vulns':>10}")
+        for name in ("baseline", "str", "handle"):
+            r = base if name == "baseline" else run_child(name, path)
+            print(f"{name:<10}{r['peak_mb']:>10.0f}MB{r['peak_mb'] - base['peak_mb']:>14.0f}MB"
+                  f"{r['report_chars']:>15}{r['vulns']:>10}")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# benchmarks/import_time.py
+#
+# Cold-start benchmark: how long `import main` takes in a fresh interpreter,
+# and which modules that time goes to (python -X importtime, cumulative).
+#
+# Also replays a kubectl-only query path (resolve the scale workflow and
+# build KubernetesTool) and verifies heavy SDKs are never imported on it.
+#
+# Usage (from repo root):
+#   python -m benchmarks.import_time                 # report
+#   python -m benchmarks.import_time --check         # fail if over budget (CI)
+#   python -m benchmarks.import_time --top 40 --runs 7
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, "benchmarks", "import_budget.json")
+
+_TIMED_IMPORT = (
+    "import time; t = time.perf_counter(); import {entry}; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+_KUBECTL_QUERY = (
+    "import sys, json, main\n"
+    "from agent.core.executor import Executor\n"
+    "from agent.core.container import get_container\n"
+    "Executor(None)._resolve('scale')\n"
+    "get_container().get('k8s')\n"
+    "print(json.dumps(sorted(sys.modules)))\n"
+)
+
+
+def _python(code, importtime=False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", code]
+    return subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr):
+    """
+    'import time: self [us] | cumulative | imported package' lines
+    → {module: (self_us, cumulative_us)}
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(entry, runs):
+    samples = []
+    for _ in range(runs):
+        out = _python(_TIMED_IMPORT.format(entry=entry))
+        samples.append(float(out.stdout.strip()))
+
+    detail = _python(f"import {entry}", importtime=True)
+    return statistics.median(samples), parse_importtime(detail.stderr)
+
+
+def forbidden_imports(forbidden):
+    loaded = set(json.loads(_python(_KUBECTL_QUERY).stdout))
+    return sorted(
+        name for name in forbidden
+        if name in loaded or any(m.startswith(name + ".") for m in loaded)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cold-start import time report / budget check")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--check", action="store_true", help="exit 1 if over budget")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args()
+
+    with open(BUDGET_FILE) as f:
+        budget = json.load(f)
+
+    entry = budget.get("entry", "main")
+    total_ms, modules = measure(entry, args.runs)
+    leaked = forbidden_imports(budget.get("forbidden", []))
+
+    ranked = sorted(
+        ((name, cum) for name, (_, cum) in modules.items() if name.startswith(("agent", entry))
+         or cum >= 5000),
+        key=lambda m: m[1], reverse=True
+    )[:args.top]
+
+    over = total_ms > budget["budget_ms"]
+
+    if args.json:
+        print(json.dumps({
+            "entry": entry,
+            "total_ms": round(total_ms, 1),
+            "budget_ms": budget["budget_ms"],
+            "forbidden_loaded": leaked,
+            "modules": {name: round(cum / 1000, 2) for name, cum in ranked},
+        }, indent=2))
+    else:
+        print(f"import {entry}: {total_ms:.1f} ms (median of {args.runs}, budget {budget['budget_ms']} ms)")
+        print(f"\n{'cumulative':>12}  module")
+        for name, cum in ranked:
+            print(f"{cum / 1000:>10.1f}ms  {name}")
+        if leaked:
+            print(f"\nheavy SDKs imported on a kubectl-only query: {', '.join(leaked)}")
+
+    if args.check and (over or leaked):
+        if over:
+            print(f"\nFAIL: cold start {total_ms:.1f} ms exceeds budget {budget['budget_ms']} ms", file=sys.stderr)
+        if leaked:
+            print(f"FAIL: forbidden imports: {', '.join(leaked)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/kube_backends.py
+#
+# Benchmark: kubectl subprocess backend vs native API backend.
+#
+# Runs the same read calls N times through KubernetesTool with each
+# backend against the current kube context and prints latency stats.
+#
+# Usage (from repo root):
+#   python -m benchmarks.kube_backends --iterations 20 --namespace kube-system
+
+import argparse
+import statistics
+import time
+
+from agent.tools.kubernetes_tool import KubernetesTool
+
+
+def measure(tool, call, iterations):
+    samples = []
+    errors = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = call(tool)
+        samples.append((time.perf_counter() - start) * 1000)
+        if isinstance(result, str) and result.startswith("["):
+            errors += 1
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.mean(samples), 1),
+        "p50_ms": round(samples[len(samples) // 2], 1),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kubectl vs native API backend latency")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--namespace", default=None)
+    args = parser.parse_args()
+
+    calls = {
+        "get_pods": lambda t: t.get_pods(args.namespace),
+        "get_services": lambda t: t.get_services(args.namespace),
+    }
+
+    print(f"{'call':<14} {'backend':<8} {'mean':>8} {'p50':>8} {'p95':>8} {'errors':>7}")
+    for name, call in calls.items():
+        for backend in ("kubectl", "api"):
+            tool = KubernetesTool(backend=backend)
+            stats = measure(tool, call, args.iterations)
+            print(
+                f"{name:<14} {backend:<8} {stats['mean_ms']:>7}ms {stats['p50_ms']:>7}ms "
+                f"{stats['p95_ms']:>7}ms {stats['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+# benchmarks/load_replay.py
+#
+# Load generator: replays a query log through the Router at a fixed
+# arrival rate and concurrency, and reports per-workflow latency
+# percentiles, throughput, error rate and time spent in each tool.
+#
+# Query logs use the requests.jsonl format (one JSON object per line);
+# the query is the "query" field, or "title" if there is none.
+#
+# Backends:
+#   stub   in-process stand-ins with synthetic latency (default, no cluster)
+#   sim    the real tools against an in-process simulator
+#          (simulators/server.py; --latency/--jitter become its latency)
+#   live   the real tools (kubectl, PROMETHEUS_URL, ...) as configured
+#   module:function  returning {tool name: stand-in object}
+#
+# Only the stub backend is free of side effects. With any other backend,
+# queries that plan a mutating step (deploy, rollback, scale, build) are
+# skipped and counted, unless --allow-mutations is given: a load test
+# must not scale or roll back real workloads, and the simulator does not
+# stand in for docker / helm / terraform / aws.
+#
+# Latency is measured from each query's scheduled arrival time, so
+# queueing behind --concurrency counts (no coordinated omission).
+#
+# Queries the agent cannot serve yet (no workflow for the intent, or an
+# entity the workflow requires, such as a cost target or a rollback
+# revision, that the query does not give) are counted as "unsupported",
+# not as errors, so the error rate tracks failures under load only.
+#
+# Usage (from repo root):
+#   python -m benchmarks.load_replay
+#   python -m benchmarks.load_replay --rate 50 --concurrency 16 --repeat 10 --out run.json
+#   python -m benchmarks.load_replay --backend sim --sim-pods 50000 --latency 0.02
+#   python -m benchmarks.load_replay --log requests.jsonl --compare baseline.json --max-regression 0.2
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import importlib
+import threading
+import inspect
+import contextvars
+
+from agent.core.container import DEFAULT_TOOLS, get_container
+from agent.core.executor import is_failed_result
+from agent.core.planner import MUTATING_INTENTS, PlanCache, Planner
+from agent.core.router import Router
+
+
+QUERIES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "load_queries.jsonl")
+
+# workflow missing, or the query lacks an entity the workflow needs
+UNSUPPORTED = re.compile(
+    r"Workflow not implemented|missing target|required entities|missing provider|no revision provided"
+)
+
+
+def outcome(result) -> str:
+    """
+    "ok" | "error" | "unsupported" for one Router result.
+    """
+    text = str(result)
+    if not is_failed_result(text):
+        return "ok"
+    return "unsupported" if UNSUPPORTED.search(text.split("\n", 1)[0]) else "error"
+
+
+# ---- TOOL TIMING ----
+
+class ToolTimes:
+    """
+    Thread-safe totals per "tool.method": calls, seconds.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, seconds):
+        with self._lock:
+            count, total = self.calls.get(key, (0, 0.0))
+            self.calls[key] = (count + 1, total + seconds)
+
+    def report(self):
+        per_tool = {}
+        for key, (count, total) in self.calls.items():
+            tool = key.split(".", 1)[0]
+            calls, seconds = per_tool.get(tool, (0, 0.0))
+            per_tool[tool] = (calls + count, seconds + total)
+
+        def row(count, total):
+            return {"calls": count, "total_ms": round(total * 1000, 1), "mean_ms": round(total * 1000 / count, 2)}
+
+        return {
+            "tools": {k: row(*v) for k, v in sorted(per_tool.items(), key=lambda kv: -kv[1][1])},
+            "methods": {k: row(*v) for k, v in sorted(self.calls.items(), key=lambda kv: -kv[1][1])},
+        }
+
+
+class Timed:
+    """
+    Proxy that records how long every method call on a tool takes.
+    """
+
+    def __init__(self, name, tool, times):
+        self._name = name
+        self._tool = tool
+        self._times = times
+
+    def __getattr__(self, attr):
+        value = getattr(self._tool, attr)
+        if not callable(value):
+            return value
+
+        key = f"{self._name}.{attr}"
+        times = self._times
+
+        if inspect.iscoroutinefunction(value):
+            async def timed_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await value(*args, **kwargs)
+                finally:
+                    times.add(key, time.perf_counter() - start)
+            return timed_async
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            finally:
+                times.add(key, time.perf_counter() - start)
+        return timed
+
+
+# ---- STAND-IN BACKENDS ----
+
+_PODS = (
+    "NAME                      READY   STATUS             RESTARTS   AGE\n"
+    "api-7d9f8b6c5d-x2x9q      1/1     Running            0          3d\n"
+    "backend-5c6d7e8f9a-k3j4h  0/1     CrashLoopBackOff   12         3d\n"
+    "frontend-6f7a8b9c0d-p9q8r 1/1     Running            1          3d"
+)
+
+CANNED = {
+    "get_pods": _PODS,
+    "get_services": "NAME      TYPE        CLUSTER-IP    PORT(S)\napi       ClusterIP   10.0.0.12     80/TCP",
+    "pod_restarts": [{"metric": {"namespace": "prod"}, "value": [0, "13"]}],
+    "list_alerts": [{"labels": {"alertname": "KubePodCrashLooping", "severity": "warning"}, "status": {"state": "active"}}],
+    "error_digest": "12x  connection refused to redis:6379\n3x   timeout calling payments",
+    "namespace_cost": {"namespace": "prod", "totalCost": 412.7},
+    "service_cost": {"service": "api", "totalCost": 88.1},
+    "status": {"status": "completed", "conclusion": "failure"},
+    "list_runs": [{"id": 1, "status": "completed", "conclusion": "failure"}],
+    "scale": "deployment.apps/app scaled",
+    "apply": "deployment.apps/app configured",
+    "install": "release installed",
+    "upgrade": "release upgraded",
+    "normalize_app": "app",
+}
+
+
+class StandIn:
+    """
+    Generic tool stand-in: every method sleeps for a synthetic latency and
+    returns a canned result (see CANNED), "*_async" methods are coroutines.
+    """
+
+    def __init__(self, name, latency, jitter, seed=0):
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(f"{name}:{seed}")
+
+    def _delay(self):
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        base = attr[:-len("_async")] if attr.endswith("_async") else attr
+        result = CANNED.get(base, "ok")
+
+        if attr.endswith("_async"):
+            async def call_async(*args, **kwargs):
+                await asyncio.sleep(self._delay())
+                return result
+            return call_async
+
+        def call(*args, **kwargs):
+            time.sleep(self._delay())
+            return result
+        return call
+
+
+def install_backends(kind, times, latency, jitter, sim_pods=5000):
+    """
+    Swaps the container's tools for timed stand-ins (or timed real tools).
+    Returns the simulator for kind="sim".
+    """
+    container = get_container()
+
+    sim = None
+    if kind == "sim":
+        from simulators.cluster import SyntheticCluster
+        from simulators.faults import Faults
+        from simulators.server import SimulatorServer
+
+        sim = SimulatorServer(SyntheticCluster(pods=sim_pods), Faults(latency=latency, jitter=jitter)).start()
+        os.environ.update(sim.env())
+
+    if kind in ("live", "sim"):
+        for name, spec in DEFAULT_TOOLS.items():
+            container.register(name, _timed_factory(name, spec, times))
+        return sim
+
+    if kind == "stub":
+        tools = {name: StandIn(name, latency, jitter) for name in DEFAULT_TOOLS}
+        tools.pop("helper")   # pure helpers, keep the real one
+    else:
+        module, _, attr = kind.partition(":")
+        tools = getattr(importlib.import_module(module), attr)()
+
+    for name, tool in tools.items():
+        container.register(name, lambda name=name, tool=tool: Timed(name, tool, times))
+    return None
+
+
+def _timed_factory(name, spec, times):
+    def build():
+        module, _, attr = spec.partition(":")
+        return Timed(name, getattr(importlib.import_module(module), attr)(), times)
+    return build
+
+
+# ---- REPLAY ----
+
+def load_queries(path):
+    queries = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            query = row.get("query") or row.get("title")
+            if query:
+                queries.append(query)
+    return queries
+
+
+def is_mutating(plan) -> bool:
+    return any(step["intent"] in MUTATING_INTENTS for step in plan.get("steps") or [plan])
+
+
+def split_mutating(queries):
+    """
+    (read-only queries, mutating queries). Planned with a private,
+    disabled plan cache, so the replay's planner stats stay untouched.
+    """
+    planner = Planner(None, cache=PlanCache(max_size=0))
+    safe, mutating = [], []
+    for query in queries:
+        (mutating if is_mutating(planner.create_plan(query)) else safe).append(query)
+    return safe, mutating
+
+
+# plan the router actually ran for the current query (one dict per task)
+_RAN = contextvars.ContextVar("ran")
+
+
+def record_plans(router):
+    """
+    Wraps the router's planner so each replayed query can read back the
+    plan it was executed with, without planning it a second time.
+    """
+    create_plan_async = router.planner.create_plan_async
+
+    async def recorded(query):
+        plan = await create_plan_async(query)
+        ran = _RAN.get(None)
+        if ran is not None:
+            ran["plan"] = plan
+        return plan
+
+    router.planner.create_plan_async = recorded
+
+
+async def replay(router, queries, rate, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = []    # (workflow, seconds, outcome)
+    start = time.perf_counter()
+    record_plans(router)
+
+    async def one(query, arrival):
+        async with semaphore:
+            ran = {}
+            _RAN.set(ran)
+            try:
+                status = outcome(await router.process_async(query))
+            except Exception:
+                status = "error"
+            workflow = ran["plan"]["workflow"] if "plan" in ran else "invalid"
+            samples.append((workflow, time.perf_counter() - arrival, status))
+
+    tasks = []
+    for i, query in enumerate(queries):
+        arrival = start + (i / rate if rate else 0.0)
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one(query, arrival)))
+
+    await asyncio.gather(*tasks)
+    return samples, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    def stats(rows):
+        latencies = sorted(s for _, s, _ in rows)
+        errors = sum(1 for _, _, status in rows if status == "error")
+        unsupported = sum(1 for _, _, status in rows if status == "unsupported")
+        return {
+            "count": len(rows),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "error_rate": round(errors / len(rows), 3) if rows else 0.0,
+            "unsupported_rate": round(unsupported / len(rows), 3) if rows else 0.0,
+        }
+
+    by_workflow = {}
+    for row in samples:
+        by_workflow.setdefault(row[0], []).append(row)
+
+    return stats(samples), {name: stats(rows) for name, rows in sorted(by_workflow.items())}
+
+
+# ---- REPORTING ----
+
+def print_report(report):
+    overall = report["overall"]
+    print(
+        f"{overall['count']} queries in {report['elapsed_s']}s → {report['throughput_qps']} q/s, "
+        f"error rate {overall['error_rate']:.1%}, unsupported {overall['unsupported_rate']:.1%} "
+        f"(rate {report['config']['rate'] or 'max'}, concurrency {report['config']['concurrency']}, "
+        f"backend {report['config']['backend']})"
+    )
+
+    print(f"\n{'workflow':<16} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'unsupp.':>7}")
+    for name, s in [("ALL", overall)] + list(report["workflows"].items()):
+        print(
+            f"{name:<16} {s['count']:>6} {s['p50_ms']:>7}ms {s['p95_ms']:>7}ms "
+            f"{s['p99_ms']:>7}ms {s['error_rate']:>6.1%} {s.get('unsupported_rate', 0.0):>6.1%}"
+        )
+
+    print(f"\n{'tool':<16} {'calls':>7} {'total':>11} {'mean':>9}")
+    for name, s in report["tool_time"]["tools"].items():
+        print(f"{name:<16} {s['calls']:>7} {s['total_ms']:>9}ms {s['mean_ms']:>7}ms")
+
+
+def compare(report, baseline, max_regression):
+    """
+    Prints p95 / throughput deltas vs a saved run.
+    Returns the list of regressions beyond max_regression.
+    """
+    regressions = []
+
+    def delta(new, old):
+        return (new - old) / old if old else 0.0
+
+    print(f"\nvs baseline ({baseline['config']['log']}, {baseline['overall']['count']} queries)")
+    print(f"{'workflow':<16} {'p95 old':>10} {'p95 new':>10} {'change':>8}")
+    rows = [("ALL", baseline["overall"], report["overall"])]
+    rows += [(name, baseline["workflows"][name], s) for name, s in report["workflows"].items()
+             if name in baseline["workflows"]]
+    for name, old, new in rows:
+        change = delta(new["p95_ms"], old["p95_ms"])
+        print(f"{name:<16} {old['p95_ms']:>8}ms {new['p95_ms']:>8}ms {change:>+7.1%}")
+        if change > max_regression:
+            regressions.append(f"{name} p95 {old['p95_ms']}ms → {new['p95_ms']}ms")
+
+    change = delta(report["throughput_qps"], baseline["throughput_qps"])
+    print(f"{'throughput':<16} {baseline['throughput_qps']:>8}/s {report['throughput_qps']:>8}/s {change:>+7.1%}")
+    if -change > max_regression:
+        regressions.append(f"throughput {baseline['throughput_qps']} → {report['throughput_qps']} q/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="replay a query log through the Router under load")
+    parser.add_argument("--log", default=QUERIES, help="jsonl query log (requests.jsonl format)")
+    parser.add_argument("--rate", type=float, default=0, help="arrivals per second; 0 = as fast as possible")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5, help="replay the log N times")
+    parser.add_argument("--backend", default="stub", help="stub | sim | live | module:function")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub / sim latency, sec")
+    parser.add_argument("--jitter", type=float, default=0.02, help="stub / sim latency jitter, sec")
+    parser.add_argument("--sim-pods", type=int, default=5000, help="simulated cluster size")
+    parser.add_argument("--out", default=None, help="save the report as JSON")
+    parser.add_argument("--compare", default=None, help="baseline report JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--allow-mutations", action="store_true",
+                        help="also replay deploy / rollback / scale / build queries outside the stub backend")
+    args = parser.parse_args()
+
+    queries = load_queries(args.log)
+    skipped = []
+    if args.backend != "stub" and not args.allow_mutations:
+        queries, skipped = split_mutating(queries)
+        if skipped:
+            print(f"skipping {len(skipped)} mutating queries on backend {args.backend} "
+                  f"(--allow-mutations to replay them): " + "; ".join(skipped), file=sys.stderr)
+    queries = queries * args.repeat
+
+    times = ToolTimes()
+    sim = install_backends(args.backend, times, args.latency, args.jitter, args.sim_pods)
+    router = Router(model=None)
+
+    samples, elapsed = asyncio.run(replay(router, queries, args.rate, args.concurrency))
+    overall, workflows = summarize(samples)
+
+    report = {
+        "config": {
+            "log": args.log, "rate": args.rate, "concurrency": args.concurrency,
+            "repeat": args.repeat, "backend": args.backend,
+            "latency": args.latency, "jitter": args.jitter,
+            "allow_mutations": args.allow_mutations, "skipped_mutating": skipped,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "throughput_qps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "overall": overall,
+        "workflows": workflows,
+        "tool_time": times.report(),
+        "planner": router.planner.stats(),
+    }
+    if sim is not None:
+        report["simulator"] = sim.stats()
+        sim.stop()
+
+    print_report(report)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nsaved: {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print(f"\nFAIL: regressions over {args.max_regression:.0%}: " + "; ".join(regressions), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
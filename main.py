@@ -2,6 +2,9 @@
 
 from agent.core.router import Router
 from agent.llm.hybrid_router import HybridLLM
+from agent.llm.streaming import TokenStream
+from agent.core.metrics import get_metrics
+from agent.core.tracing import get_tracer
 
 def main():
     print("============================================")
@@ -14,11 +17,18 @@ def main():
     print("   - why pipeline failed")
     print("   - check cloud cost")
     print("")
+    print(" Type 'trace' for the last query's timing tree,")
+    print(" 'latency' for per-call latency percentiles.")
     print(" Type 'exit' or 'quit' to stop.")
     print("--------------------------------------------")
 
     model = HybridLLM()
-    router = Router(model=model)
+    router = Router(model=model, stream=True)
+
+    # AGENT_METRICS_PORT=9464 → Prometheus metrics at :9464/metrics
+    server = get_metrics().serve()
+    if server is not None:
+        print(f" 📈 Metrics on http://localhost:{server.server_address[1]}/metrics")
 
     while True:
         user_input = input("\nYou: ").strip()
@@ -27,12 +37,41 @@ def main():
             print("\n🔚 Stopping Simple DevOps Agent. Bye!\n")
             break
 
+        if user_input.lower() == "trace":
+            print(get_tracer().render())
+            continue
+
+        if user_input.lower() == "latency":
+            print(render_latency(get_tracer().summary()))
+            continue
+
         try:
             result = router.process(user_input)
-            print("Agent:", result)
+            render(result)
         except Exception as e:
             print(f"❌ Error: {str(e)}")
 
+def render(result):
+    # LLM summaries stream token by token
+    if isinstance(result, TokenStream):
+        print("Agent: ", end="", flush=True)
+        for chunk in result:
+            print(chunk, end="", flush=True)
+        print()
+        return
+    print("Agent:", result)
+
+def render_latency(rows):
+    if not rows:
+        return "(no calls yet)"
+    lines = [f"{'KIND':<11}{'NAME':<40}{'COUNT':>6}{'P50':>9}{'P95':>9}{'P99':>9}"]
+    for r in rows[:25]:
+        lines.append(
+            f"{r['kind']:<11}{r['name'][:39]:<40}{r['count']:>6}"
+            f"{r['p50_ms']:>7.0f}ms{r['p95_ms']:>7.0f}ms{r['p99_ms']:>7.0f}ms"
+        )
+    return "\n".join(lines)
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,239 @@
+# simulators/cluster.py
+
+import json
+import time
+import random
+import hashlib
+
+
+BASE_NAMESPACES = ["prod", "staging", "dev", "default", "kube-system"]
+BASE_APPS = [
+    "api", "backend", "frontend", "nginx", "redis", "mysql", "payments",
+    "checkout", "auth", "search", "worker", "gateway",
+]
+
+LOG_TEMPLATES = {
+    "info": [
+        "GET /api/v1/orders 200 {ms}ms",
+        "processed batch id={n} items={k}",
+        "cache hit ratio={k}%",
+        "health check ok",
+    ],
+    "warn": [
+        "slow query took {ms}ms",
+        "retrying request to payments attempt={k}",
+        "connection pool {k}% full",
+    ],
+    "error": [
+        "connection refused to redis:6379",
+        "timeout calling payments after {ms}ms",
+        "failed to process order id={n}: insufficient stock",
+        "OOMKilled: container memory limit exceeded",
+    ],
+}
+
+
+def _hash(*parts, n=10):
+    return hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()[:n]
+
+
+class SyntheticCluster:
+    """
+    Deterministic fake cluster for benchmarks.
+
+    Supports:
+      - pods / nodes / deployments / services / namespaces (kubectl shim)
+      - log lines, generated on demand, never held in memory (Loki)
+      - metric series (Prometheus instant queries)
+      - alerts from crash-looping pods (Alertmanager v2)
+      - namespace / service cost allocations (Kubecost)
+
+    The same seed and sizes always produce the same cluster, so runs are
+    comparable. Sizes:
+        pods        total pods                        (e.g. 50_000)
+        log_lines   total log lines across all apps   (e.g. 1_000_000)
+        series      Prometheus series                 (e.g. 10_000)
+    """
+
+    def __init__(self, pods: int = 500, namespaces: int = 5, apps: int = 24,
+                 nodes: int = None, log_lines: int = 100_000, series: int = 1_000,
+                 crash_rate: float = 0.02, seed: int = 0):
+        self.seed = seed
+        self.log_lines = log_lines
+        self.created = time.time() - 3 * 86400
+        rnd = random.Random(seed)
+
+        self.namespaces = (BASE_NAMESPACES + [f"ns-{i}" for i in range(namespaces)])[:max(namespaces, 1)]
+        self.apps = (BASE_APPS + [f"app-{i}" for i in range(apps)])[:max(apps, 1)]
+        self.nodes = [
+            {"name": f"node-{i:04d}", "status": "Ready" if rnd.random() > 0.01 else "NotReady",
+             "cpu": 16, "memory_gb": 64, "ip": f"10.1.{i // 250}.{i % 250 + 1}"}
+            for i in range(nodes or max(3, pods // 30))
+        ]
+
+        # every app runs in every workload namespace
+        workload = [ns for ns in self.namespaces if ns != "kube-system"] or self.namespaces
+        self.deployments = {}
+        for namespace in workload:
+            for i, app in enumerate(self.apps):
+                self.deployments[(namespace, app)] = {
+                    "name": app, "namespace": namespace, "replicas": 0, "revision": 1,
+                    "image": f"registry.local/{app}:1.{i % 9}.{rnd.randint(0, 20)}",
+                    "hash": _hash(seed, namespace, app),
+                }
+        self.pairs = list(self.deployments)
+
+        self.pods = []
+        self.pods_by_ns = {}
+        deployments = list(self.deployments.values())
+        for i in range(pods):
+            d = deployments[i % len(deployments)]
+            d["replicas"] += 1
+            roll = rnd.random()
+            if roll < crash_rate:
+                status, restarts, ready = "CrashLoopBackOff", rnd.randint(5, 300), "0/1"
+            elif roll < crash_rate * 1.5:
+                status, restarts, ready = "Pending", 0, "0/1"
+            else:
+                status, restarts, ready = "Running", rnd.choice([0, 0, 0, 0, 1, 2]), "1/1"
+            pod = {
+                "name": f"{d['name']}-{d['hash']}-{_hash(seed, i, n=5)}",
+                "namespace": d["namespace"], "app": d["name"],
+                "status": status, "ready": ready, "restarts": restarts,
+                "node": self.nodes[i % len(self.nodes)]["name"],
+                "ip": f"10.244.{(i // 250) % 256}.{i % 250 + 1}",
+            }
+            self.pods.append(pod)
+            self.pods_by_ns.setdefault(pod["namespace"], []).append(pod)
+
+        self.pods_by_name = {p["name"]: p for p in self.pods}
+        self.series = self._build_series(series, rnd)
+
+    # ---- PROMETHEUS ----
+
+    def _build_series(self, limit, rnd):
+        series = []
+        for node in self.nodes:
+            series.append(("node_cpu_seconds_total", {"node": node["name"]}, rnd.uniform(1e5, 1e6)))
+            series.append(("node_memory_MemAvailable_bytes", {"node": node["name"]}, rnd.uniform(1e9, 3e10)))
+        for d in self.deployments.values():
+            series.append(("http_requests_total", {"service": d["name"], "namespace": d["namespace"]},
+                           rnd.uniform(10, 5000)))
+        for pod in self.pods:
+            if len(series) >= limit:
+                break
+            series.append(("kube_pod_container_status_restarts_total",
+                           {"namespace": pod["namespace"], "pod": pod["name"], "app": pod["app"]},
+                           float(pod["restarts"])))
+        i = 0
+        while len(series) < limit:
+            pod = self.pods[i % len(self.pods)] if self.pods else {"namespace": "default", "name": f"p{i}"}
+            series.append(("container_cpu_usage_seconds_total",
+                           {"namespace": pod["namespace"], "pod": pod["name"], "shard": str(i)},
+                           rnd.uniform(1, 1e4)))
+            i += 1
+        return series[:max(limit, 0)]
+
+    def select(self, metric, matchers):
+        return [
+            (name, labels, value) for name, labels, value in self.series
+            if name == metric and all(labels.get(k) == v for k, v in matchers.items())
+        ]
+
+    # ---- LOKI ----
+
+    def log_line(self, i):
+        """
+        Line i of the synthetic log: (ts_ns, labels, text). Pure function of i.
+        """
+        namespace, app = self.pairs[i % len(self.pairs)]
+        roll = int(_hash(self.seed, "log", i, n=4), 16) % 100
+        level = "error" if roll < 3 else "warn" if roll < 10 else "info"
+        templates = LOG_TEMPLATES[level]
+        text = templates[i % len(templates)].format(ms=(i * 37) % 5000, n=i, k=i % 100)
+        ts = int((self.created + i * (3 * 86400 / max(self.log_lines, 1))) * 1e9)
+        line = json.dumps({"ts": ts, "level": level, "msg": text, "app": app})
+        return ts, {"app": app, "namespace": namespace}, line
+
+    def logs(self, app=None, namespace=None, contains=None, limit=100):
+        """
+        Newest-first lines matching the selector, like a Loki backward query.
+        """
+        if app is not None and app not in self.apps:
+            return []
+
+        # line i belongs to pairs[i % len(pairs)]: walk only the lines of
+        # the selected deployment (or app) instead of the whole log
+        last = self.log_lines - 1
+        if app is not None and namespace is not None:
+            if (namespace, app) not in self.deployments:
+                return []
+            step, offset = len(self.pairs), self.pairs.index((namespace, app))
+        elif app is not None:
+            step, offset = len(self.apps), self.apps.index(app)
+        else:
+            step, offset = 1, last
+        start = last - ((last - offset) % step)
+
+        out = []
+        for i in range(start, -1, -step):
+            ts, labels, line = self.log_line(i)
+            if namespace is not None and labels["namespace"] != namespace:
+                continue
+            if contains and contains not in line:
+                continue
+            out.append((ts, labels, line))
+            if len(out) >= limit:
+                break
+        return out
+
+    # ---- ALERTMANAGER ----
+
+    def alerts(self, limit=100):
+        out = []
+        for pod in self.pods:
+            if pod["status"] != "CrashLoopBackOff":
+                continue
+            out.append({
+                "labels": {"alertname": "KubePodCrashLooping", "severity": "warning",
+                           "namespace": pod["namespace"], "pod": pod["name"]},
+                "annotations": {"summary": f"Pod {pod['namespace']}/{pod['name']} is crash looping"},
+                "startsAt": "2024-01-01T00:00:00Z",
+                "status": {"state": "active"},
+                "fingerprint": _hash(pod["name"], n=16),
+            })
+            if len(out) >= limit:
+                break
+        for node in self.nodes:
+            if node["status"] != "Ready" and len(out) < limit:
+                out.append({
+                    "labels": {"alertname": "KubeNodeNotReady", "severity": "critical", "node": node["name"]},
+                    "annotations": {"summary": f"Node {node['name']} is not ready"},
+                    "startsAt": "2024-01-01T00:00:00Z",
+                    "status": {"state": "active"},
+                    "fingerprint": _hash(node["name"], n=16),
+                })
+        return out
+
+    # ---- KUBECOST ----
+
+    def namespace_costs(self):
+        costs = {}
+        for pod in self.pods:
+            c = costs.setdefault(pod["namespace"], {"namespace": pod["namespace"], "cpuCost": 0.0, "ramCost": 0.0})
+            c["cpuCost"] += 0.9
+            c["ramCost"] += 0.4
+        return [self._total(c) for c in costs.values()]
+
+    def service_costs(self):
+        return [
+            self._total({"service": d["name"], "namespace": d["namespace"],
+                         "cpuCost": d["replicas"] * 0.9, "ramCost": d["replicas"] * 0.4})
+            for d in self.deployments.values()
+        ]
+
+    def _total(self, c):
+        c["cpuCost"] = round(c["cpuCost"], 2)
+        c["ramCost"] = round(c["ramCost"], 2)
+        c["totalCost"] = round(c["cpuCost"] + c["ramCost"], 2)
+        return c
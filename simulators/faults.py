@@ -0,0 +1,64 @@
+# simulators/faults.py
+
+import random
+import threading
+
+
+class Faults:
+    """
+    Latency and failure injection for simulator routes.
+
+    Every request draws (from a seeded RNG, so runs are repeatable):
+      - a delay: latency ± jitter seconds
+      - a failure: "error" (HTTP 503 / kubectl exit 1) with error_rate,
+                   "timeout" (hangs `timeout` seconds, then 504) with timeout_rate
+
+    Per-route overrides, e.g. a slow Prometheus and a flaky kubectl:
+        Faults(latency=0.01, routes={
+            "prometheus": {"latency": 0.5},
+            "kubectl": {"error_rate": 0.1},
+        })
+
+    Routes: prometheus, loki, alertmanager, kubecost, kubectl, and
+    kubectl@<context> for one cluster (layered over the kubectl settings):
+        Faults(routes={"kubectl@prod-eu": {"latency": 20}})
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 timeout_rate: float = 0.0, timeout: float = 30.0, routes: dict = None, seed: int = 0):
+        self.defaults = {
+            "latency": latency, "jitter": jitter, "error_rate": error_rate,
+            "timeout_rate": timeout_rate, "timeout": timeout,
+        }
+        self.routes = routes or {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def settings(self, route):
+        base = route.split("@", 1)[0] if route else route
+        return {**self.defaults, **self.routes.get(base, {}), **self.routes.get(route, {})}
+
+    def update(self, route: str = None, **settings):
+        """
+        Changes settings at runtime (all routes if route is None).
+        """
+        with self._lock:
+            if route is None:
+                self.defaults.update(settings)
+            else:
+                self.routes.setdefault(route, {}).update(settings)
+
+    def draw(self, route):
+        """
+        → (delay seconds, None | "error" | "timeout")
+        """
+        s = self.settings(route)
+        with self._lock:
+            delay = max(0.0, s["latency"] + self._random.uniform(-s["jitter"], s["jitter"]))
+            roll = self._random.random()
+
+        if roll < s["error_rate"]:
+            return delay, "error"
+        if roll < s["error_rate"] + s["timeout_rate"]:
+            return delay + s["timeout"], "timeout"
+        return delay, None
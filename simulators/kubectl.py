@@ -0,0 +1,313 @@
+# simulators/kubectl.py
+#
+# The subset of kubectl the tools and backends call, answered from a
+# SyntheticCluster. Used by the simulator server behind the bin/kubectl shim.
+
+import json
+
+
+def _age(seconds):
+    days = int(seconds // 86400)
+    return f"{days}d" if days else f"{int(seconds // 3600)}h"
+
+
+def _table(header, rows):
+    widths = [max(len(str(r[i])) for r in [header] + rows) for i in range(len(header))]
+    return "\n".join(
+        "   ".join(str(v).ljust(w) for v, w in zip(row, widths)).rstrip()
+        for row in [header] + rows
+    )
+
+
+class KubectlSim:
+    """
+    kubectl emulator.
+
+    Supports:
+      - get pods|svc|nodes|ns|deployments[,statefulsets] (-n, -A, -o wide|json|name)
+      - describe pod
+      - logs (--tail, --previous, --timestamps, --since, -f)
+      - scale deployment --replicas
+      - rollout status|undo|history
+      - apply / delete
+      - config get-contexts / current-context / use-context, version
+      - --context <name>: any of the configured contexts (all answer from
+        the same cluster); unknown names fail like kubectl does
+    """
+
+    def __init__(self, cluster, contexts=None):
+        self.cluster = cluster
+        self.contexts = list(contexts or ["sim"])
+
+    def run(self, args):
+        """
+        → (exit code, output)
+        """
+        opts, positional = self._parse(args)
+        if not positional:
+            return 1, "error: You must specify the type of resource to get."
+
+        context = opts.get("context")
+        if context and context not in self.contexts:
+            return 1, f'error: context "{context}" does not exist'
+
+        verb, rest = positional[0], positional[1:]
+        handler = getattr(self, f"_{verb.replace('-', '_')}", None)
+        if handler is None:
+            return 1, f'error: unknown command "{verb}" for "kubectl"'
+        try:
+            return handler(rest, opts)
+        except KeyError as e:
+            return 1, f"Error from server (NotFound): {e.args[0]} not found"
+
+    def _parse(self, args):
+        opts, positional = {}, []
+        i = 0
+        while i < len(args):
+            a = args[i]
+            if a in ("-n", "--namespace", "-o", "--output", "--tail", "--since", "-f", "--filename",
+                     "--context", "-l", "--selector", "-c", "--container"):
+                # "logs -f" follows; "apply -f" takes a file
+                if a == "-f" and (positional[:1] == ["logs"] or i + 1 >= len(args) or args[i + 1].startswith("-")):
+                    opts["follow"] = True
+                else:
+                    opts[a.lstrip("-")] = args[i + 1] if i + 1 < len(args) else ""
+                    i += 1
+            elif a.startswith("--") and "=" in a:
+                key, _, value = a[2:].partition("=")
+                opts[key] = value
+            elif a in ("-A", "--all-namespaces"):
+                opts["all"] = True
+            elif a.startswith("-"):
+                opts[a.lstrip("-")] = True
+            else:
+                positional.append(a)
+            i += 1
+
+        # "-n" / "--namespace", "-o" / "--output", "-f" / "--filename"
+        for short, long in (("n", "namespace"), ("o", "output"), ("f", "filename"), ("l", "selector")):
+            if short in opts and long not in opts:
+                opts[long] = opts.pop(short)
+        return opts, positional
+
+    # ---- GET ----
+
+    def _get(self, rest, opts):
+        if not rest:
+            return 1, "error: You must specify the type of resource to get."
+        kinds = rest[0].split(",")
+        output = opts.get("output", "")
+        out, items = [], []
+        for kind in kinds:
+            code, text, objs = self._get_one(kind, rest[1:], opts)
+            if code:
+                return code, text
+            out.append(text)
+            items.extend(objs)
+        if output == "json":
+            return 0, json.dumps({"apiVersion": "v1", "kind": "List", "items": items})
+        return 0, "\n".join(out)
+
+    def _namespaces_for(self, opts):
+        if opts.get("all"):
+            return None
+        return [opts.get("namespace") or "default"]
+
+    def _get_one(self, kind, names, opts):
+        c = self.cluster
+        output = opts.get("output", "")
+        namespaces = self._namespaces_for(opts)
+        all_ns = namespaces is None
+        uptime = _age(3 * 86400)
+
+        if kind in ("pods", "pod", "po"):
+            pods = c.pods if all_ns else [p for ns in namespaces for p in c.pods_by_ns.get(ns, [])]
+            if names:
+                pods = [p for p in pods if p["name"] in names]
+                if not pods:
+                    return 1, f'Error from server (NotFound): pods "{names[0]}" not found', []
+            selector = opts.get("selector", "")
+            if selector.startswith("app="):
+                pods = [p for p in pods if p["app"] == selector[4:]]
+            items = [self._pod_item(p) for p in pods] if output == "json" else []
+            if output == "name":
+                return 0, "\n".join(f"pod/{p['name']}" for p in pods), items
+            if not pods and not output:
+                where = "any namespace" if all_ns else f"{namespaces[0]} namespace"
+                return 0, f"No resources found in {where}.", items
+            header = (["NAMESPACE"] if all_ns else []) + ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
+            if output == "wide":
+                header += ["IP", "NODE"]
+            rows = []
+            for p in pods:
+                row = ([p["namespace"]] if all_ns else []) + [p["name"], p["ready"], p["status"], p["restarts"], uptime]
+                if output == "wide":
+                    row += [p["ip"], p["node"]]
+                rows.append(row)
+            return 0, _table(header, rows), items
+
+        if kind in ("deployments", "deployment", "deploy", "statefulsets", "statefulset", "sts"):
+            if kind.startswith("s"):
+                return 0, "", []
+            deps = [d for d in c.deployments.values() if all_ns or d["namespace"] in namespaces]
+            if names:
+                deps = [d for d in deps if d["name"] in names]
+            items = [{"metadata": {"name": d["name"], "namespace": d["namespace"]},
+                      "spec": {"replicas": d["replicas"]},
+                      "status": {"readyReplicas": d["replicas"]}} for d in deps]
+            header = (["NAMESPACE"] if all_ns else []) + ["NAME", "READY", "UP-TO-DATE", "AVAILABLE", "AGE"]
+            rows = [([d["namespace"]] if all_ns else []) +
+                    [d["name"], f"{d['replicas']}/{d['replicas']}", d["replicas"], d["replicas"], uptime]
+                    for d in deps]
+            return 0, _table(header, rows), items
+
+        if kind in ("svc", "service", "services"):
+            deps = [d for d in c.deployments.values() if all_ns or d["namespace"] in namespaces]
+            header = (["NAMESPACE"] if all_ns else []) + ["NAME", "TYPE", "CLUSTER-IP", "EXTERNAL-IP", "PORT(S)", "AGE"]
+            rows = [([d["namespace"]] if all_ns else []) +
+                    [d["name"], "ClusterIP", f"10.96.{i // 250}.{i % 250 + 1}", "<none>", "80/TCP", uptime]
+                    for i, d in enumerate(deps)]
+            items = [{"metadata": {"name": d["name"], "namespace": d["namespace"]},
+                      "spec": {"type": "ClusterIP", "clusterIP": f"10.96.{i // 250}.{i % 250 + 1}",
+                               "ports": [{"port": 80, "protocol": "TCP"}]}}
+                     for i, d in enumerate(deps)]
+            return 0, _table(header, rows), items
+
+        if kind in ("nodes", "node", "no"):
+            header = ["NAME", "STATUS", "ROLES", "AGE", "VERSION"] + (["INTERNAL-IP"] if output == "wide" else [])
+            rows = [[n["name"], n["status"], "<none>", uptime, "v1.29.2"] + ([n["ip"]] if output == "wide" else [])
+                    for n in c.nodes]
+            items = [{"metadata": {"name": n["name"]},
+                      "status": {"conditions": [{"type": "Ready", "status": str(n["status"] == "Ready")}]}}
+                     for n in c.nodes]
+            return 0, _table(header, rows), items
+
+        if kind in ("ns", "namespace", "namespaces"):
+            rows = [[ns, "Active", uptime] for ns in c.namespaces]
+            items = [{"metadata": {"name": ns}} for ns in c.namespaces]
+            return 0, _table(["NAME", "STATUS", "AGE"], rows), items
+
+        return 1, f'error: the server doesn\'t have a resource type "{kind}"', []
+
+    def _pod_item(self, p):
+        ready, total = (int(n) for n in p["ready"].split("/"))
+        reason = {"CrashLoopBackOff": "CrashLoopBackOff", "Pending": "ContainerCreating"}.get(p["status"])
+        waiting = {"reason": reason} if reason else None
+        return {
+            "metadata": {"name": p["name"], "namespace": p["namespace"], "labels": {"app": p["app"]}},
+            "spec": {"nodeName": p["node"], "containers": [{"name": p["app"]}] * total},
+            "status": {
+                "phase": "Running" if p["status"] in ("Running", "CrashLoopBackOff", "Error") else "Pending",
+                "podIP": p["ip"],
+                "containerStatuses": [
+                    {"name": p["app"], "ready": i < ready, "restartCount": int(p["restarts"]) if i == 0 else 0,
+                     "state": {"waiting": waiting} if waiting and i >= ready else {"running": {}}}
+                    for i in range(total)
+                ],
+            },
+        }
+
+    # ---- DESCRIBE / LOGS ----
+
+    def _describe(self, rest, opts):
+        if len(rest) < 2:
+            return 1, "error: You must specify the type of resource to describe."
+        pod = self.cluster.pods_by_name[rest[1]]
+        return 0, "\n".join([
+            f"Name:         {pod['name']}",
+            f"Namespace:    {pod['namespace']}",
+            f"Node:         {pod['node']}",
+            f"Labels:       app={pod['app']}",
+            f"Status:       {'Running' if pod['status'] == 'Running' else 'Pending'}",
+            f"IP:           {pod['ip']}",
+            "Containers:",
+            f"  {pod['app']}:",
+            f"    State:          {'Waiting' if pod['status'] != 'Running' else 'Running'}",
+            f"      Reason:       {pod['status']}",
+            f"    Restart Count:  {pod['restarts']}",
+            "Events:",
+            "  Type     Reason   Age   From     Message",
+            "  Warning  BackOff  2m    kubelet  Back-off restarting failed container"
+            if pod["status"] == "CrashLoopBackOff" else "  <none>",
+        ])
+
+    def _logs(self, rest, opts):
+        if not rest:
+            return 1, "error: expected 'logs [-f] [-p] (POD | TYPE/NAME) [-c CONTAINER]'."
+        pod = self.cluster.pods_by_name[rest[0]]
+        tail = int(opts.get("tail", 200))
+        lines = self.cluster.logs(pod["app"], pod["namespace"], limit=tail if tail >= 0 else 1000)
+        out = []
+        for ts, _, line in reversed(lines):
+            if opts.get("timestamps"):
+                out.append(f"{ts}Z {line}")
+            else:
+                out.append(line)
+        return 0, "\n".join(out)
+
+    # ---- MUTATIONS ----
+
+    def _scale(self, rest, opts):
+        name = rest[0].split("/")[-1] if rest[0] != "deployment" else rest[1]
+        namespace = opts.get("namespace") or "default"
+        deployment = self.cluster.deployments[(namespace, name)] if (namespace, name) in self.cluster.deployments \
+            else self._missing("deployments.apps", name)
+        deployment["replicas"] = int(opts.get("replicas", deployment["replicas"]))
+        return 0, f"deployment.apps/{name} scaled"
+
+    def _rollout(self, rest, opts):
+        action = rest[0]
+        target = rest[1] if len(rest) > 1 else ""
+        name = target.split("/")[-1]
+        namespace = opts.get("namespace") or "default"
+        key = (namespace, name)
+        if key not in self.cluster.deployments:
+            self._missing("deployments.apps", name)
+        deployment = self.cluster.deployments[key]
+
+        if action == "status":
+            return 0, f'deployment "{name}" successfully rolled out'
+        if action == "undo":
+            deployment["revision"] += 1
+            return 0, f"deployment.apps/{name} rolled back"
+        if action == "history":
+            rows = [[str(r), "<none>"] for r in range(1, deployment["revision"] + 1)]
+            return 0, f"deployment.apps/{name}\n" + _table(["REVISION", "CHANGE-CAUSE"], rows)
+        if action == "restart":
+            return 0, f"deployment.apps/{name} restarted"
+        return 1, f'error: unknown command "{action}" for "kubectl rollout"'
+
+    def _apply(self, rest, opts):
+        target = opts.get("filename", "manifest")
+        return 0, f"deployment.apps/{target.rsplit('/', 1)[-1].split('.')[0]} configured"
+
+    def _delete(self, rest, opts):
+        if opts.get("filename"):
+            return 0, f"deployment.apps \"{opts['filename']}\" deleted"
+        if len(rest) < 2:
+            return 1, "error: resource(s) were provided, but no name was specified"
+        return 0, f'{rest[0]} "{rest[1]}" deleted'
+
+    def _missing(self, kind, name):
+        raise KeyError(f'{kind} "{name}"')
+
+    # ---- CONFIG ----
+
+    def _config(self, rest, opts):
+        action = rest[0] if rest else ""
+        if action == "get-contexts":
+            names = [c for c in self.contexts if c in rest[1:]] if rest[1:] else self.contexts
+            if not names:
+                return 1, f'error: context {rest[1]} not found'
+            if opts.get("output") == "name":
+                return 0, "\n".join(names)
+            return 0, _table(["CURRENT", "NAME", "CLUSTER", "AUTHINFO", "NAMESPACE"],
+                             [["*" if c == self.contexts[0] else "", c, c, c, "default"] for c in names])
+        if action == "current-context":
+            return 0, self.contexts[0]
+        if action == "use-context":
+            return 0, f'Switched to context "{rest[1] if len(rest) > 1 else self.contexts[0]}".'
+        return 1, f'error: unknown command "{action}" for "kubectl config"'
+
+    def _version(self, rest, opts):
+        return 0, "Client Version: v1.29.2\nServer Version: v1.29.2-sim"
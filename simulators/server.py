@@ -0,0 +1,341 @@
+# simulators/server.py
+#
+# Localhost simulator for the observability / cluster APIs the tools call:
+#
+#   Prometheus     GET  /api/v1/query, /api/v1/query_range
+#   Loki           GET  /loki/api/v1/query, /loki/api/v1/query_range
+#   Alertmanager   GET  /api/v2/alerts
+#   Kubecost       GET  /model/namespaces, /model/services
+#   kubectl        POST /kubectl   (via the simulators/bin/kubectl shim on PATH)
+#
+#   control        GET  /sim/stats, POST /sim/faults {"route": ..., "latency": ...}
+#
+# Everything is answered from one SyntheticCluster, with Faults applied
+# per route. Loki live tail (websocket) is not simulated; LoggingTool
+# falls back to a plain query, as it does against a Loki without tail.
+#
+# Usage (from repo root):
+#   python -m simulators.server --pods 50000 --log-lines 1000000 --series 10000 \
+#       --latency 0.02 --jitter 0.01 --error-rate 0.01 --port 9900
+#   eval "$(python -m simulators.server --print-env --port 9900)"   # in another shell
+#
+# In-process:
+#   with running(faults=Faults(latency=0.02), pods=50_000) as sim:
+#       ... tools now talk to the simulator ...
+
+import os
+import re
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from simulators.cluster import SyntheticCluster
+from simulators.faults import Faults
+from simulators.kubectl import KubectlSim
+
+
+SHIM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bin")
+
+_FUNCTIONS = {"sum", "rate", "irate", "increase", "avg", "max", "min", "count", "by", "without"}
+_MATCHER = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+_AGGREGATE = re.compile(r"\s*(sum|count|avg|max|min)\s*\(")
+_LINE_FILTER = re.compile(r'\|=\s*"([^"]*)"')
+
+
+# ---- API HANDLERS ----
+
+def prom_query(cluster, expr):
+    """
+    Instant-query subset: one metric, label equality matchers, an optional
+    outer sum/count/avg/max/min. rate()/increase() return the raw value.
+    """
+    bare = re.sub(r"\{[^}]*\}|\[[^\]]*\]", " ", expr)
+    names = [n for n in re.findall(r"[a-zA-Z_:][a-zA-Z0-9_:]*", bare) if n not in _FUNCTIONS]
+    series = cluster.select(names[0], dict(_MATCHER.findall(expr))) if names else []
+    now = time.time()
+
+    agg = _AGGREGATE.match(expr)
+    if agg:
+        if not series:
+            return []
+        values = [v for _, _, v in series]
+        value = {
+            "sum": sum(values), "count": len(values), "avg": sum(values) / len(values),
+            "max": max(values), "min": min(values),
+        }[agg.group(1)]
+        return [{"metric": {}, "value": [now, str(value)]}]
+
+    return [{"metric": {"__name__": name, **labels}, "value": [now, str(value)]} for name, labels, value in series]
+
+
+def loki_query(cluster, query, limit):
+    matchers = dict(_MATCHER.findall(query.split("}", 1)[0]))
+    contains = _LINE_FILTER.search(query)
+    lines = cluster.logs(
+        app=matchers.get("app"), namespace=matchers.get("namespace"),
+        contains=contains.group(1) if contains else None, limit=limit,
+    )
+    streams = {}
+    for ts, labels, line in lines:
+        key = tuple(sorted(labels.items()))
+        streams.setdefault(key, {"stream": labels, "values": []})["values"].append([str(ts), line])
+    return {"resultType": "streams", "result": list(streams.values())}
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive, like the real services
+    sim = None                        # set on the per-server subclass
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, path):
+        if path.startswith("/api/v1/"):
+            return "prometheus"
+        if path.startswith("/loki/"):
+            return "loki"
+        if path.startswith("/api/v2/"):
+            return "alertmanager"
+        if path.startswith("/model/"):
+            return "kubecost"
+        if path == "/kubectl":
+            return "kubectl"
+        return "control"
+
+    def _handle(self, method):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = {}
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+
+        route = self._route(url.path)
+        start = time.perf_counter()
+        failure = None
+        if route != "control":
+            delay, failure = self.sim.faults.draw(self._fault_route(route, body))
+            if delay:
+                time.sleep(delay)
+
+        try:
+            if failure and route == "kubectl":
+                self._send(200, {"code": 1, "output": "Unable to connect to the server: simulated failure"})
+            elif failure:
+                status = 504 if failure == "timeout" else 503
+                self._send(status, f"simulated {failure}".encode(), "text/plain")
+            else:
+                status, payload = self._dispatch(route, url.path, params, body)
+                self._send(status, payload)
+        finally:
+            self.sim.record(route, time.perf_counter() - start, failure)
+
+    def _fault_route(self, route, body):
+        # kubectl --context <name> → "kubectl@<name>", so faults can target one cluster
+        if route == "kubectl":
+            args = body.get("args", [])
+            for i, a in enumerate(args):
+                if a == "--context" and i + 1 < len(args):
+                    return f"kubectl@{args[i + 1]}"
+                if a.startswith("--context="):
+                    return f"kubectl@{a.split('=', 1)[1]}"
+        return route
+
+    def _dispatch(self, route, path, params, body):
+        cluster = self.sim.cluster
+
+        if route == "prometheus":
+            result = prom_query(cluster, params.get("query", ""))
+            return 200, {"status": "success", "data": {"resultType": "vector", "result": result}}
+
+        if route == "loki":
+            if path.endswith("/tail"):
+                return 404, {"error": "live tail is not simulated"}
+            data = loki_query(cluster, params.get("query", ""), int(params.get("limit", 100)))
+            return 200, {"status": "success", "data": data}
+
+        if route == "alertmanager" and path == "/api/v2/alerts":
+            return 200, cluster.alerts()
+
+        if route == "kubecost":
+            if path.startswith("/model/namespaces"):
+                return 200, cluster.namespace_costs()
+            if path.startswith("/model/services"):
+                return 200, cluster.service_costs()
+
+        if route == "kubectl":
+            code, output = self.sim.kubectl.run(body.get("args", []))
+            return 200, {"code": code, "output": output}
+
+        if path == "/sim/stats":
+            return 200, self.sim.stats()
+        if path == "/sim/faults":
+            route = body.pop("route", None)
+            self.sim.faults.update(route, **body)
+            return 200, self.sim.faults.settings(route)
+        if path in ("/-/healthy", "/-/ready"):
+            return 200, {"status": "ok"}
+
+        return 404, {"error": f"not simulated: {path}"}
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+
+class SimulatorServer:
+    """
+    Threaded localhost server for one SyntheticCluster.
+
+    Supports:
+      - start() / stop()
+      - url, env()   base URL and the env vars that point the tools at it
+      - stats()      requests, failures and mean latency per route
+    """
+
+    def __init__(self, cluster: SyntheticCluster = None, faults: Faults = None,
+                 host: str = "127.0.0.1", port: int = 0, contexts=None):
+        self.cluster = cluster or SyntheticCluster()
+        self.faults = faults or Faults()
+        self.kubectl = KubectlSim(self.cluster, contexts)
+
+        handler = type("Handler", (SimulatorHandler,), {"sim": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self):
+        return {
+            "SIM_URL": self.url,
+            "PROMETHEUS_URL": self.url,
+            "LOKI_URL": self.url,
+            "ALERTMANAGER_URL": self.url,
+            "KUBECOST_URL": self.url,
+            "KUBE_BACKEND": "kubectl",
+            "PATH": SHIM_DIR + os.pathsep + os.environ.get("PATH", ""),
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def record(self, route, seconds, failure):
+        with self._lock:
+            requests, failures, total = self._counts.get(route, (0, 0, 0.0))
+            self._counts[route] = (requests + 1, failures + (failure is not None), total + seconds)
+
+    def stats(self):
+        return {
+            route: {"requests": n, "failures": f, "mean_ms": round(total * 1000 / n, 2)}
+            for route, (n, f, total) in sorted(self._counts.items())
+        }
+
+
+@contextmanager
+def running(faults: Faults = None, contexts=None, **cluster_args):
+    """
+    Starts a simulator and points this process's tools at it for the
+    duration of the block (env vars, kubectl shim on PATH, fresh tool
+    instances and an empty response cache). contexts: kube context names
+    the kubectl shim accepts (default ["sim"]).
+    """
+    from agent.core.cache import get_response_cache
+    from agent.core.container import get_container
+
+    sim = SimulatorServer(SyntheticCluster(**cluster_args), faults, contexts=contexts).start()
+    saved = {k: os.environ.get(k) for k in sim.env()}
+    os.environ.update(sim.env())
+    get_container().reset()
+    get_response_cache().clear()
+    try:
+        yield sim
+    finally:
+        sim.stop()
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        get_container().reset()
+        get_response_cache().clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="local simulator for kubectl / Prometheus / Loki / Alertmanager / Kubecost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9900)
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--namespaces", type=int, default=5)
+    parser.add_argument("--apps", type=int, default=24)
+    parser.add_argument("--log-lines", type=int, default=100_000)
+    parser.add_argument("--series", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--contexts", default="sim", help="comma list of kube contexts kubectl accepts")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--print-env", action="store_true", help="print export lines and exit")
+    args = parser.parse_args()
+
+    url = f"http://{args.host}:{args.port}"
+    exports = {
+        "SIM_URL": url, "PROMETHEUS_URL": url, "LOKI_URL": url,
+        "ALERTMANAGER_URL": url, "KUBECOST_URL": url, "KUBE_BACKEND": "kubectl",
+    }
+    if args.print_env:
+        for k, v in exports.items():
+            print(f"export {k}={v}")
+        print(f'export PATH="{SHIM_DIR}:$PATH"')
+        return
+
+    start = time.perf_counter()
+    cluster = SyntheticCluster(
+        pods=args.pods, namespaces=args.namespaces, apps=args.apps,
+        log_lines=args.log_lines, series=args.series, seed=args.seed,
+    )
+    faults = Faults(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate, seed=args.seed,
+    )
+    sim = SimulatorServer(cluster, faults, args.host, args.port, contexts=args.contexts.split(","))
+    print(
+        f"simulator on {sim.url}: {len(cluster.pods)} pods, {len(cluster.nodes)} nodes, "
+        f"{len(cluster.series)} series, {cluster.log_lines} log lines "
+        f"(built in {time.perf_counter() - start:.2f}s)"
+    )
+    print(f'eval "$(python -m simulators.server --print-env --port {args.port})"')
+    try:
+        sim.httpd.serve_forever()
+    except KeyboardInterrupt:
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# tests/test_cache.py
+
+import asyncio
+import threading
+
+import pytest
+
+from agent.core.cache import ResponseCache, get_response_cache, invalidates, is_error_result
+
+
+def test_waiters_rerun_the_call_when_the_async_leader_is_cancelled():
+    cache = ResponseCache()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.2 if len(calls) == 1 else 0)
+        return f"call {len(calls)}"
+
+    async def main():
+        leader = asyncio.create_task(cache.get_or_call_async("k", fn))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_or_call_async("k", fn))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(main()) == "call 2"
+    assert cache.get_or_call("k", fn) == "call 2"
+    assert cache.stats()["inflight"] == 0
+
+
+def test_sync_waiter_survives_a_cancelled_async_leader():
+    cache = ResponseCache()
+    started = threading.Event()
+    result = {}
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(1)
+
+    async def main():
+        leader = asyncio.create_task(cache.get_or_call_async("k", slow))
+        await asyncio.sleep(0.01)
+        thread = threading.Thread(target=lambda: result.update(v=cache.get_or_call("k", lambda: "fresh")))
+        thread.start()
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        thread.join(2)
+
+    asyncio.run(main())
+    assert started.is_set()
+    assert result == {"v": "fresh"}
+
+
+def test_leader_errors_reach_waiters_as_exceptions():
+    cache = ResponseCache()
+    gate = threading.Event()
+    errors = []
+
+    def fn():
+        gate.wait(1)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            cache.get_or_call("k", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join(2)
+    assert len(errors) == 3
+
+
+def test_invalidates_waits_for_async_methods():
+    cache = get_response_cache()
+
+    class Tool:
+        @invalidates("test-scope")
+        async def scale(self):
+            cache.get_or_call("test-scope.pods:()", lambda: "stale")
+            return "scaled"
+
+    assert asyncio.run(Tool().scale()) == "scaled"
+    assert cache.get_or_call("test-scope.pods:()", lambda: "fresh") == "fresh"
+
+
+@pytest.mark.parametrize("result", [
+    "[kubectl-error] connection refused",
+    "[ollama-error:500] model not found",
+    "[k8s-api-error:404] not found",
+    "[helm-missing]",
+    "[kubectl-not-installed] kubectl CLI not found.",
+    "[fanout-timeout] pods did not answer within 5s",
+    "[local-disabled, backend=none] parse this",
+    "[cloud-disabled] why",
+    "[unknown-provider:foo] why",
+    "[retry-failed] gave up",
+    "[rollback-blocked] needs approval",
+])
+def test_error_tags_are_errors(result):
+    assert is_error_result(result)
+
+
+@pytest.mark.parametrize("result", [
+    "[pods]\nNAME READY STATUS\napi 1/1 Running",
+    "[compaction] 100 → 40 tokens",
+    "[sbom] 120 packages",
+    "[kubecost] prod: $412",
+    "[1] see the first step",
+    "all good",
+])
+def test_reports_and_text_are_not_errors(result):
+    assert not is_error_result(result)
+
+
+def test_section_reports_are_cached():
+    cache = ResponseCache()
+    cache.get_or_call("report", lambda: "[pods]\napi Running")
+
+    assert cache.get_or_call("report", lambda: "fresh") == "[pods]\napi Running"
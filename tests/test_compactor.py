@@ -0,0 +1,35 @@
+# tests/test_compactor.py
+
+from agent.llm.compactor import ContextCompactor
+
+
+def _compact(value):
+    text, report = ContextCompactor().compact({"section": value})
+    return text.split("\n", 1)[1], report
+
+
+def test_log_lines_differing_in_numbers_are_folded():
+    logs = "\n".join(
+        f"2026-10-18T10:00:{i:02d}Z ERROR timeout after {100 + i}ms calling payments:8080"
+        for i in range(30)
+    )
+    text, report = _compact(logs)
+
+    assert text.startswith("x30 ")
+    assert "folded 30 lines into 1 distinct" in report.render()
+
+
+def test_table_rows_differing_in_numbers_are_kept():
+    table = "\n".join(
+        ["NAME       TYPE        CLUSTER-IP    PORT(S)"]
+        + [f"svc-{i}      ClusterIP   10.0.0.{i}     80{i}/TCP" for i in range(10)]
+    )
+    text, report = _compact(table)
+
+    assert text == table
+    assert "folded" not in report.render()
+
+
+def test_exact_repeats_are_folded_in_any_text():
+    text, _ = _compact("retrying\nretrying\nretrying\ndone")
+    assert text == "x3 retrying\ndone"
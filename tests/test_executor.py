@@ -0,0 +1,52 @@
+# tests/test_executor.py
+
+from agent.core import executor as executor_module
+from agent.core.executor import Executor
+
+
+class Log:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, event, **fields):
+        self.errors.append((event, fields))
+
+
+def _run(workflow, target, monkeypatch, tmp_path, source=None):
+    if source is not None:
+        (tmp_path / "broken_workflow.py").write_text(source)
+        monkeypatch.syspath_prepend(str(tmp_path))
+    log = Log()
+    monkeypatch.setattr(executor_module, "get_logger", lambda: log)
+
+    executor = Executor(None, explain=False)
+    executor.workflows[workflow] = target
+    return executor.run({"intent": "X", "workflow": workflow}), log
+
+
+def test_missing_workflow_module_is_not_implemented(monkeypatch, tmp_path):
+    result, log = _run("nope", "agent.workflows.nope:NopeWorkflow", monkeypatch, tmp_path)
+
+    assert result == "❌ Workflow not implemented: nope"
+    assert not log.errors
+
+
+def test_broken_workflow_module_is_logged_not_hidden(monkeypatch, tmp_path):
+    result, log = _run(
+        "broken", "broken_workflow:BrokenWorkflow", monkeypatch, tmp_path,
+        source="import some_missing_dependency\n",
+    )
+
+    assert result.startswith("💥 Execution error")
+    assert "some_missing_dependency" in result
+    assert log.errors[0][0] == "workflow.error"
+
+
+def test_failure_check_matches_the_cache_check():
+    from agent.core.cache import is_error_result
+    from agent.core.executor import is_failed_result
+
+    for result in ("❌ Workflow not implemented: x", "💥 Execution error: boom", "⏭️ Skipped: step 1",
+                   "[kubectl-error] refused", "[helm-missing]", "[cloud-disabled] why",
+                   "[pods]\napi Running", "[compaction] 10 → 5 tokens", "deployment scaled"):
+        assert is_failed_result(result) == is_error_result(result), result
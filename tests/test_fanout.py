@@ -0,0 +1,43 @@
+# tests/test_fanout.py
+
+import time
+import asyncio
+
+from agent.core.cache import cached
+from agent.core.fanout import FanOut
+
+
+class SlowTool:
+    context = None
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached("slowtool", ttl=30, name="pods")
+    async def pods_async(self):
+        self.calls += 1
+        await asyncio.sleep(0.5)
+        return "async pods"
+
+    @cached("slowtool", ttl=30)
+    def pods(self):
+        self.calls += 1
+        return "sync pods"
+
+
+def test_timed_out_leader_does_not_break_a_waiting_label():
+    tool = SlowTool()
+
+    async def main():
+        fanout = FanOut(timeout=2, deadline=5)
+        return await fanout.run_async({
+            "leader": (tool.pods_async(), 0.1),     # cancelled by its timeout
+            "waiter": (lambda: (time.sleep(0.02), tool.pods())[1], 2),
+        })
+
+    results = asyncio.run(main())
+
+    assert results.timed_out == ["leader"]
+    assert results["waiter"] == "sync pods"
+    assert not results.failed
+    assert tool.calls == 2
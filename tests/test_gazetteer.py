@@ -0,0 +1,33 @@
+# tests/test_gazetteer.py
+
+import threading
+
+from agent.nlp.gazetteer import EntityIndex
+
+
+def test_start_loads_the_inventory_before_returning():
+    index = EntityIndex(sources={"fake": lambda: {"app": ["checkout"]}}, seeds={})
+    index.start(interval=60)
+    index.stop()
+
+    assert index.names("app") == {"checkout"}
+    assert index.find("restart checkout in prod") == {"app": "checkout"}
+
+
+def test_names_can_be_read_while_refreshing():
+    index = EntityIndex(sources={}, seeds={})
+    done = threading.Event()
+
+    def writer():
+        for i in range(300):
+            index.replace("fake", "app", [f"app-{j}" for j in range(i, i + 200)])
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not done.is_set():
+        names = index.names("app")
+        assert len(names) in (0, 200)
+        index.stats()
+    thread.join()
+    assert len(index.names("app")) == 200
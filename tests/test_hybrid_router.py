@@ -0,0 +1,74 @@
+# tests/test_hybrid_router.py
+
+from agent.llm.hybrid_router import HybridLLM
+from agent.llm.prompt_cache import PromptCache
+from agent.llm.streaming import TokenStream
+
+
+class FakeLLM:
+    model = "fake"
+
+    def __init__(self, *chunks, raises=None):
+        self.chunks = chunks
+        self.raises = raises
+
+    def generate(self, prompt):
+        return "".join(self.chunks)
+
+    def generate_stream(self, prompt):
+        def chunks():
+            yield from self.chunks
+            if self.raises:
+                raise self.raises
+        return TokenStream(chunks())
+
+
+def _router():
+    return HybridLLM(cache=PromptCache(path=":memory:"))
+
+
+def test_stream_ending_in_an_error_chunk_is_not_cached():
+    router = _router()
+    llm = FakeLLM("The pod restarts because ", "[anthropic-error] overloaded")
+
+    stream = router._stream(llm, "anthropic", "why")
+    assert "overloaded" in str(stream)
+    assert stream.failed
+    assert router.cache.get("anthropic", "fake", "why") is None
+
+
+def test_stream_ending_in_an_http_error_chunk_is_not_cached():
+    router = _router()
+    stream = router._stream(FakeLLM("partial ", "[ollama-error:500] model not found"), "ollama", "why")
+
+    str(stream)
+    assert stream.failed
+    assert router.cache.get("ollama", "fake", "why") is None
+
+
+def test_stream_that_raises_is_not_cached():
+    router = _router()
+    stream = router._stream(FakeLLM("partial ", raises=ConnectionError("reset")), "ollama", "why")
+
+    try:
+        str(stream)
+    except ConnectionError:
+        pass
+    assert stream.failed
+    assert router.cache.get("ollama", "fake", "why") is None
+
+
+def test_complete_stream_is_cached():
+    router = _router()
+    str(router._stream(FakeLLM("all ", "good"), "anthropic", "why"))
+
+    assert router.cache.get("anthropic", "fake", "why") == "all good"
+
+
+def test_disabled_provider_replies_are_not_cached():
+    router = _router()
+    router._generate(FakeLLM("[local-disabled, backend=none] parse this"), "none", "parse this")
+    str(router._stream(FakeLLM("[cloud-disabled] why"), "anthropic", "why"))
+
+    assert router.cache.get("none", "fake", "parse this") is None
+    assert router.cache.get("anthropic", "fake", "why") is None
@@ -0,0 +1,34 @@
+# tests/test_intent_classifier.py
+
+import pytest
+
+from agent.nlp.intent_classifier import IntentClassifier
+
+
+@pytest.mark.parametrize("query, intent", [
+    ("service is slow", "UNKNOWN"),
+    ("check slowest pods", "UNKNOWN"),
+    ("login page broken", "DEBUG"),
+    ("fix the logic", "DEBUG"),
+])
+def test_keywords_do_not_match_as_prefixes_of_other_words(query, intent):
+    clf = IntentClassifier()
+    assert clf.classify(query) == intent
+    assert "LOGS" not in dict(clf.rank(query))
+    assert "STATUS" not in dict(clf.rank(query))
+
+
+@pytest.mark.parametrize("query, intent", [
+    ("list deployments in prod", "DEPLOY"),
+    ("pods keep crashing", "DEBUG"),
+    ("show error logs for api", "LOGS"),
+    ("rollbacks of payments", "ROLLBACK"),
+])
+def test_inflections_still_match(query, intent):
+    assert IntentClassifier().classify(query) == intent
+
+
+def test_inflections_score_less_than_the_bare_word():
+    clf = IntentClassifier()
+    assert clf.scores("fail") == {"DEBUG": 1.0}
+    assert clf.scores("failing") == {"DEBUG": pytest.approx(0.8)}
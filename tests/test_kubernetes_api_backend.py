@@ -0,0 +1,41 @@
+# tests/test_kubernetes_api_backend.py
+
+import time
+import threading
+
+import pytest
+
+from agent.tools import kubernetes_api_backend as backend
+
+config = pytest.importorskip("kubernetes.config")
+
+
+def test_clients_for_different_contexts_build_concurrently(monkeypatch):
+    builds = []
+
+    def slow_build(config_file=None, context=None):
+        builds.append(context)
+        time.sleep(0.3)     # e.g. `aws eks get-token`
+        return f"client-{context}"
+
+    monkeypatch.setattr(backend, "_CLIENTS", {})
+    monkeypatch.setattr(backend, "_BUILD_LOCKS", {})
+    monkeypatch.setattr(config, "new_client_from_config", slow_build)
+    monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+
+    results = {}
+    contexts = ["prod-eu", "prod-us", "staging", "prod-eu", "prod-eu"]
+    threads = [
+        threading.Thread(target=lambda i=i, c=c: results.update({i: backend.get_api_client(c)}))
+        for i, c in enumerate(contexts)
+    ]
+
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert time.monotonic() - start < 0.8
+    assert sorted(builds) == ["prod-eu", "prod-us", "staging"]
+    assert [results[i] for i in range(len(contexts))] == [f"client-{c}" for c in contexts]
@@ -0,0 +1,44 @@
+# tests/test_kubernetes_tool.py
+
+from agent.tools import kubernetes_api_backend, kubernetes_tool
+from agent.tools.kubernetes_tool import KubernetesTool
+from simulators.server import running
+
+
+class FakeWatchCache:
+    def __init__(self):
+        self.calls = []
+
+    def list(self, kind, namespace=None, selector=None):
+        self.calls.append((kind, namespace))
+        return []
+
+
+def _with_cache(monkeypatch, namespace="payments"):
+    cache = FakeWatchCache()
+    monkeypatch.delenv("KUBE_CONTEXT", raising=False)
+    monkeypatch.setattr(kubernetes_tool, "get_watch_cache", lambda: cache)
+    monkeypatch.setitem(kubernetes_api_backend._NAMESPACES, None, namespace)
+    return cache
+
+
+def test_watch_cache_answers_for_the_default_namespace_like_kubectl(monkeypatch):
+    cache = _with_cache(monkeypatch)
+    tool = KubernetesTool("kubectl")
+
+    tool.get_pods()
+    tool.get_pods("prod")
+    tool.get_pods(all_namespaces=True)
+    tool.get_nodes()
+
+    assert cache.calls == [("pods", "payments"), ("pods", "prod"), ("pods", None), ("nodes", None)]
+
+
+def test_all_namespaces_lists_every_namespace():
+    with running(pods=100):
+        tool = KubernetesTool("kubectl", structured=True)
+        everywhere = tool.get_pods(all_namespaces=True)
+        prod = tool.get_pods("prod")
+
+    assert len(everywhere) > len(prod) > 0
+    assert {p.namespace for p in prod} == {"prod"}
@@ -0,0 +1,39 @@
+# tests/test_kubernetes_watch_cache.py
+
+import pytest
+
+from agent.tools.kubernetes_watch_cache import ResourceInformer, WatchError
+
+
+def _informer():
+    informer = ResourceInformer("pods", list_call=None, serializer=lambda obj: obj)
+    informer.last_sync = -1.0
+    informer.resource_version = "10"
+    return informer
+
+
+def test_error_event_raises_instead_of_marking_the_cache_in_sync():
+    informer = _informer()
+    event = {"type": "ERROR", "raw_object": {"kind": "Status", "code": 410, "message": "too old resource version"}}
+
+    with pytest.raises(WatchError) as e:
+        informer._apply(event)
+    assert e.value.status == 410
+    assert (informer.last_sync, informer.resource_version) == (-1.0, "10")
+
+
+def test_unknown_events_do_not_advance_freshness():
+    informer = _informer()
+    informer._apply({"type": "SOMETHING", "raw_object": {"metadata": {"resourceVersion": "11"}}})
+
+    assert (informer.last_sync, informer.resource_version) == (-1.0, "10")
+
+
+def test_applied_events_advance_freshness():
+    informer = _informer()
+    pod = {"name": "api", "namespace": "prod", "labels": {}}
+    informer._apply({"type": "ADDED", "object": pod, "raw_object": {"metadata": {"resourceVersion": "11"}}})
+
+    assert informer.last_sync > -1.0
+    assert informer.resource_version == "11"
+    assert informer.list("prod") == [pod]
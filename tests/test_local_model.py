@@ -0,0 +1,25 @@
+# tests/test_local_model.py
+
+from agent.llm.local_model import LocalModel
+
+
+class Recorder:
+    def __init__(self):
+        self.kwargs = None
+
+    def post(self, url, **kwargs):
+        self.kwargs = kwargs
+        raise ConnectionError("offline")
+
+
+def test_ollama_calls_use_the_long_read_timeout(monkeypatch):
+    monkeypatch.delenv("OLLAMA_TIMEOUT", raising=False)
+    model = LocalModel()
+    model.backend = "ollama"
+    model.http = Recorder()
+
+    assert model.generate("hi").startswith("[ollama-connection-error]")
+    assert model.http.kwargs["timeout"][1] >= 120
+
+    monkeypatch.setenv("OLLAMA_TIMEOUT", "600")
+    assert LocalModel().timeout[1] == 600
@@ -0,0 +1,22 @@
+# tests/test_logging_tool.py
+
+from agent.tools.logging_tool import LoggingTool
+from simulators.server import running
+
+
+def test_error_digest_backfills_without_a_live_tail(monkeypatch):
+    def no_tail(*args, **kwargs):
+        raise AssertionError("error_digest opened a live tail")
+
+    monkeypatch.setattr(LoggingTool, "loki_tail", no_tail)
+    with running(pods=100):
+        digest = LoggingTool().error_digest("payments", "prod")
+
+    assert digest.split()[1] == "lines"
+
+
+def test_follow_falls_back_to_the_backfill_without_a_tail_stream():
+    with running(pods=100):
+        digest = LoggingTool().error_digest("payments", "prod", follow=True, seconds=1)
+
+    assert "lines" in digest
@@ -0,0 +1,35 @@
+# tests/test_planner.py
+
+from agent.core.planner import PlanCache, Planner
+
+
+def test_queries_sharing_a_cache_key_get_the_same_entities():
+    for first, second in (("deploy nginx:1.27.", "Deploy  nginx:1.27"), ("Deploy  nginx:1.27", "deploy nginx:1.27.")):
+        planner = Planner(None, cache=PlanCache())
+        a = planner.create_plan(first)
+        b = planner.create_plan(second)
+
+        assert a["entities"] == b["entities"] == {"app": "nginx", "image": "nginx:1.27"}
+        assert (a["raw"], b["raw"]) == (first, second)
+        assert planner.stats()["hits"] == 1
+
+
+def test_a_question_about_a_failure_is_one_debug_plan():
+    plan = Planner(None, cache=PlanCache()).create_plan("deploy failed, why?")
+
+    assert plan["intent"] == "DEBUG"
+    assert plan["workflow"] == "debug"
+    assert "steps" not in plan
+
+
+def test_follow_up_questions_do_not_split():
+    planner = Planner(None, cache=PlanCache())
+    for query in ("deploy api and then why did it fail", "scale api to 3 and is it healthy?", "rollback api and fix"):
+        assert "steps" not in planner.create_plan(query), query
+
+
+def test_compound_queries_still_split_and_logs_steps_have_a_workflow():
+    plan = Planner(None, cache=PlanCache()).create_plan("deploy api then show its logs")
+
+    assert [(s["intent"], s["workflow"]) for s in plan["steps"]] == [("DEPLOY", "deploy"), ("LOGS", "debug")]
+    assert plan["steps"][1]["depends_on"] == [1]
@@ -0,0 +1,117 @@
+# tests/test_process.py
+
+import os
+import sys
+import asyncio
+import threading
+
+import pytest
+
+from agent.core import process
+from agent.core.cache import is_error_result
+from agent.core.output import OutputHandle, run_output
+from agent.core.process import ProcessRunner, run_text
+
+
+def _print(n):
+    return [sys.executable, "-c", f"import sys; sys.stdout.write('x' * {n})"]
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setenv("AGENT_PROC_OUTPUT_CAP", "4096")
+    monkeypatch.setattr(process, "_RUNNER", None)
+    yield process.get_runner()
+    monkeypatch.setattr(process, "_RUNNER", None)
+
+
+def test_small_output_is_returned_as_is(runner):
+    assert run_text(_print(100)) == "x" * 100
+
+
+def test_output_over_cap_is_an_error_and_spill_is_removed(runner):
+    out = run_text(_print(100_000), error_tag="kubectl-error")
+
+    assert is_error_result(out)
+    assert out.startswith("[kubectl-error] output too large (100000 bytes)")
+    assert len(out) < 5000
+    spill = runner.history[-1].spill_path
+    assert spill and not os.path.exists(spill)
+
+
+def test_async_output_over_cap_removes_spill(runner):
+    out = asyncio.run(process.run_text_async(_print(100_000)))
+
+    assert is_error_result(out)
+    assert not os.path.exists(runner.history[-1].spill_path)
+
+
+def test_run_output_hands_the_spill_to_a_handle(monkeypatch, runner):
+    monkeypatch.setenv("AGENT_OUTPUT_INLINE", "1024")
+    handle = run_output(_print(50_000))
+
+    assert isinstance(handle, OutputHandle)
+    assert len(handle) == 50_000
+    path = handle.path
+    handle.close()
+    assert not os.path.exists(path)
+
+
+def test_failed_run_output_does_not_leak_the_spill(monkeypatch, runner):
+    monkeypatch.setenv("AGENT_OUTPUT_INLINE", "1024")
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.write('x' * 50000); sys.exit(3)"]
+    out = run_output(cmd)
+
+    assert isinstance(out, str) and is_error_result(out)
+    assert not os.path.exists(runner.history[-1].spill_path)
+
+
+def test_cancelled_async_run_removes_spill():
+    runner = ProcessRunner()
+    cmd = [sys.executable, "-c", "import sys, time; sys.stdout.write('x' * 50000); sys.stdout.flush(); time.sleep(30)"]
+    before = set(os.listdir("/tmp"))
+
+    async def main():
+        task = asyncio.ensure_future(runner.run_async(cmd, output_cap=1024))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    leaked = [f for f in set(os.listdir("/tmp")) - before if f.startswith("agent-proc-")]
+    assert leaked == []
+
+
+def test_stats_are_consistent_across_threads():
+    runner = ProcessRunner()
+    cmd = [sys.executable, "-c", "pass"]
+    threads = [threading.Thread(target=runner.run, args=(cmd,)) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = runner.stats()[os.path.basename(sys.executable)]
+    assert stats["runs"] == 16
+    assert stats["running"] == 0 and stats["waiting"] == 0
+
+
+def test_stream_starts_no_process_until_iterated(runner, monkeypatch):
+    started = []
+    popen = process.subprocess.Popen
+    monkeypatch.setattr(process.subprocess, "Popen", lambda *a, **kw: started.append(a) or popen(*a, **kw))
+
+    lines = runner.stream([sys.executable, "-c", "print('a'); print('b')"])
+    assert started == []
+    lines.close()
+    assert started == []
+
+    lines = runner.stream([sys.executable, "-c", "print('a'); print('b')"])
+    assert list(lines) == ["a\n", "b\n"]
+    assert len(started) == 1
+
+
+def test_stream_of_a_missing_cli_raises_right_away(runner):
+    with pytest.raises(FileNotFoundError):
+        runner.stream(["definitely-not-a-real-cli", "logs"])
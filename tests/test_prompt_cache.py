@@ -0,0 +1,32 @@
+# tests/test_prompt_cache.py
+
+from agent.llm.prompt_cache import PromptCache, shape_prompt
+
+
+def test_shape_keeps_small_numbers_and_status_codes():
+    assert shape_prompt("scale api to 3") != shape_prompt("scale api to 30")
+    assert shape_prompt("GET /checkout returned 404") != shape_prompt("GET /checkout returned 500")
+    assert shape_prompt("api restarted 1 times") != shape_prompt("api restarted 12 times")
+
+
+def test_shape_masks_ids():
+    assert shape_prompt("pod api-5d8c7b9f4-x7k2p crashed") == shape_prompt("pod api-7f9b6c4d2-q9w8e crashed")
+    assert shape_prompt("job backup-28391 failed") == shape_prompt("job backup-28392 failed")
+    assert shape_prompt("image at 3f2a9c1") == shape_prompt("image at a81d0e7")
+    assert shape_prompt("resourceVersion 1234567") == shape_prompt("resourceVersion 1234999")
+
+
+def test_approximate_hits_only_across_ids():
+    cache = PromptCache(path=":memory:", approximate=True)
+    cache.put("ollama", "llama3", "why did job backup-28391 fail with exit 1", "disk full")
+
+    assert cache.get("ollama", "llama3", "why did job backup-28400 fail with exit 1") == "disk full"
+    assert cache.get("ollama", "llama3", "why did job backup-28400 fail with exit 137") is None
+
+
+def test_exact_keys_keep_resource_quantities():
+    cache = PromptCache(path=":memory:")
+
+    assert cache.keys("ollama", "llama3", "cpu 100m")[0] != cache.keys("ollama", "llama3", "cpu 500m")[0]
+    cache.put("ollama", "llama3", "why is api throttled at cpu 100m", "limit too low")
+    assert cache.get("ollama", "llama3", "why is api throttled at cpu 500m") is None
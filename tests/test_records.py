@@ -0,0 +1,74 @@
+# tests/test_records.py
+
+import json
+import asyncio
+
+import pytest
+
+from agent.core import process
+from agent.core.output import OutputHandle
+from agent.tools import records
+from agent.tools.kubernetes_tool import KubernetesTool
+from simulators.server import running
+
+
+def _pod(name, phase="Running"):
+    return {
+        "metadata": {"name": name, "namespace": "prod"},
+        "spec": {"containers": [{"name": "app"}]},
+        "status": {"phase": phase, "containerStatuses": [{"ready": phase == "Running", "restartCount": 0}]},
+    }
+
+
+def test_unparseable_json_is_an_error_not_a_result():
+    out = records.pods('{"apiVersion": "v1", "items": [{"metadata": ')
+
+    assert isinstance(out, str)
+    assert out.startswith("[kubectl-error] could not parse JSON output")
+
+
+def test_error_strings_pass_through():
+    assert records.pods("[kubectl-error] forbidden") == "[kubectl-error] forbidden"
+
+
+def test_pods_from_an_output_handle_are_streamed_and_the_handle_closed(tmp_path):
+    path = tmp_path / "pods.json"
+    path.write_text(json.dumps({"apiVersion": "v1", "items": [_pod(f"p{i}") for i in range(500)]}))
+    handle = OutputHandle(str(path), owned=False)
+
+    pods = records.pods(handle)
+
+    assert isinstance(pods, records.RecordList) and len(pods) == 500
+    assert pods[0].name == "p0" and pods[0].healthy
+    assert handle._map is None
+
+
+def test_truncated_handle_is_an_error(tmp_path):
+    path = tmp_path / "pods.json"
+    path.write_text(json.dumps({"items": [_pod(f"p{i}") for i in range(50)]})[:-400])
+
+    out = records.pods(OutputHandle(str(path), owned=False), "resource-error")
+
+    assert out.startswith("[resource-error] could not parse JSON output")
+
+
+@pytest.fixture
+def small_cap(monkeypatch):
+    monkeypatch.setenv("AGENT_PROC_OUTPUT_CAP", str(64 * 1024))
+    monkeypatch.setenv("AGENT_OUTPUT_INLINE", str(16 * 1024))
+    monkeypatch.setattr(process, "_RUNNER", None)
+    yield
+    monkeypatch.setattr(process, "_RUNNER", None)
+
+
+def test_structured_list_larger_than_the_output_cap(small_cap):
+    with running(pods=1000, namespaces=1) as sim:
+        tool = KubernetesTool(structured=True)
+        pods = tool.get_pods("prod")
+        nodes = tool.get_nodes()
+        pods_async = asyncio.run(tool.get_pods_async("prod"))
+
+    total = len(sim.cluster.pods_by_ns["prod"])
+    assert isinstance(pods, records.RecordList) and len(pods) == total
+    assert isinstance(pods_async, records.RecordList) and len(pods_async) == total
+    assert isinstance(nodes, records.RecordList) and len(nodes) == len(sim.cluster.nodes)
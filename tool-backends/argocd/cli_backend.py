@@ -1,6 +1,6 @@
 # tool-backend/argocd/cli_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class ArgoCDCLIBackend:
@@ -9,13 +9,11 @@ class ArgoCDCLIBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode().strip()
-        except subprocess.CalledProcessError as e:
-            return f"[argocd-error] {e.output.decode().strip()}"
-        except FileNotFoundError:
-            return "[argocd-missing] argocd binary not installed."
+        return run_text(
+            cmd,
+            error_tag="argocd-error",
+            missing="[argocd-missing] argocd binary not installed."
+        )
 
     def login(self, server, username, password, insecure=True):
         cmd = ["argocd", "login", server, "--username", username, "--password", password]
@@ -1,7 +1,6 @@
 # tool-backends/docker/build_backend.py
 
-import subprocess
-import os
+from agent.core.process import run_text
 
 
 class DockerBuildBackend:
@@ -24,13 +23,12 @@ class DockerBuildBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, cwd=cwd)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[docker-build-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[docker-missing] docker binary not installed."
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="docker-build-error",
+            missing="[docker-missing] docker binary not installed."
+        )
 
     def build(self, context=".", dockerfile="Dockerfile", tag=None, build_args=None):
         """
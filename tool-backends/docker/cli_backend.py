@@ -1,6 +1,6 @@
 # tool-backends/docker/cli_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class DockerCLIBackend:
@@ -17,13 +17,11 @@ class DockerCLIBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[docker-cli-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[docker-missing] docker binary not installed."
+        return run_text(
+            cmd,
+            error_tag="docker-cli-error",
+            missing="[docker-missing] docker binary not installed."
+        )
 
     # ---- RUN CONTAINER ----
     def run(self, image, name=None, ports=None, env=None):
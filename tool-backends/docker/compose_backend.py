@@ -1,7 +1,6 @@
 # tool-backends/docker/compose_backend.py
 
-import subprocess
-import os
+from agent.core.process import run_text
 
 
 class DockerComposeBackend:
@@ -28,19 +27,12 @@ class DockerComposeBackend:
         self.compose_file = compose_file
 
     def _exec(self, cmd, cwd=None):
-        env = os.environ.copy()
-        try:
-            out = subprocess.check_output(
-                cmd,
-                stderr=subprocess.STDOUT,
-                cwd=cwd,
-                env=env
-            )
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[compose-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[compose-missing] docker compose not installed (v2.x)"
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="compose-error",
+            missing="[compose-missing] docker compose not installed (v2.x)"
+        )
 
     def up(self, detach=True, cwd=None):
         cmd = ["docker", "compose", "-f", self.compose_file, "up"]
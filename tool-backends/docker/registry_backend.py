@@ -1,7 +1,6 @@
 # tool-backends/docker/registry_backend.py
 
-import subprocess
-import os
+from agent.core.process import run_text
 
 
 class DockerRegistryBackend:
@@ -17,14 +16,13 @@ class DockerRegistryBackend:
       - cloud integration (future)
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[registry-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[docker-missing] docker binary not installed."
+    def _exec(self, cmd, input=None):
+        return run_text(
+            cmd,
+            input=input,
+            error_tag="registry-error",
+            missing="[docker-missing] docker binary not installed."
+        )
 
     # ---- LOGIN ----
     def login(self, registry, username=None, password=None):
@@ -37,14 +35,7 @@ class DockerRegistryBackend:
             cmd += ["-u", username]
         if password:
             # using password-stdin is better for security
-            p = subprocess.Popen(
-                cmd + ["--password-stdin"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            out, err = p.communicate(password.encode())
-            return out.decode("utf-8").strip() or err.decode("utf-8").strip()
+            return self._exec(cmd + ["--password-stdin"], input=password)
         return self._exec(cmd)
 
     # ---- LOGOUT ----
@@ -1,6 +1,7 @@
 # tool-backends/docker/sbom_backend.py
 
-import subprocess
+from agent.core.output import run_output
+from agent.core.process import run_text
 
 
 class DockerSBOMBackend:
@@ -19,14 +20,13 @@ class DockerSBOMBackend:
       syft: https://github.com/anchore/syft
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[sbom-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[syft-missing] syft binary not installed."
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            error_tag="sbom-error",
+            missing="[syft-missing] syft binary not installed."
+        )
 
     # ---- IMAGE SBOM ----
 
@@ -38,7 +38,7 @@ class DockerSBOMBackend:
           syft python:3.10 -o cyclonedx-json
         """
         cmd = ["syft", image, "-o", self._format(fmt)]
-        return self._exec(cmd)
+        return self._exec(cmd, large=True)
 
     # ---- FILESYSTEM SBOM ----
 
@@ -49,7 +49,7 @@ class DockerSBOMBackend:
           syft . -o cyclonedx-json
         """
         cmd = ["syft", path, "-o", self._format(fmt)]
-        return self._exec(cmd)
+        return self._exec(cmd, large=True)
 
     # ---- OUTPUT FORMAT HANDLER ----
 
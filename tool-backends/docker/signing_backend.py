@@ -1,6 +1,6 @@
 # tool-backends/docker/signing_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class DockerSigningBackend:
@@ -21,14 +21,13 @@ class DockerSigningBackend:
       - SBOM: synergy with syft backend
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[signing-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[cosign-missing] cosign binary not installed."
+    def _exec(self, cmd, input=None):
+        return run_text(
+            cmd,
+            input=input,
+            error_tag="signing-error",
+            missing="[cosign-missing] cosign binary not installed."
+        )
 
     # ---- IMAGE SIGN (KEYLESS) ----
     def sign(self, image):
@@ -51,14 +50,7 @@ class DockerSigningBackend:
         cmd = ["cosign", "sign", "--key", key, image]
 
         if password:
-            p = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            out, err = p.communicate(password.encode())
-            return out.decode("utf-8").strip() or err.decode("utf-8").strip()
+            return self._exec(cmd, input=password)
 
         return self._exec(cmd)
 
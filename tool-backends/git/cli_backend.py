@@ -1,6 +1,6 @@
 # tool-backend/git/cli_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class GitCLIBackend:
@@ -9,10 +9,9 @@ class GitCLIBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode().strip()
-        except subprocess.CalledProcessError as e:
-            return f"[git-error] {e.output.decode().strip()}"
-        except FileNotFoundError:
-            return "[git-missing] git not installed."
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="git-error",
+            missing="[git-missing] git not installed."
+        )
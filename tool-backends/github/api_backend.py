@@ -1,6 +1,6 @@
 # tool-backend/github/api_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 import os
 
 
@@ -13,6 +13,7 @@ class GitHubAPIBackend:
     def __init__(self, token=None):
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
+        self.http = get_http_client()
 
         if not self.token:
             raise ValueError("GitHub token not provided or missing in env (GITHUB_TOKEN).")
@@ -24,13 +25,17 @@ class GitHubAPIBackend:
         }
 
     def get(self, endpoint):
-        r = requests.get(f"{self.base_url}/{endpoint}", headers=self._headers())
+        r = self.http.get(f"{self.base_url}/{endpoint}", headers=self._headers())
         return r.json()
 
     def post(self, endpoint, data):
-        r = requests.post(f"{self.base_url}/{endpoint}", headers=self._headers(), json=data)
+        r = self.http.post(f"{self.base_url}/{endpoint}", headers=self._headers(), json=data)
         return r.json()
 
     def patch(self, endpoint, data):
-        r = requests.patch(f"{self.base_url}/{endpoint}", headers=self._headers(), json=data)
+        r = self.http.patch(f"{self.base_url}/{endpoint}", headers=self._headers(), json=data)
+        return r.json()
+
+    def put(self, endpoint, data=None):
+        r = self.http.put(f"{self.base_url}/{endpoint}", headers=self._headers(), json=data or {})
         return r.json()
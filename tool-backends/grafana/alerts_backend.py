@@ -1,6 +1,6 @@
 # tool-backend/grafana/alerts_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 
 
 class GrafanaAlertsBackend:
@@ -11,6 +11,7 @@ class GrafanaAlertsBackend:
     def __init__(self, url, token):
         self.url = url.rstrip("/")
         self.token = token
+        self.http = get_http_client()
 
     def _headers(self):
         return {
@@ -18,5 +19,5 @@ class GrafanaAlertsBackend:
         }
 
     def list(self):
-        r = requests.get(f"{self.url}/api/alerts", headers=self._headers())
+        r = self.http.get(f"{self.url}/api/alerts", headers=self._headers())
         return r.json()
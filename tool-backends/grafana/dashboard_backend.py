@@ -1,6 +1,6 @@
 # tool-backend/grafana/dashboard_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 import json
 
 
@@ -12,6 +12,7 @@ class GrafanaDashboardBackend:
     def __init__(self, url, token):
         self.url = url.rstrip("/")
         self.token = token
+        self.http = get_http_client()
 
     def _headers(self):
         return {
@@ -20,15 +21,15 @@ class GrafanaDashboardBackend:
         }
 
     def list(self):
-        r = requests.get(f"{self.url}/api/search", headers=self._headers())
+        r = self.http.get(f"{self.url}/api/search", headers=self._headers())
         return r.json()
 
     def get(self, uid):
-        r = requests.get(f"{self.url}/api/dashboards/uid/{uid}", headers=self._headers())
+        r = self.http.get(f"{self.url}/api/dashboards/uid/{uid}", headers=self._headers())
         return r.json()
 
     def import_dashboard(self, payload):
-        r = requests.post(
+        r = self.http.post(
             f"{self.url}/api/dashboards/db",
             headers=self._headers(),
             data=json.dumps(payload)
@@ -1,6 +1,6 @@
 # tool-backend/grafana/datasource_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 import json
 
 
@@ -12,6 +12,7 @@ class GrafanaDatasourceBackend:
     def __init__(self, url, token):
         self.url = url.rstrip("/")
         self.token = token
+        self.http = get_http_client()
 
     def _headers(self):
         return {
@@ -20,5 +21,5 @@ class GrafanaDatasourceBackend:
         }
 
     def list(self):
-        r = requests.get(f"{self.url}/api/datasources", headers=self._headers())
+        r = self.http.get(f"{self.url}/api/datasources", headers=self._headers())
         return r.json()
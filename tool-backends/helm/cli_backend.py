@@ -1,6 +1,9 @@
 # tool-backends/helm/cli_backend.py
 
-import subprocess
+from agent.core.cache import invalidates
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools.records import output_mode, releases
 
 
 class HelmCLIBackend:
@@ -16,15 +19,15 @@ class HelmCLIBackend:
       - get values + manifests
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[helm-missing] helm binary not installed."
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            error_tag="helm-error",
+            missing="[helm-missing] helm binary not installed."
+        )
 
+    @invalidates("helm", "kubectl")
     def install(self, release, chart, namespace=None, values=None):
         cmd = ["helm", "install", release, chart]
         if namespace:
@@ -34,6 +37,7 @@ class HelmCLIBackend:
                 cmd += ["-f", file]
         return self._exec(cmd)
 
+    @invalidates("helm", "kubectl")
     def upgrade(self, release, chart, namespace=None, values=None):
         cmd = ["helm", "upgrade", release, chart]
         if namespace:
@@ -43,6 +47,7 @@ class HelmCLIBackend:
                 cmd += ["-f", file]
         return self._exec(cmd)
 
+    @invalidates("helm", "kubectl")
     def rollback(self, release, revision=None, namespace=None):
         cmd = ["helm", "rollback", release]
         if revision:
@@ -51,6 +56,7 @@ class HelmCLIBackend:
             cmd += ["-n", namespace]
         return self._exec(cmd)
 
+    @invalidates("helm", "kubectl")
     def uninstall(self, release, namespace=None):
         cmd = ["helm", "uninstall", release]
         if namespace:
@@ -61,6 +67,8 @@ class HelmCLIBackend:
         cmd = ["helm", "list", "--all"]
         if namespace:
             cmd += ["-n", namespace]
+        if output_mode() == "structured":
+            return releases(self._exec(cmd + ["-o", "json"], large=True))
         return self._exec(cmd)
 
     def get_values(self, release, namespace=None):
@@ -73,4 +81,4 @@ class HelmCLIBackend:
         cmd = ["helm", "get", "manifest", release]
         if namespace:
             cmd += ["-n", namespace]
-        return self._exec(cmd)
+        return self._exec(cmd, large=True)
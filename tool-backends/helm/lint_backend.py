@@ -1,6 +1,6 @@
 # tool-backends/helm/lint_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class HelmLintBackend:
@@ -13,11 +13,11 @@ class HelmLintBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-lint-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="helm-lint-error",
+            missing="[helm-missing] helm binary not installed."
+        )
 
     def lint(self, chart):
         return self._exec(["helm", "lint", chart])
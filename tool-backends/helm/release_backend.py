@@ -1,6 +1,6 @@
 # tool-backends/helm/release_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class HelmReleaseBackend:
@@ -12,11 +12,11 @@ class HelmReleaseBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-release-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="helm-release-error",
+            missing="[helm-missing] helm binary not installed."
+        )
 
     def history(self, release, namespace=None):
         cmd = ["helm", "history", release]
@@ -1,6 +1,6 @@
 # tool-backends/helm/repo_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class HelmRepoBackend:
@@ -13,11 +13,11 @@ class HelmRepoBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-repo-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="helm-repo-error",
+            missing="[helm-missing] helm binary not installed."
+        )
 
     def add(self, name, url):
         return self._exec(["helm", "repo", "add", name, url])
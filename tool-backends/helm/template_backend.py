@@ -1,6 +1,6 @@
 # tool-backends/helm/template_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class HelmTemplateBackend:
@@ -14,11 +14,11 @@ class HelmTemplateBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[helm-template-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="helm-template-error",
+            missing="[helm-missing] helm binary not installed."
+        )
 
     def template(self, chart, namespace=None, values=None, set_vars=None):
         cmd = ["helm", "template", chart]
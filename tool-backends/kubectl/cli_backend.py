@@ -1,6 +1,12 @@
 # tool-backends/kubectl/cli_backend.py
 
-import subprocess
+import os
+
+from agent.core.cache import invalidates, is_error_result
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools.records import KUBECTL_PARSERS, output_mode
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlCLIBackend:
@@ -18,23 +24,32 @@ class KubectlCLIBackend:
       - namespaces
       - contexts
 
+    Every command carries --context for the backend's context, so
+    several backends (one per cluster) can run side by side without
+    touching the current-context in kubeconfig.
+
     Higher-level tools (KubernetesTool) call into this backend.
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[kubectl-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-missing] kubectl not installed."
+    def __init__(self, context=None):
+        # kube context every command is pinned to (KUBE_CONTEXT by default)
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            with_context(cmd, self.context),
+            error_tag="kubectl-error",
+            missing="[kubectl-missing] kubectl not installed."
+        )
 
     # ---- APPLY ----
+    @invalidates("kubectl")
     def apply(self, manifest):
         return self._exec(["kubectl", "apply", "-f", manifest])
 
     # ---- DELETE ----
+    @invalidates("kubectl")
     def delete(self, manifest):
         return self._exec(["kubectl", "delete", "-f", manifest])
 
@@ -43,6 +58,9 @@ class KubectlCLIBackend:
         cmd = ["kubectl", "get", resource]
         if namespace:
             cmd += ["-n", namespace]
+        parse = KUBECTL_PARSERS.get(resource) if output_mode() == "structured" else None
+        if parse:
+            return parse(self._exec(cmd + ["-o", "json"], large=True), "kubectl-error")
         cmd += ["-o", "wide"]
         return self._exec(cmd)
 
@@ -73,6 +91,7 @@ class KubectlCLIBackend:
         return self._exec(cmd)
 
     # ---- ROLLOUT (UNDO/STATUS) ----
+    @invalidates("kubectl")
     def rollout(self, action, deployment, namespace=None):
         cmd = ["kubectl", "rollout", action, deployment]
         if namespace:
@@ -80,6 +99,7 @@ class KubectlCLIBackend:
         return self._exec(cmd)
 
     # ---- SCALE ----
+    @invalidates("kubectl")
     def scale(self, deployment, replicas, namespace=None):
         cmd = [
             "kubectl", "scale",
@@ -99,4 +119,13 @@ class KubectlCLIBackend:
         return self._exec(["kubectl", "config", "get-contexts"])
 
     def use_context(self, ctx):
-        return self._exec(["kubectl", "config", "use-context", ctx])
+        """
+        Binds this backend to ctx. Unlike `kubectl config use-context`,
+        the shared kubeconfig is not rewritten, so other users and
+        concurrent queries keep their own cluster.
+        """
+        out = self._exec(["kubectl", "config", "get-contexts", ctx, "-o", "name"])
+        if is_error_result(out):
+            return out
+        self.context = ctx
+        return f'Using context "{ctx}" for this backend.'
@@ -1,6 +1,9 @@
 # tool-backends/kubectl/exec_backend.py
 
-import subprocess
+import os
+
+from agent.core.process import run_text
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlExecBackend:
@@ -14,14 +17,16 @@ class KubectlExecBackend:
       - test connectivity
     """
 
+    def __init__(self, context=None):
+        # kube context every command is pinned to (KUBE_CONTEXT by default)
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[exec-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-missing]"
+        return run_text(
+            with_context(cmd, self.context),
+            error_tag="exec-error",
+            missing="[kubectl-missing]"
+        )
 
     def exec(self, pod, command, namespace=None):
         if isinstance(command, str):
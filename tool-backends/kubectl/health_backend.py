@@ -1,6 +1,10 @@
 # tool-backends/kubectl/health_backend.py
 
-import subprocess
+import os
+
+from agent.core.process import run_text
+from agent.tools.kubernetes_api_backend import default_namespace
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlHealthBackend:
@@ -13,22 +17,38 @@ class KubectlHealthBackend:
       - restart counts (future)
       - events (future)
       - condition checks (future)
+
+    Optional cache (KubernetesWatchCache): nodes / pods are served from
+    the informer store while it is fresh instead of re-listing.
     """
 
+    def __init__(self, cache=None, context=None):
+        self.cache = cache
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[health-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-missing]"
+        return run_text(
+            with_context(cmd, self.context),
+            error_tag="health-error",
+            missing="[kubectl-missing]"
+        )
 
     def nodes(self):
+        if self.cache:
+            items = self.cache.list("nodes")
+            if items is not None:
+                return items
         return self._exec(["kubectl", "get", "nodes", "-o", "wide"])
 
-    def pods(self, namespace=None):
+    def pods(self, namespace=None, all_namespaces=False):
+        if self.cache:
+            ns = None if all_namespaces else namespace or default_namespace(self.context)
+            items = self.cache.list("pods", ns)
+            if items is not None:
+                return items
         cmd = ["kubectl", "get", "pods", "-o", "wide"]
-        if namespace:
+        if all_namespaces:
+            cmd += ["-A"]
+        elif namespace:
             cmd += ["-n", namespace]
         return self._exec(cmd)
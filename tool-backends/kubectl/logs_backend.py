@@ -1,6 +1,10 @@
 # tool-backends/kubectl/logs_backend.py
 
-import subprocess
+import os
+
+from agent.core.logstream import parse
+from agent.core.process import get_runner, run_text
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlLogsBackend:
@@ -12,18 +16,57 @@ class KubectlLogsBackend:
       - container logs
       - namespace logs
       - previous logs (for CrashLoop)
+      - streaming (generator of parsed LogRecords)
     """
 
+    def __init__(self, context=None):
+        # kube context every command is pinned to (KUBE_CONTEXT by default)
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
     def _exec(self, cmd):
+        return run_text(
+            with_context(cmd, self.context),
+            error_tag="logs-error",
+            missing="[kubectl-missing]"
+        )
+
+    def logs(self, pod, container=None, namespace=None, tail=None, previous=False):
+        cmd = self._logs_cmd(pod, container, namespace, tail, previous)
+        return self._exec(cmd)
+
+    def stream(self, pod, container=None, namespace=None, tail=None, previous=False,
+               follow=False, since=None):
+        """
+        Streams `kubectl logs` line by line instead of buffering it.
+
+        Returns a generator of LogRecord (agent.core.logstream), or an
+        error string if kubectl is missing. kubectl starts on the first
+        record pulled, so an unread generator leaves no process behind;
+        kubectl blocks on a full pipe while the consumer is not reading,
+        and closing the generator kills it.
+        """
+        cmd = self._logs_cmd(pod, container, namespace, tail, previous)
+        cmd.append("--timestamps")
+        if follow:
+            cmd.append("--follow")
+        if since:
+            cmd += ["--since", since]
+
         try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[logs-error] {e.output.decode('utf-8').strip()}"
+            lines = get_runner().stream(with_context(cmd, self.context))
         except FileNotFoundError:
             return "[kubectl-missing]"
 
-    def logs(self, pod, container=None, namespace=None, tail=None, previous=False):
+        labels = {"pod": pod, "container": container, "namespace": namespace}
+        return self._records(lines, labels)
+
+    def _records(self, lines, labels):
+        try:
+            yield from parse(lines, labels)
+        finally:
+            lines.close()
+
+    def _logs_cmd(self, pod, container, namespace, tail, previous):
         cmd = ["kubectl", "logs", pod]
 
         if container:
@@ -38,4 +81,4 @@ class KubectlLogsBackend:
         if previous:
             cmd.append("--previous")
 
-        return self._exec(cmd)
+        return cmd
@@ -1,6 +1,12 @@
 # tool-backends/kubectl/resource_backend.py
 
-import subprocess
+import os
+
+from agent.core.cache import invalidates
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools.records import KUBECTL_PARSERS, output_mode
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlResourceBackend:
@@ -13,19 +19,25 @@ class KubectlResourceBackend:
       - delete
     """
 
-    def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[resource-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-missing]"
+    def __init__(self, context=None):
+        # kube context every command is pinned to (KUBE_CONTEXT by default)
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
+    def _exec(self, cmd, large=False):
+        run = run_output if large else run_text
+        return run(
+            with_context(cmd, self.context),
+            error_tag="resource-error",
+            missing="[kubectl-missing]"
+        )
 
     def get(self, resource, namespace=None, wide=True):
         cmd = ["kubectl", "get", resource]
         if namespace:
             cmd += ["-n", namespace]
+        parse = KUBECTL_PARSERS.get(resource) if output_mode() == "structured" else None
+        if parse:
+            return parse(self._exec(cmd + ["-o", "json"], large=True), "resource-error")
         if wide:
             cmd += ["-o", "wide"]
         return self._exec(cmd)
@@ -36,6 +48,7 @@ class KubectlResourceBackend:
             cmd += ["-n", namespace]
         return self._exec(cmd)
 
+    @invalidates("kubectl")
     def delete(self, resource, name, namespace=None):
         cmd = ["kubectl", "delete", resource, name]
         if namespace:
@@ -1,6 +1,10 @@
 # tool-backends/kubectl/rollout_backend.py
 
-import subprocess
+import os
+
+from agent.core.cache import cached, invalidates
+from agent.core.process import run_text
+from agent.tools.kubernetes_tool import with_context
 
 
 class KubectlRolloutBackend:
@@ -11,14 +15,16 @@ class KubectlRolloutBackend:
       - undo (rollback)
     """
 
+    def __init__(self, context=None):
+        # kube context every command is pinned to (KUBE_CONTEXT by default)
+        self.context = context or os.getenv("KUBE_CONTEXT") or None
+
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[rollout-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[kubectl-missing]"
+        return run_text(
+            with_context(cmd, self.context),
+            error_tag="rollout-error",
+            missing="[kubectl-missing]"
+        )
 
     def status(self, deployment, namespace=None):
         cmd = ["kubectl", "rollout", "status", f"deployment/{deployment}"]
@@ -26,12 +32,14 @@ class KubectlRolloutBackend:
             cmd += ["-n", namespace]
         return self._exec(cmd)
 
+    @invalidates("kubectl")
     def undo(self, deployment, namespace=None):
         cmd = ["kubectl", "rollout", "undo", f"deployment/{deployment}"]
         if namespace:
             cmd += ["-n", namespace]
         return self._exec(cmd)
 
+    @cached("kubectl.rollout", ttl=60)
     def history(self, deployment, namespace=None):
         cmd = ["kubectl", "rollout", "history", f"deployment/{deployment}"]
         if namespace:
@@ -1,6 +1,6 @@
 # tool-backend/prometheus/alert_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 
 
 class PrometheusAlertBackend:
@@ -10,11 +10,12 @@ class PrometheusAlertBackend:
 
     def __init__(self, alert_url):
         self.url = alert_url.rstrip("/")
+        self.http = get_http_client()
 
     def alerts(self):
-        r = requests.get(f"{self.url}/api/v2/alerts")
+        r = self.http.get(f"{self.url}/api/v2/alerts")
         return r.json()
 
     def silences(self):
-        r = requests.get(f"{self.url}/api/v2/silences")
+        r = self.http.get(f"{self.url}/api/v2/silences")
         return r.json()
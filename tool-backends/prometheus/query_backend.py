@@ -1,6 +1,6 @@
 # tool-backend/prometheus/query_backend.py
 
-import requests
+from agent.core.http_pool import get_http_client
 
 
 class PrometheusQueryBackend:
@@ -10,13 +10,14 @@ class PrometheusQueryBackend:
 
     def __init__(self, url):
         self.url = url.rstrip("/")
+        self.http = get_http_client()
 
     def query(self, expr):
-        r = requests.get(f"{self.url}/api/v1/query", params={"query": expr})
+        r = self.http.get(f"{self.url}/api/v1/query", params={"query": expr})
         return r.json()
 
     def query_range(self, expr, start, end, step="30s"):
-        r = requests.get(
+        r = self.http.get(
             f"{self.url}/api/v1/query_range",
             params={
                 "query": expr,
@@ -1,7 +1,6 @@
 # tool-backends/terraform/cli_backend.py
 
-import subprocess
-import os
+from agent.core.process import run_text
 
 
 class TerraformCLIBackend:
@@ -18,13 +17,12 @@ class TerraformCLIBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[terraform-missing] terraform binary not installed."
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-error",
+            missing="[terraform-missing] terraform binary not installed."
+        )
 
     def init(self, path="."):
         return self._exec(["terraform", "init"], cwd=path)
@@ -1,6 +1,6 @@
 # tool-backends/terraform/cost_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class TerraformCostBackend:
@@ -11,13 +11,12 @@ class TerraformCostBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=path, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-cost-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[infracost-missing] infracost not installed."
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-cost-error",
+            missing="[infracost-missing] infracost not installed."
+        )
 
     def estimate(self, path="."):
         return self._exec(["infracost", "breakdown", "--path", path])
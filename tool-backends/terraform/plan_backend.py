@@ -1,6 +1,8 @@
 # tool-backends/terraform/plan_backend.py
 
-import subprocess
+from agent.core.output import run_output
+from agent.core.process import run_text
+from agent.tools.records import output_mode, plan_changes
 
 
 class TerraformPlanBackend:
@@ -11,21 +13,25 @@ class TerraformPlanBackend:
       - diff visualization
     """
 
-    def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-plan-error] {e.output.decode('utf-8').strip()}"
+    def _exec(self, cmd, cwd=None, large=False):
+        run = run_output if large else run_text
+        return run(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-plan-error",
+            missing="[terraform-missing] terraform binary not installed."
+        )
 
     def plan(self, path=".", out_file=None):
         cmd = ["terraform", "plan"]
         if out_file:
             cmd += ["-out", out_file]
+        if output_mode() == "structured":
+            return plan_changes(self._exec(cmd + ["-json"], cwd=path, large=True), "terraform-plan-error")
         return self._exec(cmd, cwd=path)
 
     def show(self, path=".", plan_file=None):
         cmd = ["terraform", "show"]
         if plan_file:
             cmd.append(plan_file)
-        return self._exec(cmd, cwd=path)
+        return self._exec(cmd, cwd=path, large=True)
@@ -1,6 +1,6 @@
 # tool-backends/terraform/state_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class TerraformStateBackend:
@@ -13,11 +13,12 @@ class TerraformStateBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-state-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-state-error",
+            missing="[terraform-missing] terraform binary not installed."
+        )
 
     def list(self, path="."):
         return self._exec(["terraform", "state", "list"], cwd=path)
@@ -1,6 +1,6 @@
 # tool-backends/terraform/validate_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class TerraformValidateBackend:
@@ -12,11 +12,12 @@ class TerraformValidateBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-validate-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-validate-error",
+            missing="[terraform-missing] terraform binary not installed."
+        )
 
     def validate(self, path="."):
         return self._exec(["terraform", "validate"], cwd=path)
@@ -1,6 +1,6 @@
 # tool-backends/terraform/workspace_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class TerraformWorkspaceBackend:
@@ -13,11 +13,12 @@ class TerraformWorkspaceBackend:
     """
 
     def _exec(self, cmd, cwd=None):
-        try:
-            out = subprocess.check_output(cmd, cwd=cwd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[terraform-workspace-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            cwd=cwd,
+            error_tag="terraform-workspace-error",
+            missing="[terraform-missing] terraform binary not installed."
+        )
 
     def list(self, path="."):
         return self._exec(["terraform", "workspace", "list"], cwd=path)
@@ -1,6 +1,6 @@
 # tool-backends/vault/auth_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultAuthBackend:
@@ -13,11 +13,11 @@ class VaultAuthBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[vault-auth-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="vault-auth-error",
+            missing="[vault-missing] vault binary not installed."
+        )
 
     def approle_login(self, role_id, secret_id):
         return self._exec([
@@ -1,6 +1,6 @@
 # tool-backends/vault/cli_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultCLIBackend:
@@ -11,13 +11,11 @@ class VaultCLIBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[vault-error] {e.output.decode('utf-8').strip()}"
-        except FileNotFoundError:
-            return "[vault-missing] vault binary not installed."
+        return run_text(
+            cmd,
+            error_tag="vault-error",
+            missing="[vault-missing] vault binary not installed."
+        )
 
     def status(self):
         return self._exec(["vault", "status"])
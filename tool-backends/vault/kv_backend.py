@@ -1,6 +1,6 @@
 # tool-backends/vault/kv_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultKVBackend:
@@ -9,11 +9,11 @@ class VaultKVBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8").strip()
-        except subprocess.CalledProcessError as e:
-            return f"[vault-kv-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="vault-kv-error",
+            missing="[vault-missing] vault binary not installed."
+        )
 
     def read(self, path):
         return self._exec(["vault", "kv", "get", path])
@@ -1,6 +1,6 @@
 # tool-backends/vault/lease_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultLeaseBackend:
@@ -9,11 +9,12 @@ class VaultLeaseBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8")
-        except subprocess.CalledProcessError as e:
-            return f"[vault-lease-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="vault-lease-error",
+            missing="[vault-missing] vault binary not installed.",
+            strip=False
+        )
 
     def renew(self, lease_id):
         return self._exec(["vault", "lease", "renew", lease_id])
@@ -1,6 +1,6 @@
 # tool-backends/vault/pki_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultPKIBackend:
@@ -9,11 +9,12 @@ class VaultPKIBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8")
-        except subprocess.CalledProcessError as e:
-            return f"[vault-pki-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="vault-pki-error",
+            missing="[vault-missing] vault binary not installed.",
+            strip=False
+        )
 
     def issue_cert(self, role, common_name):
         return self._exec([
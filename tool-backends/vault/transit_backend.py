@@ -1,6 +1,6 @@
 # tool-backends/vault/transit_backend.py
 
-import subprocess
+from agent.core.process import run_text
 
 
 class VaultTransitBackend:
@@ -9,11 +9,12 @@ class VaultTransitBackend:
     """
 
     def _exec(self, cmd):
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return out.decode("utf-8")
-        except subprocess.CalledProcessError as e:
-            return f"[vault-transit-error] {e.output.decode('utf-8').strip()}"
+        return run_text(
+            cmd,
+            error_tag="vault-transit-error",
+            missing="[vault-missing] vault binary not installed.",
+            strip=False
+        )
 
     def encrypt(self, key, plaintext):
         return self._exec([
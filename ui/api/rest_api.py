@@ -0,0 +1,96 @@
+# ui/api/rest_api.py
+#
+# REST API for the DevOps agent.
+#
+# One process serves many concurrent operator queries: every request is
+# awaited on the async Router path, so a slow kubectl / Prometheus call only
+# blocks its own request.
+#
+# Run:
+#   uvicorn ui.api.rest_api:app --host 0.0.0.0 --port 8080
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+
+from agent.core.cache import get_response_cache
+from agent.core.container import get_container
+from agent.core.metrics import CONTENT_TYPE, get_metrics
+from agent.core.planner import get_plan_cache
+from agent.core.process import get_runner
+from agent.core.router import Router
+from agent.core.tracing import get_tracer
+from agent.llm.hybrid_router import HybridLLM
+from agent.llm.streaming import TokenStream
+
+
+app = FastAPI(title="Simple DevOps Agent API")
+model = HybridLLM()
+router = Router(model=model)
+stream_router = Router(model=model, stream=True)
+
+
+class QueryRequest(BaseModel):
+    query: str
+
+
+@app.post("/query")
+async def query(req: QueryRequest):
+    result = await router.process_async(req.query)
+    return {"query": req.query, "result": result}
+
+
+@app.post("/query/stream")
+async def query_stream(req: QueryRequest):
+    """
+    Same as /query, but the LLM summary is sent as plain-text chunks
+    while it is generated.
+    """
+    result = await stream_router.process_async(req.query)
+    if not isinstance(result, TokenStream):
+        result = TokenStream.of(str(result))
+    return StreamingResponse(iter(result), media_type="text/plain")
+
+
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Prometheus scrape endpoint.
+    """
+    return Response(get_metrics().render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return get_response_cache().stats()
+
+
+@app.get("/tools/stats")
+async def tool_stats():
+    return get_container().stats()
+
+
+@app.get("/planner/stats")
+async def planner_stats():
+    return get_plan_cache().stats()
+
+
+@app.get("/process/stats")
+async def process_stats():
+    return get_runner().stats()
+
+
+@app.get("/traces/summary")
+async def trace_summary(kind: str = None):
+    return get_tracer().summary(kind)
+
+
+@app.get("/traces/last")
+async def last_trace():
+    trace = get_tracer().last_trace()
+    return trace.as_dict() if trace else {}